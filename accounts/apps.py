@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
+
+    def ready(self):
+        # 토큰 인증 / 부부 캐시 무효화 시그널 등록
+        from . import authentication, couples
+        # OpenAPI 스키마 파일 확인(system check) 등록
+        from hahahoho import openapi
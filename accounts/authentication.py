@@ -0,0 +1,129 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+
+def token_cache_key(key):
+    return f'auth-token:{key}'
+
+
+def user_token_cache_key(user_id):
+    return f'auth-token-user:{user_id}'
+
+
+class LocalTokenCache:
+    # 프로세스 내부 LRU / 다른 프로세스의 무효화는 전달되지 않으므로 TTL을 짧게 유지
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        options = settings.TOKEN_AUTH_CACHE
+        with self.lock:
+            self.entries[key] = (time.monotonic() + options['LOCAL_TTL'], value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > options['MAX_SIZE']:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def delete_user(self, user_id):
+        with self.lock:
+            for key in [key for key, (_, (user, _)) in self.entries.items() if user.pk == user_id]:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    # 프로세스 LRU -> Django 캐시(공유 캐시일 때만) -> DB 순으로 토큰을 찾아 인증 쿼리를 생략
+    local_cache = LocalTokenCache()
+    counters = {'local_hits': 0, 'cache_hits': 0, 'misses': 0}
+    counters_lock = threading.Lock()
+
+    @classmethod
+    def count(cls, name):
+        with cls.counters_lock:
+            cls.counters[name] += 1
+
+    @classmethod
+    def stats(cls):
+        with cls.counters_lock:
+            return dict(cls.counters)
+
+    def authenticate_credentials(self, key):
+        credentials = self.local_cache.get(key)
+        if credentials is not None:
+            self.count('local_hits')
+            return credentials
+
+        # CACHE_TTL이 0이면 (공유 캐시가 아니면) Django 캐시를 건너뜀
+        timeout = settings.TOKEN_AUTH_CACHE['CACHE_TTL']
+        credentials = cache.get(token_cache_key(key)) if timeout else None
+        if credentials is not None:
+            self.count('cache_hits')
+            self.local_cache.set(key, credentials)
+            return credentials
+
+        self.count('misses')
+        try:
+            token = Token.objects.select_related('user').get(key=key)
+        except Token.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        credentials = (token.user, token)
+        if timeout:
+            cache.set(token_cache_key(key), credentials, timeout)
+            cache.set(user_token_cache_key(token.user_id), key, timeout)
+        self.local_cache.set(key, credentials)
+        return credentials
+
+
+def evict_token(key, user_id):
+    CachedTokenAuthentication.local_cache.delete(key)
+    cache.delete_many([token_cache_key(key), user_token_cache_key(user_id)])
+
+
+@receiver(post_delete, sender=Token)
+def evict_deleted_token(sender, instance, **kwargs):
+    evict_token(instance.key, instance.user_id)
+
+
+@receiver(post_save, sender=get_user_model())
+def evict_changed_user(sender, instance, created, **kwargs):
+    # 비활성화 등 회원 정보가 바뀌면 캐시된 회원 객체를 버림
+    if created:
+        return
+    CachedTokenAuthentication.local_cache.delete_user(instance.pk)
+    key = cache.get(user_token_cache_key(instance.pk))
+    if key is not None:
+        evict_token(key, instance.pk)
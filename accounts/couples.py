@@ -0,0 +1,113 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Couple
+
+
+# 회원 정보 중 캐시된 부부 객체를 무효화하지 않아도 되는 필드 (로그인할 때마다 갱신)
+UNCACHED_MEMBER_FIELDS = frozenset({'last_login'})
+
+
+class CoupleResolver:
+    # 회원 ID -> (부부, 배우자) / 부부 객체(wife, husband 포함)를 Django 캐시에 보관
+    # 부부가 없다는 결과는 캐시하지 않음 (다른 워커에서 등록된 부부를 놓치지 않도록)
+    # COUPLE_CACHE_TIMEOUT이 0이면 (공유 캐시가 아니면) 매번 DB에서 조회
+
+    def cache_key(self, user_id):
+        return f'couple:{user_id}'
+
+    def couple_queryset(self, user_id):
+        return Couple.objects.select_related('wife', 'husband').filter(
+            Q(wife_id=user_id) | Q(husband_id=user_id)
+        )
+
+    def get_couple(self, user_id):
+        timeout = settings.COUPLE_CACHE_TIMEOUT
+        if not timeout:
+            return self.couple_queryset(user_id).first()
+        key = self.cache_key(user_id)
+        couple = cache.get(key)
+        if couple is None:
+            couple = self.couple_queryset(user_id).first()
+            if couple is not None:
+                cache.set(key, couple, timeout)
+        return couple
+
+    async def aget_couple(self, user_id):
+        timeout = settings.COUPLE_CACHE_TIMEOUT
+        if not timeout:
+            return await self.couple_queryset(user_id).afirst()
+        key = self.cache_key(user_id)
+        couple = await cache.aget(key)
+        if couple is None:
+            couple = await self.couple_queryset(user_id).afirst()
+            if couple is not None:
+                await cache.aset(key, couple, timeout)
+        return couple
+
+    def parse_user_id(self, user_id):
+        try:
+            return int(user_id)
+        except (TypeError, ValueError):
+            return None
+
+    def spouse_of(self, couple, user_id):
+        if couple is None:
+            return None, None
+        return couple, couple.husband if couple.wife_id == user_id else couple.wife
+
+    def resolve(self, user_id):
+        user_id = self.parse_user_id(user_id)
+        if user_id is None:
+            return None, None
+        return self.spouse_of(self.get_couple(user_id), user_id)
+
+    async def aresolve(self, user_id):
+        user_id = self.parse_user_id(user_id)
+        if user_id is None:
+            return None, None
+        return self.spouse_of(await self.aget_couple(user_id), user_id)
+
+    def invalidate(self, *user_ids):
+        cache.delete_many([self.cache_key(user_id) for user_id in user_ids])
+
+
+couple_resolver = CoupleResolver()
+
+
+def create_couple(wife, husband):
+    # 두 사람 중 한 명이라도 이미 부부로 등록되어 있으면 None
+    # 캐시는 워커마다 다를 수 있으므로 등록 여부는 DB에서 직접 확인
+    member_ids = [wife.pk, husband.pk]
+    if Couple.objects.filter(Q(wife_id__in=member_ids) | Q(husband_id__in=member_ids)).exists():
+        return None
+    try:
+        with transaction.atomic():
+            return Couple.objects.create(wife=wife, husband=husband)
+    except IntegrityError:
+        # 다른 요청이 동시에 등록한 경우
+        return None
+
+
+@receiver(post_save, sender=Couple)
+@receiver(post_delete, sender=Couple)
+def invalidate_couple(sender, instance, **kwargs):
+    couple_resolver.invalidate(instance.wife_id, instance.husband_id)
+
+
+@receiver(post_save, sender=get_user_model())
+def invalidate_member_couple(sender, instance, created, update_fields=None, **kwargs):
+    # 캐시된 부부 객체에 담긴 회원 정보가 바뀌면 두 사람의 캐시를 모두 버림
+    if created or not settings.COUPLE_CACHE_TIMEOUT:
+        return
+    if update_fields is not None and set(update_fields) <= UNCACHED_MEMBER_FIELDS:
+        return
+    member_ids = Couple.objects.filter(
+        Q(wife_id=instance.pk) | Q(husband_id=instance.pk)
+    ).values_list('wife_id', 'husband_id').first()
+    couple_resolver.invalidate(instance.pk, *(member_ids or ()))
@@ -0,0 +1,104 @@
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Aggregate, F, JSONField, OuterRef, Subquery
+from django.db.models.functions import JSONObject
+from django.utils import timezone
+
+from emotions.models import Emotion
+from infertilitytests.models import Infertility
+
+from .models import StressForecast
+
+INF_TEST_LIMIT = 7
+
+
+class JSONArrayAgg(Aggregate):
+    # SQLite json_group_array / PostgreSQL jsonb_agg (jsonb는 Django가 문자열로 받아 JSONField가 해석)
+    function = 'JSON_GROUP_ARRAY'
+    output_field = JSONField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function='JSONB_AGG', **extra_context)
+
+
+def row_json(model):
+    # 모델의 모든 컬럼을 JSON 객체 하나로
+    return JSONObject(**{field.attname: F(field.attname) for field in model._meta.concrete_fields})
+
+
+def from_row_json(model, data):
+    # JSON으로 받은 값을 필드 타입으로 되돌려 기존 시리얼라이저에 그대로 넘김
+    values = {}
+    for field in model._meta.concrete_fields:
+        value = field.to_python(data.get(field.attname))
+        # SQLite는 UTC 기준 naive 문자열로 돌려줌
+        if settings.USE_TZ and value is not None and field.get_internal_type() == 'DateTimeField' \
+                and timezone.is_naive(value):
+            value = timezone.make_aware(value, dt_timezone.utc)
+        values[field.attname] = value
+    return model(**values)
+
+
+def latest_emotion_json():
+    return Subquery(
+        Emotion.objects.filter(member_id=OuterRef('pk'))
+        .order_by('-created_at', '-id')
+        .values(json=row_json(Emotion))[:1],
+        output_field=JSONField()
+    )
+
+
+def recent_inf_tests_json():
+    recent_ids = Infertility.objects.filter(
+        member_id=OuterRef(OuterRef('pk'))
+    ).order_by('-created_at', '-id').values('pk')[:INF_TEST_LIMIT]
+
+    return Subquery(
+        Infertility.objects.filter(member_id=OuterRef('pk'), pk__in=Subquery(recent_ids))
+        .values('member_id')
+        .annotate(json=JSONArrayAgg(row_json(Infertility)))
+        .values('json'),
+        output_field=JSONField()
+    )
+
+
+def stress_forecast(field):
+    return Subquery(
+        StressForecast.objects.filter(member_id=OuterRef('pk')).values(field)[:1]
+    )
+
+
+def dashboard_queryset(member_ids):
+    # 회원별 최신 감정 기록 / 최근 난임 검사 7개 / 예측값을 SQL 한 번으로 조회
+    return get_user_model().objects.filter(pk__in=member_ids).annotate(
+        latest_emotion=latest_emotion_json(),
+        recent_inf_tests=recent_inf_tests_json(),
+        forecast=stress_forecast('emotion_forecast'),
+        infertility_forecast=stress_forecast('infertility_forecast')
+    ).values('pk', 'latest_emotion', 'recent_inf_tests', 'forecast', 'infertility_forecast')
+
+
+def build_dashboard(rows):
+    dashboard = {}
+    for row in rows:
+        emotion = row['latest_emotion']
+        inf_tests = [from_row_json(Infertility, data) for data in row['recent_inf_tests'] or []]
+        # json_group_array는 순서를 보장하지 않으므로 파이썬에서 최신순 정렬
+        inf_tests.sort(key=lambda test: (test.created_at, test.pk), reverse=True)
+        dashboard[row['pk']] = {
+            'emotion': from_row_json(Emotion, emotion) if emotion else None,
+            'inf_tests': inf_tests,
+            'forecast': row['forecast'],
+            'infertility_forecast': row['infertility_forecast']
+        }
+    return dashboard
+
+
+def get_dashboard_rows(member_ids):
+    return build_dashboard(dashboard_queryset(member_ids))
+
+
+async def aget_dashboard_rows(member_ids):
+    return build_dashboard([row async for row in dashboard_queryset(member_ids)])
@@ -0,0 +1,29 @@
+from django.utils import timezone
+
+from counsels.models import Counsel
+from counsels.serializers import CounselSerializer
+from emotions.models import Emotion, Interest
+from emotions.serializers import EmotionSerializers, InterestSerializers
+from hahahoho.renderers import FastJSONRenderer
+from hahahoho.streaming import serialized_rows
+from infertilitytests.models import Infertility
+from infertilitytests.serializers import InfertilitySerializer
+
+# (type, 모델, 시리얼라이저) / 각 목록 조회 API와 같은 레코드 형식
+EXPORT_SECTIONS = (
+    ('emotions', Emotion, EmotionSerializers),
+    ('interests', Interest, InterestSerializers),
+    ('counsels', Counsel, CounselSerializer),
+    ('infertility_tests', Infertility, InfertilitySerializer),
+)
+
+
+def export_lines(member_ids):
+    # 첫 줄은 내보내기 정보, 이후 한 줄에 레코드 하나 ({"type": ..., "data": {...}})
+    # 섹션마다 회원별 최신순으로 (member_id, -created_at, -id) 인덱스를 따라 읽음
+    renderer = FastJSONRenderer()
+    yield renderer.render({'type': 'couple', 'members': member_ids, 'exported_at': timezone.now()}) + b'\n'
+    for name, model, serializer_class in EXPORT_SECTIONS:
+        queryset = model.objects.filter(member_id__in=member_ids).order_by('member_id', '-created_at', '-id')
+        for data in serialized_rows(queryset, serializer_class):
+            yield renderer.render({'type': name, 'data': data}) + b'\n'
@@ -0,0 +1,101 @@
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+import numpy as np
+from django.db import connections, transaction
+from django.utils import timezone
+
+from emotions.models import Emotion
+from infertilitytests.models import Infertility
+from .models import StressForecast
+
+DEFAULT_ALPHA = 0.5
+DEFAULT_HISTORY = 30
+DEFAULT_LOOKBACK_DAYS = 180
+
+
+def load_series(model, since, history):
+    # 회원별 최근 history개의 total 점수 (오래된 순)
+    series = defaultdict(lambda: deque(maxlen=history))
+    rows = model.objects.filter(created_at__gte=since).order_by('member_id', 'created_at', 'id')
+    for member_id, total in rows.values_list('member_id', 'total').iterator(chunk_size=5000):
+        series[member_id].append(total)
+    return series
+
+
+def series_matrix(member_ids, series, history):
+    # 회원 x 시점 행렬 / 최근 값이 오른쪽 끝에 오도록 정렬하고 빈 칸은 NaN
+    matrix = np.full((len(member_ids), history), np.nan)
+    for row, member_id in enumerate(member_ids):
+        values = series.get(member_id)
+        if values:
+            matrix[row, history - len(values):] = values
+    return matrix
+
+
+def exponential_smoothing(matrix, alpha):
+    # 시점 방향으로만 반복하고 회원 방향은 벡터 연산 / 마지막 level이 다음 값의 예측치
+    level = np.full(matrix.shape[0], np.nan)
+    for column in matrix.T:
+        observed = ~np.isnan(column)
+        initial = observed & np.isnan(level)
+        level[initial] = column[initial]
+        level = np.where(observed, alpha * column + (1 - alpha) * level, level)
+    return level
+
+
+def forecast_chunk(args):
+    # 프로세스 풀에서 실행 / DB에 접근하지 않는 순수 계산
+    emotion_matrix, infertility_matrix, alpha = args
+    return exponential_smoothing(emotion_matrix, alpha), exponential_smoothing(infertility_matrix, alpha)
+
+
+def to_optional_float(value):
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def run_forecasts(alpha=DEFAULT_ALPHA, history=DEFAULT_HISTORY, lookback_days=DEFAULT_LOOKBACK_DAYS,
+                  workers=None, chunk_size=5000):
+    # (저장한 예측 수, 삭제한 예측 수) / 조회 기간에 기록이 없는 회원의 이전 예측은 삭제
+    started = timezone.now()
+    since = started - timedelta(days=lookback_days)
+    emotion_series = load_series(Emotion, since, history)
+    infertility_series = load_series(Infertility, since, history)
+    member_ids = sorted(set(emotion_series) | set(infertility_series))
+
+    chunks = [member_ids[start:start + chunk_size] for start in range(0, len(member_ids), chunk_size)]
+    tasks = [
+        (series_matrix(chunk, emotion_series, history), series_matrix(chunk, infertility_series, history), alpha)
+        for chunk in chunks
+    ]
+
+    if workers == 1:
+        # 프로세스 하나면 현재 프로세스에서 계산
+        results = list(map(forecast_chunk, tasks))
+    else:
+        # fork된 프로세스가 부모의 DB 연결을 공유하지 않도록 먼저 닫음
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(forecast_chunk, tasks))
+
+    forecasts = []
+    for chunk, (emotion_levels, infertility_levels) in zip(chunks, results):
+        for member_id, emotion_level, infertility_level in zip(chunk, emotion_levels, infertility_levels):
+            forecasts.append(StressForecast(
+                member_id_id=member_id,
+                emotion_forecast=to_optional_float(emotion_level),
+                infertility_forecast=to_optional_float(infertility_level)
+            ))
+
+    # 이번 실행에서 갱신되지 않은 (forecasted_at이 실행 시작 전인) 예측은 삭제
+    with transaction.atomic():
+        StressForecast.objects.bulk_create(
+            forecasts,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['member_id'],
+            update_fields=['emotion_forecast', 'infertility_forecast', 'forecasted_at']
+        )
+        removed, _ = StressForecast.objects.filter(forecasted_at__lt=started).delete()
+    return len(forecasts), removed
@@ -0,0 +1,136 @@
+import asyncio
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from hahahoho.benchmark import benchmark_database, seed_couples
+
+# (이름, 동기 경로, async 경로)
+ENDPOINTS = [
+    ('couple_data', '/accounts/couple/data/', '/accounts/couple/data/async/'),
+    ('get_missions', '/emotions/missions/', '/emotions/missions/async/'),
+]
+
+
+class Command(BaseCommand):
+    help = "동기(WSGI) / async(ASGI) 조회 API의 동시 요청 처리량을 비교합니다. (임시 테스트 DB 사용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000, help="엔드포인트 / 방식별 요청 수")
+        parser.add_argument('--concurrency', type=int, default=100, help="동시 요청 수 (WSGI는 스레드 수)")
+        parser.add_argument('--couples', type=int, default=100, help="생성할 부부 수")
+        parser.add_argument('--db-latency', type=float, default=0, help="쿼리마다 추가할 지연 (ms, 원격 DB 왕복 시간 모사)")
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1 or options['concurrency'] < 1 or options['couples'] < 1:
+            raise CommandError("requests, concurrency, couples는 1 이상이어야 합니다.")
+
+        with benchmark_database():
+            tokens = seed_couples(options['couples'], emotions=10, tests=10)
+            with self.db_latency(options['db_latency'] / 1000):
+                self.run(tokens, options['requests'], options['concurrency'])
+
+    @contextmanager
+    def db_latency(self, seconds):
+        # 모든 연결의 쿼리 실행 전에 지연을 넣음 (스레드마다 연결이 따로 생기므로 연결 생성 시에도 적용)
+        if not seconds:
+            yield
+            return
+
+        def wrapper(execute, sql, params, many, context):
+            time.sleep(seconds)
+            return execute(sql, params, many, context)
+
+        def install(sender, connection, **kwargs):
+            connection.execute_wrappers.append(wrapper)
+
+        connection_created.connect(install)
+        try:
+            yield
+        finally:
+            connection_created.disconnect(install)
+
+    def run(self, tokens, request_count, concurrency):
+        wsgi = get_wsgi_application()
+        asgi = get_asgi_application()
+        # 이미 열린 연결에는 지연 wrapper가 없으므로 닫고 다시 연결 (요청이 끝나면 연결도 닫힘)
+        connections.close_all()
+
+        self.stdout.write(f"{'endpoint':<14}{'mode':<6}{'requests':>10}{'seconds':>10}{'req/s':>10}{'errors':>8}")
+        for name, sync_path, async_path in ENDPOINTS:
+            for mode, path in (('wsgi', sync_path), ('asgi', async_path)):
+                requests = [
+                    (path, f'member_id={member_id}', token)
+                    for member_id, token in (tokens[i % len(tokens)] for i in range(request_count))
+                ]
+                if mode == 'wsgi':
+                    seconds, errors = self.run_wsgi(wsgi, requests, concurrency)
+                else:
+                    seconds, errors = asyncio.run(self.run_asgi(asgi, requests, concurrency))
+                self.stdout.write(
+                    f"{name:<14}{mode:<6}{request_count:>10}{seconds:>10.2f}{request_count / seconds:>10.1f}{errors:>8}"
+                )
+
+    def run_wsgi(self, application, requests, concurrency):
+        def call(request):
+            path, query_string, token = request
+            statuses = []
+            environ = {
+                'REQUEST_METHOD': 'GET',
+                'PATH_INFO': path,
+                'QUERY_STRING': query_string,
+                'SERVER_NAME': 'testserver',
+                'SERVER_PORT': '80',
+                'HTTP_AUTHORIZATION': f'Token {token}',
+                'wsgi.input': io.BytesIO(),
+                'wsgi.url_scheme': 'http',
+            }
+            body = b''.join(application(environ, lambda status, headers: statuses.append(status)))
+            return statuses[0].startswith('200') and bool(body)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(call, requests))
+        return time.perf_counter() - started, results.count(False)
+
+    async def run_asgi(self, application, requests, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(request):
+            path, query_string, token = request
+            scope = {
+                'type': 'http',
+                'asgi': {'version': '3.0'},
+                'http_version': '1.1',
+                'method': 'GET',
+                'scheme': 'http',
+                'path': path,
+                'raw_path': path.encode(),
+                'root_path': '',
+                'query_string': query_string.encode(),
+                'headers': [(b'host', b'testserver'), (b'authorization', f'Token {token}'.encode())],
+                'server': ('testserver', 80),
+                'client': ('127.0.0.1', 0),
+            }
+            messages = []
+
+            async def receive():
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+            async def send(message):
+                messages.append(message)
+
+            async with semaphore:
+                await application(scope, receive, send)
+            return messages[0]['status'] == 200
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(call(request) for request in requests))
+        return time.perf_counter() - started, results.count(False)
@@ -0,0 +1,112 @@
+import random
+import time
+from contextlib import contextmanager, nullcontext
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from counsels.models import Counsel
+from hahahoho.benchmark import benchmark_database, latency_summary
+from hahahoho.testutils import create_members
+
+# 상담 요약 생성용 문장 (AI 요약처럼 비슷한 표현이 반복되는 긴 글)
+SENTENCES = [
+    "오늘 상담에서 내담자는 최근 시술 결과를 기다리며 불안감이 커졌다고 이야기했다.",
+    "남편과의 대화가 줄어들면서 서운한 마음이 쌓였고 이를 표현하는 데 어려움을 느꼈다.",
+    "주변의 임신 소식을 들을 때마다 축하하는 마음과 함께 슬픔이 밀려온다고 했다.",
+    "수면 시간이 불규칙해지고 식사를 거르는 날이 늘어 신체적인 피로도 호소했다.",
+    "다음 상담까지 하루 한 번 감정 기록을 작성하고 남편과 산책하는 시간을 갖기로 했다.",
+    "스스로를 탓하는 생각이 들 때 그 생각을 알아차리고 기록해 보는 연습을 제안했다.",
+    "가족 모임에서 받은 질문들이 부담스러웠고 앞으로의 대처 방법을 함께 정리했다.",
+    "치료 과정에 대한 정보가 부족하다고 느껴 병원에 물어볼 질문 목록을 만들었다.",
+]
+
+
+@contextmanager
+def plain_summaries():
+    # 압축 기준 길이를 무한대로 바꿔 원문으로 저장 (압축 전과 비교용)
+    field = Counsel._meta.get_field('summary')
+    min_length = field.min_length
+    field.min_length = float('inf')
+    try:
+        yield
+    finally:
+        field.min_length = min_length
+
+
+def build_summary(rng, length):
+    sentences = []
+    while sum(len(sentence) + 1 for sentence in sentences) < length:
+        sentences.append(rng.choice(SENTENCES))
+    return ' '.join(sentences)
+
+
+def stored_size():
+    # (summary 컬럼 바이트 수, 테이블 전체 크기 / PostgreSQL만)
+    table = connection.ops.quote_name(Counsel._meta.db_table)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f'VACUUM FULL {table}')
+            cursor.execute(f"SELECT SUM(OCTET_LENGTH(summary)), pg_total_relation_size('{Counsel._meta.db_table}') FROM {table}")
+            return cursor.fetchone()
+        cursor.execute(f'SELECT SUM(LENGTH(CAST(summary AS BLOB))) FROM {table}')
+        return cursor.fetchone()[0], None
+
+
+class Command(BaseCommand):
+    help = "상담 요약을 원문 / 압축으로 저장했을 때의 저장 크기와 조회 시간을 비교합니다. (임시 테스트 DB 사용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2000, help="상담 기록 수")
+        parser.add_argument('--length', type=int, default=2000, help="요약 길이 (글자 수)")
+        parser.add_argument('--reads', type=int, default=500, help="상세 조회 횟수")
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        if min(options['rows'], options['length'], options['reads']) < 1:
+            raise CommandError("rows, length, reads는 1 이상이어야 합니다.")
+
+        with benchmark_database():
+            member, = create_members(1)
+            rng = random.Random(options['seed'])
+            summaries = [build_summary(rng, options['length']) for _ in range(options['rows'])]
+
+            self.stdout.write(
+                f"{'mode':<12}{'summary KB':>12}{'table KB':>10}{'detail p50':>12}{'detail p95':>12}{'list ms':>10}"
+            )
+            results = {}
+            for mode in ('plain', 'compressed'):
+                Counsel.objects.all().delete()
+                storage = plain_summaries() if mode == 'plain' else nullcontext()
+                with storage:
+                    Counsel.objects.bulk_create(
+                        [Counsel(member_id=member, summary=summary, tags="#불안", count=1) for summary in summaries],
+                        batch_size=500
+                    )
+                column_bytes, table_bytes = stored_size()
+                detail, list_seconds = self.measure_reads(member, options['reads'], rng)
+                results[mode] = column_bytes
+                self.stdout.write(
+                    f"{mode:<12}{column_bytes / 1024:>12.1f}"
+                    f"{table_bytes / 1024 if table_bytes else float('nan'):>10.1f}"
+                    f"{detail['p50']:>12.3f}{detail['p95']:>12.3f}{list_seconds * 1000:>10.2f}"
+                )
+            self.stdout.write(f"summary 컬럼 크기 {results['compressed'] / results['plain']:.1%}")
+
+    def measure_reads(self, member, reads, rng):
+        # 상세 조회(요약 전문, 압축 해제 포함) 지연 시간 / 목록 조회(미리보기만) 1페이지의 가장 빠른 시간
+        pks = list(Counsel.objects.values_list('id', flat=True))
+        latencies = []
+        for _ in range(reads):
+            started = time.perf_counter()
+            Counsel.objects.get(pk=rng.choice(pks)).summary
+            latencies.append(time.perf_counter() - started)
+
+        list_seconds = None
+        for _ in range(20):
+            started = time.perf_counter()
+            list(Counsel.objects.filter(member_id=member).order_by('-created_at', '-id')
+                 .values_list('id', 'summary_preview', 'tags', 'count', 'created_at')[:100])
+            elapsed = time.perf_counter() - started
+            list_seconds = elapsed if list_seconds is None else min(list_seconds, elapsed)
+        return latency_summary(latencies), list_seconds
@@ -0,0 +1,81 @@
+import json
+from contextlib import nullcontext
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from hahahoho.benchmark import (
+    ENDPOINTS, ClientDriver, ServerDriver, benchmark_database, is_test_database, remove_seeded_members,
+    run_benchmark, seed_couples
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "가상의 부부 데이터를 만들어 주요 조회 API의 지연 시간(p50/p95/p99), 요청당 쿼리 수, "
+        "최대 메모리를 측정하고 JSON 보고서로 저장합니다. (기본: 임시 테스트 DB + 테스트 클라이언트)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--couples', type=int, default=50, help="생성할 부부 수")
+        parser.add_argument('--emotions', type=int, default=100, help="회원별 감정 기록 수")
+        parser.add_argument('--interests', type=int, default=100, help="회원별 관심사 기록 수")
+        parser.add_argument('--counsels', type=int, default=20, help="회원별 상담 기록 수")
+        parser.add_argument('--tests', type=int, default=20, help="회원별 난임 검사 수")
+        parser.add_argument('--days', type=int, default=180, help="기록을 분포시킬 기간 (일)")
+        parser.add_argument('--requests', type=int, default=200, help="엔드포인트별 요청 수")
+        parser.add_argument('--concurrency', type=int, default=8, help="동시 요청 수")
+        parser.add_argument('--memory-samples', type=int, default=20, help="메모리 측정에 사용할 요청 수")
+        parser.add_argument(
+            '--endpoint', action='append', choices=[name for name, _, _ in ENDPOINTS],
+            help="측정할 엔드포인트 (여러 번 지정 가능, 기본값 전체)"
+        )
+        parser.add_argument(
+            '--base-url',
+            help="실행 중인 로컬 서버 주소 (예: http://127.0.0.1:8000) / "
+                 "서버와 같은 DB에 벤치마크 회원을 만들고 끝나면 삭제하므로 테스트 DB에서만 사용"
+        )
+        parser.add_argument(
+            '--allow-non-test-database', action='store_true',
+            help="--base-url 사용 시 테스트 DB(test_ 접두어)가 아닌 DB에도 벤치마크 회원을 만듦"
+        )
+        parser.add_argument('--output', help="보고서를 저장할 파일 (기본값 표준 출력)")
+
+    def handle(self, *args, **options):
+        for name in ('couples', 'requests', 'concurrency', 'days'):
+            if options[name] < 1:
+                raise CommandError(f"{name}는 1 이상이어야 합니다.")
+
+        if options['base_url']:
+            if not is_test_database() and not options['allow_non_test_database']:
+                raise CommandError(
+                    f"{connection.settings_dict['NAME']}은(는) 테스트 DB가 아닙니다. "
+                    "이 DB에 벤치마크 회원을 만들려면 --allow-non-test-database를 지정하세요."
+                )
+            driver = ServerDriver(options['base_url'])
+            database = nullcontext()
+        else:
+            driver = ClientDriver()
+            database = benchmark_database()
+
+        depth = {name: options[name] for name in ('emotions', 'interests', 'counsels', 'tests')}
+        config = {'couples': options['couples'], 'days': options['days'], **depth}
+
+        with database:
+            members = seed_couples(options['couples'], days=options['days'], **depth)
+            try:
+                report = run_benchmark(
+                    driver, members, options['requests'], options['concurrency'],
+                    options['memory_samples'], config, options['endpoint']
+                )
+            finally:
+                if options['base_url']:
+                    remove_seeded_members(members)
+
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                file.write(output + '\n')
+            self.stderr.write(f"보고서를 {options['output']}에 저장했습니다.")
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,67 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from counsels.models import Counsel
+from counsels.serializers import CounselSerializer
+from emotions.models import Emotion, Interest
+from emotions.serializers import EmotionSerializers, InterestSerializers
+from hahahoho.benchmark import benchmark_database, seed_couples
+from hahahoho.fast_serializers import fast_serializer
+from hahahoho.renderers import FastJSONRenderer
+from infertilitytests.models import Infertility
+from infertilitytests.serializers import InfertilitySerializer
+
+TARGETS = [
+    ('emotion', Emotion, EmotionSerializers),
+    ('interest', Interest, InterestSerializers),
+    ('counsel', Counsel, CounselSerializer),
+    ('infertility', Infertility, InfertilitySerializer),
+]
+
+
+class Command(BaseCommand):
+    help = "ModelSerializer + JSONRenderer와 FastSerializer + FastJSONRenderer의 목록 직렬화 시간을 비교합니다. (임시 테스트 DB 사용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help="모델별 행 수")
+        parser.add_argument('--repeat', type=int, default=20, help="반복 횟수 (가장 빠른 값 사용)")
+
+    def handle(self, *args, **options):
+        if options['rows'] < 1 or options['repeat'] < 1:
+            raise CommandError("rows, repeat는 1 이상이어야 합니다.")
+
+        with benchmark_database():
+            # 회원 2명에게 나눠 생성
+            rows = options['rows'] // 2 + 1
+            seed_couples(1, emotions=rows, interests=rows, counsels=rows, tests=rows)
+
+            self.stdout.write(f"{'model':<14}{'rows':>8}{'drf ms':>10}{'fast ms':>10}{'speedup':>10}")
+            for name, model, serializer_class in TARGETS:
+                queryset = model.objects.order_by('-created_at', '-id')[:options['rows']]
+                drf_output, drf_seconds = self.measure(
+                    lambda: JSONRenderer().render(serializer_class(queryset.all(), many=True).data),
+                    options['repeat']
+                )
+                fast_output, fast_seconds = self.measure(
+                    lambda: FastJSONRenderer().render(
+                        fast_serializer(serializer_class).serialize_queryset(queryset.all())
+                    ),
+                    options['repeat']
+                )
+                if drf_output != fast_output:
+                    raise CommandError(f"{name}: 두 방식의 출력이 다릅니다.")
+                self.stdout.write(
+                    f"{name:<14}{queryset.count():>8}{drf_seconds * 1000:>10.2f}{fast_seconds * 1000:>10.2f}"
+                    f"{drf_seconds / fast_seconds:>9.1f}x"
+                )
+
+    def measure(self, func, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            output = func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return output, best
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from hahahoho.openapi import build_schema, write_schema
+
+
+class Command(BaseCommand):
+    help = "OpenAPI(Swagger) 스키마를 생성해 버전별 파일로 저장합니다. (배포 시 한 번 실행)"
+    # 스키마 파일이 오래되었다는 시스템 검사 결과와 관계없이 다시 생성할 수 있도록
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        for path in write_schema(build_schema()):
+            self.stdout.write(self.style.SUCCESS(f"{path} 저장 ({path.stat().st_size} bytes)"))
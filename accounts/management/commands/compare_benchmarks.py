@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from hahahoho.benchmark import compare_reports, load_report
+
+
+class Command(BaseCommand):
+    help = "benchmark_endpoints 보고서 두 개를 비교합니다. (threshold를 넘게 나빠진 지표가 있으면 실패)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('base', help="기준 보고서 (이전 커밋)")
+        parser.add_argument('head', help="비교할 보고서 (현재 커밋)")
+        parser.add_argument('--threshold', type=float, default=None, help="허용할 증가율 (%%)")
+
+    def handle(self, *args, **options):
+        base = load_report(options['base'])
+        head = load_report(options['head'])
+        rows = compare_reports(base, head)
+
+        self.stdout.write(f"{base.get('commit')} -> {head.get('commit')}")
+        self.stdout.write(f"{'endpoint':<26}{'metric':<28}{'base':>10}{'head':>10}{'change':>10}")
+        regressions = []
+        for name, metric, old, new, change in rows:
+            line = f"{name:<26}{metric:<28}{old:>10}{new:>10}{change:>9}%"
+            if options['threshold'] is not None and change > options['threshold']:
+                regressions.append(line)
+                line = self.style.ERROR(line)
+            self.stdout.write(line)
+
+        if regressions:
+            raise CommandError(f"{len(regressions)}개 지표가 {options['threshold']}% 넘게 나빠졌습니다.")
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.forecasting import DEFAULT_ALPHA, DEFAULT_HISTORY, DEFAULT_LOOKBACK_DAYS, run_forecasts
+
+
+class Command(BaseCommand):
+    help = "전체 회원의 다음 스트레스 점수를 지수평활로 예측해 StressForecast에 저장합니다. (매일 밤 cron으로 실행)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--alpha', type=float, default=DEFAULT_ALPHA, help="평활 계수 (0 < alpha <= 1)")
+        parser.add_argument('--history', type=int, default=DEFAULT_HISTORY, help="회원별로 사용할 최근 기록 수")
+        parser.add_argument('--days', type=int, default=DEFAULT_LOOKBACK_DAYS, help="조회할 기간 (일)")
+        parser.add_argument('--workers', type=int, default=None, help="프로세스 수 (기본값 CPU 수, 1이면 현재 프로세스)")
+        parser.add_argument('--chunk-size', type=int, default=5000, help="프로세스 하나가 맡을 회원 수")
+
+    def handle(self, *args, **options):
+        if not 0 < options['alpha'] <= 1:
+            raise CommandError("alpha는 0보다 크고 1 이하여야 합니다.")
+
+        count, removed = run_forecasts(
+            alpha=options['alpha'],
+            history=options['history'],
+            lookback_days=options['days'],
+            workers=options['workers'],
+            chunk_size=options['chunk_size']
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"회원 {count}명의 스트레스 예측을 저장하고, 기록이 없는 회원 {removed}명의 예측을 삭제했습니다."
+        ))
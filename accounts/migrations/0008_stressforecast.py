@@ -0,0 +1,25 @@
+# Generated by Django 4.2.16 on 2026-10-18 07:57
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_alter_user_username'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StressForecast',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('emotion_forecast', models.FloatField(null=True)),
+                ('infertility_forecast', models.FloatField(null=True)),
+                ('forecasted_at', models.DateTimeField(auto_now=True)),
+                ('member_id', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stress_forecast', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
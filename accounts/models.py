@@ -21,4 +21,12 @@ class Couple(models.Model):
         unique_together = ('wife', 'husband')
 
     def __str__(self):
-        return f'{self.wife} & {self.husband}'
\ No newline at end of file
+        return f'{self.wife} & {self.husband}'
+
+
+class StressForecast(models.Model):
+    # 야간 배치(forecast_stress)가 계산해 둔 다음 스트레스 점수 예측값
+    member_id = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='stress_forecast')
+    emotion_forecast = models.FloatField(null=True)
+    infertility_forecast = models.FloatField(null=True)
+    forecasted_at = models.DateTimeField(auto_now=True)
@@ -0,0 +1,135 @@
+# Swagger(drf_yasg) 문서 주석 / 스키마를 만들 때만 import (hahahoho.openapi.load_annotations)
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+
+from . import views
+from .serializers import UserSerializer
+
+
+swagger_auto_schema(
+    method='post',
+    operation_description="회원가입 API",
+    request_body=UserSerializer,
+    responses={
+        201: openapi.Response(
+            description="회원가입 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "memberId": 1,
+                }
+            },
+        ),
+        400: openapi.Response(
+            description="회원가입 실패",
+            examples={
+                "application/json": {
+                    "email": ["This field is required."],
+                    "password": ["This field is required."]
+                }
+            },
+        )
+    }
+)(views.signup)
+
+
+swagger_auto_schema(
+    method='post',
+    operation_description="로그인 API",
+    request_body=openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        properties={
+            'email': openapi.Schema(type=openapi.TYPE_STRING, description="로그인할 회원의 이메일"),
+            'password': openapi.Schema(type=openapi.TYPE_INTEGER, description="로그인할 회원의 비밀번호")
+        },
+        required=['email', 'password']
+    ),
+    responses={201: "로그인 성공", 401: "로그인 실패"}
+)(views.login)
+
+
+swagger_auto_schema(
+    method='post',
+    operation_description="부부 등록 API",
+    request_body=openapi.Schema(
+        type=openapi.TYPE_OBJECT,
+        properties={
+            'spouseEmail': openapi.Schema(type=openapi.TYPE_STRING, description="상대 배우자의 이메일"),
+            'memberId': openapi.Schema(type=openapi.TYPE_INTEGER, description="요청 회원의 ID")
+        },
+        required=['spouseEmail', 'memberId']
+    ),
+    responses={201: "부부 등록 성공", 404: "요청한 사용자 정보가 존재하지 않습니다."}
+)(views.register_couple)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description="부부 조회 API",
+    manual_parameters=[
+        openapi.Parameter('memberId', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description="조회할 회원의 ID")
+    ],
+    responses={200: "조회 성공", 404: "요청한 사용자 정보가 존재하지 않음"}
+)(views.register_couple)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description="커플의 감정 및 관심사 데이터 조회 API",
+    responses={
+        200: openapi.Response(
+            description="커플 데이터 조회 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "my_message": "내일도 화이팅",
+                        "spouse_message": "너도 힘내",
+                        "my_mission": "미션 내용",
+                        "my_mission_completed": True,
+                        "spouse_mission_completed": False,
+                        "my_stress_score": 100,
+                        "my_stress_scores": {
+                            "joy": 70,
+                            "sadness": 10,
+                            "anger": 10,
+                            "fear": 1,
+                            "surprise": 30,
+                            "disgust": 10,
+                        },
+                        "spouse_stress_score": 90,
+                        "spouse_stress_scores": {
+                            "joy": 60,
+                            "sadness": 20,
+                            "anger": 5,
+                            "fear": 2,
+                            "surprise": 25,
+                            "disgust": 5,
+                        },
+                        "my_stress_forecast": 85,  # 예상 점수 추가
+                        "spouse_stress_forecast": 75,  # 예상 점수 추가
+                        "my_infertility_forecast": 62,  # 난임 스트레스 예상 점수
+                        "spouse_infertility_forecast": None,
+                    }
+                }
+            }
+        ),
+        404: openapi.Response(description="커플 데이터가 존재하지 않습니다.")
+    }
+)(views.couple_data)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description="부부 전체 기록 내보내기 API (NDJSON 스트리밍, Accept-Encoding: gzip이면 압축)",
+    responses={
+        200: openapi.Response(
+            description="첫 줄은 내보내기 정보, 이후 한 줄에 기록 하나 (type: emotions / interests / counsels / infertility_tests)",
+            examples={
+                "application/x-ndjson": '{"type":"couple","members":[1,2],"exported_at":"2024-10-27T12:34:56+09:00"}\n'
+                                        '{"type":"emotions","data":{"id":1,"member_id":1,"joy":70}}\n'
+            }
+        ),
+        404: openapi.Response(description="커플 데이터가 존재하지 않습니다.")
+    }
+)(views.couple_export)
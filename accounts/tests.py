@@ -1,3 +1,354 @@
-from django.test import TestCase
+import gzip
+import json
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient
+
+from emotions.models import Emotion
+from emotions.serializers import EmotionSerializers
+from emotions.tests import build_emotion
+from hahahoho.testutils import create_members
+from infertilitytests.models import Infertility
+from infertilitytests.serializers import InfertilitySerializer
+from .authentication import CachedTokenAuthentication, token_cache_key
+from .couples import couple_resolver
+from .forecasting import exponential_smoothing, run_forecasts
+from .models import Couple, StressForecast
+
+INF_TESTS_PER_MEMBER = 10
+# 공유 캐시(Redis 등)를 쓸 때의 부부 캐시 유지 시간
+SHARED_COUPLE_CACHE_TIMEOUT = 60 * 60
+
+
+def build_inf_test(member, score):
+    return Infertility(
+        member_id=member, total=score, social=10, sexual=10,
+        relational=10, refusing=10, essential=10, belifs="괜찮아"
+    )
+
+
+class CoupleDataTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.wife, cls.husband = create_members(2)
+        Couple.objects.create(wife=cls.wife, husband=cls.husband)
+        for member in (cls.wife, cls.husband):
+            Emotion.objects.bulk_create([build_emotion(member) for _ in range(3)])
+            Infertility.objects.bulk_create([
+                build_inf_test(member, score) for score in range(INF_TESTS_PER_MEMBER)
+            ])
+        StressForecast.objects.create(member_id=cls.wife, emotion_forecast=42.5, infertility_forecast=61.25)
+
+    def setUp(self):
+        cache.clear()
+        # 연결당 한 번 실행되는 JSON 지원 여부 확인 쿼리는 미리 실행
+        connection.features.supports_json_field
+        self.client = APIClient()
+        self.client.force_authenticate(self.wife)
+
+    def expected(self, member):
+        emotion = Emotion.objects.filter(member_id=member).order_by('-created_at', '-id').first()
+        inf_tests = Infertility.objects.filter(member_id=member).order_by('-created_at', '-id')[:7]
+        return EmotionSerializers(emotion).data, InfertilitySerializer(inf_tests, many=True).data
+
+    @override_settings(COUPLE_CACHE_TIMEOUT=SHARED_COUPLE_CACHE_TIMEOUT)
+    def test_couple_data_in_two_queries(self):
+        # 부부 조회 1번(캐시 미스) + 대시보드 1번
+        with self.assertNumQueries(2):
+            response = self.client.get('/accounts/couple/data/')
+        self.assertEqual(response.status_code, 200)
+
+        # 부부 정보가 캐시된 뒤에는 대시보드 쿼리 1번
+        with self.assertNumQueries(1):
+            self.client.get('/accounts/couple/data/')
+
+        result = response.json()['result']
+        my_emotion, my_inf_tests = self.expected(self.wife)
+        spouse_emotion, spouse_inf_tests = self.expected(self.husband)
+        self.assertEqual(result['my_emotion'], my_emotion)
+        self.assertEqual(result['my_inf_tests'], my_inf_tests)
+        self.assertEqual(result['spouse_emotion'], spouse_emotion)
+        self.assertEqual(result['spouse_inf_tests'], spouse_inf_tests)
+        self.assertEqual(result['my_stress_forecast'], 42.5)
+        self.assertIsNone(result['spouse_stress_forecast'])
+        self.assertEqual(result['my_infertility_forecast'], 61.25)
+        self.assertIsNone(result['spouse_infertility_forecast'])
+
+    def test_couple_data_without_records(self):
+        Emotion.objects.filter(member_id=self.husband).delete()
+        Infertility.objects.filter(member_id=self.husband).delete()
+
+        response = self.client.get('/accounts/couple/data/')
+        result = response.json()['result']
+        self.assertEqual(result['spouse_emotion'], {})
+        self.assertEqual(result['spouse_inf_tests'], [])
+
+    async def test_couple_data_async_matches_sync(self):
+        token = await Token.objects.acreate(user=self.wife)
+        response = await self.async_client.get(
+            '/accounts/couple/data/async/', headers={'Authorization': f'Token {token.key}'}
+        )
+        self.assertEqual(response.status_code, 200)
+        sync_response = await sync_to_async(self.client.get)('/accounts/couple/data/')
+        self.assertEqual(response.json(), sync_response.json())
+
+        response = await self.async_client.get('/accounts/couple/data/async/')
+        self.assertEqual(response.status_code, 401)
+
+
+SHARED_TOKEN_CACHE = {'MAX_SIZE': 1024, 'LOCAL_TTL': 30, 'CACHE_TTL': 300}
+
+
+class TokenAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, = create_members(1)
+        cls.token = Token.objects.create(user=cls.member)
+
+    def setUp(self):
+        cache.clear()
+        CachedTokenAuthentication.local_cache.clear()
+        self.authentication = CachedTokenAuthentication()
+
+    def authenticate(self, queries):
+        with self.assertNumQueries(queries):
+            return self.authentication.authenticate_credentials(self.token.key)
+
+    def counted(self, name):
+        return CachedTokenAuthentication.stats()[name]
+
+    def test_miss_then_local_hit(self):
+        misses, local_hits = self.counted('misses'), self.counted('local_hits')
+        self.assertEqual(self.authenticate(1), (self.member, self.token))
+        self.assertEqual(self.authenticate(0), (self.member, self.token))
+        self.assertEqual(self.counted('misses'), misses + 1)
+        self.assertEqual(self.counted('local_hits'), local_hits + 1)
+
+    def test_local_entry_expires(self):
+        self.authenticate(1)
+        expired = time.monotonic() + SHARED_TOKEN_CACHE['LOCAL_TTL'] + 1
+        with mock.patch('accounts.authentication.time.monotonic', return_value=expired):
+            self.authenticate(1)
+
+    def test_process_local_cache_is_not_used(self):
+        # 기본 설정(프로세스별 메모리 캐시)에서는 다른 워커가 무효화할 수 없으므로 Django 캐시에 넣지 않음
+        self.authenticate(1)
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+        CachedTokenAuthentication.local_cache.clear()
+        self.authenticate(1)
+
+    @override_settings(TOKEN_AUTH_CACHE=SHARED_TOKEN_CACHE)
+    def test_shared_cache_hit(self):
+        self.authenticate(1)
+        # 다른 워커처럼 프로세스 LRU가 비어 있으면 Django 캐시에서 찾음
+        CachedTokenAuthentication.local_cache.clear()
+        cache_hits = self.counted('cache_hits')
+        self.assertEqual(self.authenticate(0), (self.member, self.token))
+        self.assertEqual(self.counted('cache_hits'), cache_hits + 1)
+
+    @override_settings(TOKEN_AUTH_CACHE=SHARED_TOKEN_CACHE)
+    def test_deleted_token(self):
+        self.authenticate(1)
+        Token.objects.filter(pk=self.token.pk).delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(1)
+
+        response = APIClient().get('/accounts/couple/data/', HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.assertEqual(response.status_code, 401)
+
+    @override_settings(TOKEN_AUTH_CACHE=SHARED_TOKEN_CACHE)
+    def test_inactive_user(self):
+        self.authenticate(1)
+        self.member.is_active = False
+        self.member.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(1)
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+
+
+class CoupleRegistrationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.wife, cls.husband, cls.other_wife, cls.other_husband = create_members(4)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def register(self, member, spouse):
+        return self.client.post(
+            '/accounts/couple/', {'memberId': member.pk, 'spouseEmail': spouse.email}, format='json'
+        )
+
+    def register_elsewhere(self, wife, husband):
+        # 다른 워커에서 등록된 경우처럼 이 프로세스의 캐시 무효화 신호 없이 저장
+        Couple.objects.bulk_create([Couple(wife=wife, husband=husband)])
+
+    def test_register(self):
+        response = self.register(self.husband, self.wife)
+        self.assertEqual(response.status_code, 201)
+        couple = Couple.objects.get()
+        self.assertEqual((couple.wife, couple.husband), (self.wife, self.husband))
+        self.assertEqual(couple_resolver.resolve(self.wife.pk), (couple, self.husband))
+
+    def test_no_couple_is_not_cached(self):
+        self.assertEqual(couple_resolver.resolve(self.wife.pk), (None, None))
+        self.register_elsewhere(self.wife, self.husband)
+
+        couple, spouse = couple_resolver.resolve(self.wife.pk)
+        self.assertEqual(spouse, self.husband)
+        response = self.client.get('/accounts/couple/', {'memberId': self.wife.pk})
+        self.assertEqual(response.json()['result']['spouseInfo']['email'], self.husband.email)
+
+    def test_already_registered_checks_database(self):
+        couple_resolver.resolve(self.wife.pk)
+        couple_resolver.resolve(self.other_husband.pk)
+        self.register_elsewhere(self.wife, self.husband)
+
+        for member, spouse in ((self.wife, self.other_husband), (self.other_husband, self.wife)):
+            response = self.register(member, spouse)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('error', response.json())
+        self.assertEqual(Couple.objects.count(), 1)
+
+
+class CoupleCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.wife, cls.husband = create_members(2)
+        cls.couple = Couple.objects.create(wife=cls.wife, husband=cls.husband)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_not_cached_without_shared_cache(self):
+        # 기본(LocMem) 설정에서는 다른 워커의 삭제를 알 수 없으므로 캐시하지 않음
+        self.assertEqual(couple_resolver.resolve(self.wife.pk), (self.couple, self.husband))
+        self.assertIsNone(cache.get(couple_resolver.cache_key(self.wife.pk)))
+        with self.assertNumQueries(1):
+            self.husband.save()
+
+        # 다른 워커에서 삭제한 경우처럼 이 프로세스의 캐시 무효화 신호 없이 삭제
+        Couple.objects.filter(pk=self.couple.pk)._raw_delete(Couple.objects.db)
+        self.assertEqual(couple_resolver.resolve(self.wife.pk), (None, None))
+
+    @override_settings(COUPLE_CACHE_TIMEOUT=SHARED_COUPLE_CACHE_TIMEOUT)
+    def test_member_update_invalidates_cache(self):
+        couple_resolver.resolve(self.wife.pk)
+        with self.assertNumQueries(0):
+            couple_resolver.resolve(self.wife.pk)
+
+        # 로그인 시각만 바뀌면 부부 조회 없이 캐시 유지
+        with self.assertNumQueries(1):
+            self.husband.save(update_fields=['last_login'])
+        with self.assertNumQueries(0):
+            couple_resolver.resolve(self.wife.pk)
+
+        self.husband.username = '새이름'
+        self.husband.save(update_fields=['username'])
+        with self.assertNumQueries(1):
+            _, spouse = couple_resolver.resolve(self.wife.pk)
+        self.assertEqual(spouse.username, '새이름')
+
+
+class StressForecastTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.wife, cls.husband = create_members(2)
+        Couple.objects.create(wife=cls.wife, husband=cls.husband)
+
+    def create_emotions(self, member, totals, age):
+        emotions = []
+        for total in totals:
+            emotion = build_emotion(member)
+            emotion.total = total
+            emotions.append(emotion)
+        emotions = Emotion.objects.bulk_create(emotions)
+        Emotion.objects.filter(pk__in=[emotion.pk for emotion in emotions]).update(created_at=timezone.now() - age)
+
+    def test_exponential_smoothing(self):
+        matrix = np.array([
+            [np.nan, 10, 30],
+            [np.nan, np.nan, np.nan],
+            [40, np.nan, 20],
+        ])
+        levels = exponential_smoothing(matrix, 0.5)
+        # 첫 값으로 시작해 빈 칸은 건너뜀
+        self.assertEqual(levels[0], 20)
+        self.assertTrue(np.isnan(levels[1]))
+        self.assertEqual(levels[2], 30)
+
+    def test_removes_forecasts_not_refreshed(self):
+        self.create_emotions(self.wife, [10, 30], timedelta(days=1))
+        Infertility.objects.bulk_create([build_inf_test(self.wife, score) for score in (40, 60)])
+        # 조회 기간(lookback) 밖의 기록만 있는 회원의 이전 예측
+        self.create_emotions(self.husband, [50], timedelta(days=30))
+        StressForecast.objects.create(member_id=self.husband, emotion_forecast=50)
+
+        self.assertEqual(run_forecasts(alpha=0.5, lookback_days=7, workers=1), (1, 1))
+        forecast = StressForecast.objects.get()
+        self.assertEqual(
+            (forecast.member_id, forecast.emotion_forecast, forecast.infertility_forecast), (self.wife, 20, 50)
+        )
+
+        cache.clear()
+        connection.features.supports_json_field
+        client = APIClient()
+        client.force_authenticate(self.wife)
+        result = client.get('/accounts/couple/data/').json()['result']
+        self.assertEqual((result['my_stress_forecast'], result['spouse_stress_forecast']), (20, None))
+        self.assertEqual((result['my_infertility_forecast'], result['spouse_infertility_forecast']), (50, None))
+
+
+class CoupleExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.wife, cls.husband = create_members(2)
+        Couple.objects.create(wife=cls.wife, husband=cls.husband)
+        for member in (cls.wife, cls.husband):
+            Emotion.objects.bulk_create([build_emotion(member) for _ in range(3)])
+            Infertility.objects.bulk_create([build_inf_test(member, score) for score in range(2)])
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.wife)
+
+    def export_records(self, content):
+        lines = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(lines[0]['members'], [self.wife.pk, self.husband.pk])
+        return lines[1:]
+
+    def test_streams_both_spouses_records(self):
+        response = self.client.get('/accounts/couple/export/')
+        self.assertTrue(response.streaming)
+        records = self.export_records(b''.join(response.streaming_content))
+
+        emotions = Emotion.objects.order_by('member_id', '-created_at', '-id')
+        self.assertEqual(
+            [record['data'] for record in records if record['type'] == 'emotions'],
+            EmotionSerializers(emotions, many=True).data
+        )
+        self.assertEqual(sum(record['type'] == 'infertility_tests' for record in records), 4)
+
+    def test_gzip(self):
+        response = self.client.get('/accounts/couple/export/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        records = self.export_records(gzip.decompress(b''.join(response.streaming_content)))
+        self.assertEqual(len(records), 10)
+
+    def test_requires_couple(self):
+        Couple.objects.all().delete()
+        response = self.client.get('/accounts/couple/export/')
+        self.assertEqual(response.status_code, 404)
@@ -5,6 +5,8 @@ urlpatterns = [
     path('signup/', views.signup),
     path('login/', views.login),
     path('couple/', views.register_couple),
-    path('couple/data/', views.couple_data)
+    path('couple/data/', views.couple_data),
+    path('couple/data/async/', views.couple_data_async), # ASGI용
+    path('couple/export/', views.couple_export)
 ]
 
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CounselsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'counsels'
+
+    def ready(self):
+        # 검색 색인 갱신 시그널 등록
+        from . import search
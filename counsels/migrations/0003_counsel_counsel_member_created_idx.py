@@ -0,0 +1,17 @@
+# Generated by Django 4.2.16 on 2026-10-18 07:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('counsels', '0002_counsel_member_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='counsel',
+            index=models.Index(fields=['member_id', '-created_at', '-id'], name='counsel_member_created_idx'),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:22
+
+import re
+
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import connections, migrations
+from django.db.models import Case, Value, When
+
+# counsels.search의 색인 방식을 이 시점 그대로 복사 (이후 search.py가 바뀌어도 이 마이그레이션은 그대로)
+SEARCH_INDEX = 'counsel_search_vector_idx'
+SEARCH_CONFIG = 'simple'
+FTS_TABLE = 'counsels_counsel_fts'
+WORD_PATTERN = re.compile(r'\w+')
+INDEX_BATCH_SIZE = 500
+# 이 시점의 COUNSEL_SEARCH_NGRAM 값 (설정이 바뀌어도 다시 실행한 결과가 같도록 고정)
+NGRAM_SIZE = 2
+
+
+def search_document(summary, tags):
+    # 단어 + 글자 n-gram
+    size = NGRAM_SIZE
+    tokens = []
+    for word in WORD_PATTERN.findall(f'{summary} {tags}'.lower()):
+        tokens.append(word)
+        if len(word) > size:
+            tokens.extend(word[index:index + size] for index in range(len(word) - size + 1))
+    return ' '.join(tokens)
+
+
+def store_documents(Counsel, documents, using):
+    connection = connections[using]
+    documents = list(documents.items())
+    for start in range(0, len(documents), INDEX_BATCH_SIZE):
+        batch = documents[start:start + INDEX_BATCH_SIZE]
+        if connection.vendor == 'postgresql':
+            document = Case(*[When(pk=pk, then=Value(text)) for pk, text in batch])
+            Counsel._default_manager.using(using).filter(pk__in=[pk for pk, _ in batch]).update(
+                search_vector=SearchVector(document, config=SEARCH_CONFIG)
+            )
+        elif connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.executemany(f'INSERT OR REPLACE INTO {FTS_TABLE}(rowid, document) VALUES (%s, %s)', batch)
+
+
+def create_search_index(apps, schema_editor):
+    # PostgreSQL: tsvector GIN 인덱스 / SQLite(로컬 테스트): FTS5 가상 테이블
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(f'CREATE INDEX {SEARCH_INDEX} ON counsels_counsel USING GIN (search_vector)')
+    elif vendor == 'sqlite':
+        schema_editor.execute(f'CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(document)')
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {SEARCH_INDEX}')
+    elif vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+def index_existing_counsels(apps, schema_editor):
+    Counsel = apps.get_model('counsels', 'Counsel')
+    using = schema_editor.connection.alias
+    counsels = Counsel.objects.using(using).values_list('id', 'summary', 'tags').iterator(chunk_size=INDEX_BATCH_SIZE)
+    documents = {}
+    for pk, summary, tags in counsels:
+        documents[pk] = search_document(summary, tags)
+        if len(documents) >= INDEX_BATCH_SIZE:
+            store_documents(Counsel, documents, using)
+            documents = {}
+    store_documents(Counsel, documents, using)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('counsels', '0003_counsel_counsel_member_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='counsel',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(index_existing_counsels, migrations.RunPython.noop),
+    ]
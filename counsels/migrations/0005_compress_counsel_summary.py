@@ -0,0 +1,58 @@
+# Generated by Django 4.2.16 on 2026-10-18 08:26
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+import hahahoho.fields
+
+BATCH_SIZE = 500
+
+
+def rewrite_summaries(apps, schema_editor, compress):
+    # id 순서로 BATCH_SIZE개씩 읽어 UPDATE 한 번(Case/When)으로 다시 저장
+    Counsel = apps.get_model('counsels', 'Counsel')
+    counsels = Counsel.objects.using(schema_editor.connection.alias)
+    summary_field = Counsel._meta.get_field('summary')
+    preview_field = Counsel._meta.get_field('summary_preview')
+    output_field = summary_field if compress else models.TextField()
+
+    last_id = 0
+    while True:
+        rows = list(counsels.filter(id__gt=last_id).order_by('id').values_list('id', 'summary')[:BATCH_SIZE])
+        if not rows:
+            break
+        counsels.filter(id__in=[pk for pk, _ in rows]).update(
+            summary=Case(*[When(id=pk, then=Value(summary, output_field=output_field)) for pk, summary in rows]),
+            summary_preview=Case(*[
+                When(id=pk, then=Value(preview_field.preview(summary))) for pk, summary in rows
+            ]),
+        )
+        last_id = rows[-1][0]
+
+
+def compress_summaries(apps, schema_editor):
+    rewrite_summaries(apps, schema_editor, compress=True)
+
+
+def decompress_summaries(apps, schema_editor):
+    rewrite_summaries(apps, schema_editor, compress=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('counsels', '0004_counsel_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='counsel',
+            name='summary_preview',
+            field=hahahoho.fields.PreviewField(max_length=100, source='summary'),
+        ),
+        migrations.AlterField(
+            model_name='counsel',
+            name='summary',
+            field=hahahoho.fields.CompressedTextField(),
+        ),
+        migrations.RunPython(compress_summaries, decompress_summaries),
+    ]
@@ -1,11 +1,23 @@
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.conf import settings
 
+from hahahoho.fields import CompressedTextField, PreviewField
+
 # Create your models here.
 class Counsel(models.Model):
     member_id = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
-    summary = models.TextField()
+    # AI가 생성한 긴 요약은 압축 저장 / 목록에는 앞부분(summary_preview)만
+    summary = CompressedTextField()
+    summary_preview = PreviewField(max_length=100, source='summary')
     tags = models.TextField()
     count = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
\ No newline at end of file
+    updated_at = models.DateTimeField(auto_now=True)
+    # 요약 / 태그 검색용 (저장 시 counsels.search에서 갱신, GIN 인덱스는 마이그레이션에서 PostgreSQL일 때만 생성)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['member_id', '-created_at', '-id'], name='counsel_member_created_idx'),
+        ]
@@ -0,0 +1,139 @@
+import re
+from html import escape
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Case, F, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Counsel
+
+# PostgreSQL: search_vector(tsvector) + GIN 인덱스 / SQLite(로컬 테스트): FTS5 가상 테이블
+# 한국어는 조사가 붙어 단어가 그대로 일치하지 않으므로 단어와 함께 글자 n-gram을 색인
+SEARCH_CONFIG = 'simple'
+FTS_TABLE = 'counsels_counsel_fts'
+WORD_PATTERN = re.compile(r'\w+')
+INDEX_BATCH_SIZE = 500
+SNIPPET_RADIUS = 40
+
+
+def ngrams(word, size):
+    return [word[index:index + size] for index in range(len(word) - size + 1)]
+
+
+def document_tokens(text, size=None):
+    # "불안해서 #대화" -> 불안해서 불안 안해 해서 대화
+    size = size or settings.COUNSEL_SEARCH_NGRAM
+    tokens = []
+    for word in WORD_PATTERN.findall(text.lower()):
+        tokens.append(word)
+        if len(word) > size:
+            tokens.extend(ngrams(word, size))
+    return tokens
+
+
+def query_tokens(text, size=None):
+    # (토큰, 접두어 검색 여부) / n보다 긴 단어는 n-gram 모두 일치, 짧은 단어는 접두어로 검색
+    size = size or settings.COUNSEL_SEARCH_NGRAM
+    tokens = {}
+    for word in WORD_PATTERN.findall(text.lower()):
+        if len(word) > size:
+            tokens.update((gram, False) for gram in ngrams(word, size))
+        else:
+            tokens.setdefault(word, len(word) < size)
+    return list(tokens.items())
+
+
+def search_document(summary, tags):
+    return ' '.join(document_tokens(f'{summary} {tags}'))
+
+
+def store_documents(model, documents, using=DEFAULT_DB_ALIAS):
+    # documents: {상담 기록 ID: 색인 문자열}
+    connection = connections[using]
+    documents = list(documents.items())
+    for start in range(0, len(documents), INDEX_BATCH_SIZE):
+        batch = documents[start:start + INDEX_BATCH_SIZE]
+        if connection.vendor == 'postgresql':
+            document = Case(*[When(pk=pk, then=Value(text)) for pk, text in batch])
+            model._default_manager.using(using).filter(pk__in=[pk for pk, _ in batch]).update(
+                search_vector=SearchVector(document, config=SEARCH_CONFIG)
+            )
+        elif connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.executemany(f'INSERT OR REPLACE INTO {FTS_TABLE}(rowid, document) VALUES (%s, %s)', batch)
+
+
+def index_counsels(counsels):
+    store_documents(Counsel, {counsel.pk: search_document(counsel.summary, counsel.tags) for counsel in counsels})
+
+
+def search_queryset(member_id, text):
+    # 모든 토큰이 일치하는 기록 / rank가 클수록 관련도 높음
+    tokens = query_tokens(text)
+    counsels = Counsel.objects.filter(member_id=member_id)
+    connection = connections[counsels.db]
+    if connection.vendor == 'postgresql':
+        query = SearchQuery(
+            ' & '.join(f"'{token}'" + (':*' if prefix else '') for token, prefix in tokens),
+            search_type='raw', config=SEARCH_CONFIG
+        )
+        return counsels.filter(search_vector=query).annotate(rank=SearchRank(F('search_vector'), query))
+
+    # bm25()는 작을수록 관련도가 높으므로 부호를 바꿈
+    match = ' '.join(f'"{token}"' + ('*' if prefix else '') for token, prefix in tokens)
+    table = connection.ops.quote_name(Counsel._meta.db_table)
+    return counsels.filter(
+        pk__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [match])
+    ).annotate(rank=RawSQL(
+        f'SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id', [match]
+    ))
+
+
+def search_counsels(member_id, text, page, page_size):
+    # (해당 페이지의 (ID, rank) 목록, 다음 페이지 존재 여부)
+    offset = (page - 1) * page_size
+    hits = list(
+        search_queryset(member_id, text).order_by('-rank', '-created_at', '-id')
+        .values_list('id', 'rank')[offset:offset + page_size + 1]
+    )
+    return hits[:page_size], len(hits) > page_size
+
+
+def highlight(text, query, radius=SNIPPET_RADIUS):
+    # 검색어가 처음 나온 곳 주변만 잘라 검색어를 <mark>로 감쌈 (HTML 이스케이프 후)
+    words = sorted(set(WORD_PATTERN.findall(query.lower())), key=len, reverse=True)
+    if not words:
+        return escape(text[:radius * 2])
+    pattern = re.compile('|'.join(re.escape(word) for word in words), re.IGNORECASE)
+
+    match = pattern.search(text)
+    start = max(match.start() - radius, 0) if match else 0
+    end = min((match.end() if match else 0) + radius, len(text))
+    snippet = text[start:end]
+
+    parts, position = [], 0
+    for found in pattern.finditer(snippet):
+        parts.append(escape(snippet[position:found.start()]))
+        parts.append(f'<mark>{escape(found.group())}</mark>')
+        position = found.end()
+    parts.append(escape(snippet[position:]))
+    return ('…' if start > 0 else '') + ''.join(parts) + ('…' if end < len(text) else '')
+
+
+@receiver(post_save, sender=Counsel)
+def index_counsel(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not {'summary', 'tags'} & set(update_fields):
+        return
+    index_counsels([instance])
+
+
+@receiver(post_delete, sender=Counsel)
+def remove_counsel_index(sender, instance, using, **kwargs):
+    connection = connections[using]
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [instance.pk])
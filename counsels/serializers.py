@@ -4,4 +4,17 @@ from .models import Counsel
 class CounselSerializer(serializers.ModelSerializer):
     class Meta:
         model = Counsel
-        fields = '__all__'
\ No newline at end of file
+        exclude = ('search_vector', 'summary_preview')
+
+
+class CounselIncrementSerializer(serializers.Serializer):
+    # 상담 횟수 증가 요청 / buffered: 모아서 반영 (잦은 채팅 턴용)
+    by = serializers.IntegerField(min_value=1, max_value=100, default=1)
+    buffered = serializers.BooleanField(default=False)
+
+
+class CounselListSerializer(serializers.ModelSerializer):
+    # 목록 조회용 / 요약 전문 대신 앞부분만
+    class Meta:
+        model = Counsel
+        fields = ('id', 'member_id', 'summary_preview', 'tags', 'count', 'created_at', 'updated_at')
@@ -0,0 +1,222 @@
+# Swagger(drf_yasg) 문서 주석 / 스키마를 만들 때만 import (hahahoho.openapi.load_annotations)
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+
+from . import views
+from .serializers import CounselIncrementSerializer, CounselSerializer
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description='회원 상담 기록 목록 조회 API (최신순, 요약은 앞부분만 / 전문은 상세 조회)',
+    manual_parameters=[
+        openapi.Parameter(
+            'member_id',
+            openapi.IN_QUERY,
+            description="상담 기록을 조회할 회원의 ID",
+            type=openapi.TYPE_INTEGER,
+            required=True,
+        ),
+        openapi.Parameter(
+            'cursor',
+            openapi.IN_QUERY,
+            description="이전 응답의 next_cursor (없으면 첫 페이지)",
+            type=openapi.TYPE_STRING,
+        ),
+        openapi.Parameter(
+            'page_size',
+            openapi.IN_QUERY,
+            description="페이지 크기 (기본 20, 최대 100)",
+            type=openapi.TYPE_INTEGER,
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="회원 상담 기록 조회 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "totalRecords": [
+                            {
+                                "id": 1,
+                                "member_id": 5,
+                                "summary_preview": "요약 예시",
+                                "tags": "#해시태그로 #구분해서 #저장",
+                                "count": 1,
+                                "created_at": "2024-10-27T12:34:56",
+                                "updated_at": "2024-10-27T12:34:56"
+                            }
+                        ]
+                    },
+                    "next_cursor": "WyIyMDI0LTEwLTI3VDEyOjM0OjU2KzA5OjAwIiwgMV0"
+                }
+            }
+        ),
+        204: openapi.Response(
+            description="상담 기록이 없는 경우",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "message": "사용자의 상담 기록이 없습니다."
+                }
+            }
+        )
+    }
+)(views.handle_counsel_record)
+
+
+swagger_auto_schema(
+    method='post',
+    operation_description='새로운 상담 기록 등록 API',
+    request_body=CounselSerializer,
+    responses={
+        201: openapi.Response(
+            description="상담 기록 등록 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "id": 1,
+                        "member_id": 5,
+                        "summary": "새로운 요약 정보",
+                        "tags": "#new #tag #s",
+                        "count": 1,
+                        "created_at": "2024-10-27T12:34:56",
+                        "updated_at": "2024-10-27T12:34:56"
+                    }
+                }
+            }
+        ),
+        400: "잘못된 요청 데이터"
+    }
+)(views.handle_counsel_record)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description='상담 기록 상세 조회 API',
+    manual_parameters=[
+        openapi.Parameter(
+            'record_pk',
+            openapi.IN_PATH,
+            description="조회할 상담 기록의 ID",
+            type=openapi.TYPE_INTEGER,
+            required=True,
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="상담 기록 조회 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "id": 1,
+                        "member_id": 5, 
+                        "summary": "상세 상담 기록의 요약 정보",
+                        "tags": "#상세 #상담 #기록",
+                        "count": 1,
+                        "created_at": "2024-10-27T12:34:56",
+                        "updated_at": "2024-10-27T12:34:56"
+
+                    }
+                }
+            }
+        ),
+        404: openapi.Response(
+            description="상담 기록 조회 실패",
+            examples={
+                "application/json": {
+                    "error": "해당 상담 기록이 존재하지 않습니다."
+                }
+            }
+        )
+    }
+)(views.record_detail)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description='상담 기록 검색 API (요약 / 태그, 관련도순)',
+    manual_parameters=[
+        openapi.Parameter(
+            'member_id',
+            openapi.IN_QUERY,
+            description="상담 기록을 검색할 회원의 ID",
+            type=openapi.TYPE_INTEGER,
+            required=True,
+        ),
+        openapi.Parameter(
+            'q',
+            openapi.IN_QUERY,
+            description="검색어 (여러 단어는 모두 포함된 기록만)",
+            type=openapi.TYPE_STRING,
+            required=True,
+        ),
+        openapi.Parameter(
+            'page',
+            openapi.IN_QUERY,
+            description="페이지 번호 (기본 1)",
+            type=openapi.TYPE_INTEGER,
+        ),
+        openapi.Parameter(
+            'page_size',
+            openapi.IN_QUERY,
+            description="페이지 크기 (기본 20, 최대 100)",
+            type=openapi.TYPE_INTEGER,
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="상담 기록 검색 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": [
+                        {
+                            "id": 1,
+                            "member_id": 5,
+                            "tags": "#불안 #대화",
+                            "count": 1,
+                            "created_at": "2024-10-27T12:34:56",
+                            "updated_at": "2024-10-27T12:34:56",
+                            "highlight": "…남편과 <mark>대화</mark>를 나누고 나서…",
+                            "rank": 0.0608
+                        }
+                    ],
+                    "next_page": 2
+                }
+            }
+        ),
+        400: openapi.Response(description="검색어가 없는 경우")
+    }
+)(views.search_counsel_records)
+
+
+swagger_auto_schema(
+    method='post',
+    operation_description='상담 횟수 증가 API (동시 요청에도 유실 없음, buffered면 모아서 반영)',
+    request_body=CounselIncrementSerializer,
+    responses={
+        200: openapi.Response(
+            description="바로 반영",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {"id": 1, "count": 4}
+                }
+            }
+        ),
+        202: openapi.Response(
+            description="buffered: 메모리에 모아 두고 일정 횟수 / 시간마다 반영",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {"id": 1, "pending": 2}
+                }
+            }
+        ),
+        404: openapi.Response(description="상담 기록이 없는 경우")
+    }
+)(views.increment_counsel_count)
@@ -1,3 +1,205 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.db import DatabaseError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from hahahoho.testutils import QueryPlanAssertionsMixin, create_members
+from .models import Counsel
+from .views import counsel_counts
+
+MEMBER_COUNT = 200
+ROWS_PER_MEMBER = 50
+
+
+class CounselQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.members = create_members(MEMBER_COUNT)
+        Counsel.objects.bulk_create([
+            Counsel(member_id=member, summary="요약 예시", tags="#해시태그로 #구분해서 #저장", count=1)
+            for member in cls.members for _ in range(ROWS_PER_MEMBER)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.member = self.members[0]
+        self.analyze_tables('counsels_counsel')
+
+    def test_handle_counsel_record_uses_member_index(self):
+        response, queries = self.capture_queries(
+            self.client.get, '/counsels/records/', {'member_id': self.member.id}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assert_indexed_plans(queries, 'counsels_counsel')
+
+
+class CounselListTests(QueryPlanAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, = create_members(1)
+        cls.counsels = [
+            Counsel.objects.create(member_id=cls.member, summary=f"{index} " + "긴 상담 요약 " * 100, tags="#불안", count=1)
+            for index in range(5)
+        ]
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_paginates_with_summary_preview(self):
+        pages = []
+        params = {'member_id': self.member.id, 'page_size': 2}
+        while True:
+            response, queries = self.capture_queries(self.client.get, '/counsels/records/', params)
+            body = response.json()
+            pages.append(body['result']['totalRecords'])
+            if body['next_cursor'] is None:
+                break
+            params['cursor'] = body['next_cursor']
+
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        records = [record for page in pages for record in page]
+        self.assertEqual([record['id'] for record in records], [counsel.id for counsel in reversed(self.counsels)])
+        self.assertEqual(
+            records[0]['summary_preview'], self.counsels[-1].summary[:Counsel._meta.get_field('summary_preview').max_length]
+        )
+        self.assertNotIn('summary', records[0])
+        # 요약 전문 컬럼은 읽지 않음
+        for sql in queries:
+            self.assertNotIn('"counsels_counsel"."summary"', sql)
+
+    def test_record_detail_returns_full_summary(self):
+        response = self.client.get(f'/counsels/records/{self.counsels[0].id}/')
+        self.assertEqual(response.json()['result']['summary'], self.counsels[0].summary)
+
+
+class CounselSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, other = create_members(2)
+        cls.anxious = Counsel.objects.create(
+            member_id=cls.member, summary="요즘 불안해서 잠을 못 잔다. 불안이 심해지면 남편과 대화한다.",
+            tags="#불안 #대화", count=1
+        )
+        cls.talk = Counsel.objects.create(
+            member_id=cls.member, summary="남편과 대화를 나누고 나서 <마음>이 편해졌다.", tags="#대화", count=2
+        )
+        Counsel.objects.create(member_id=other, summary="불안한 하루", tags="#불안", count=1)
+
+    def search(self, q, **params):
+        response = self.client.get('/counsels/records/search/', {'member_id': self.member.id, 'q': q, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_ranked_korean_search(self):
+        # 조사가 붙은 단어("불안해서")도 n-gram으로 검색
+        result = self.search('불안')['result']
+        self.assertEqual([hit['id'] for hit in result], [self.anxious.id])
+        self.assertIn('<mark>불안</mark>해서', result[0]['highlight'])
+        self.assertNotIn('summary', result[0])
+
+        result = self.search('남편 대화')['result']
+        self.assertEqual({hit['id'] for hit in result}, {self.anxious.id, self.talk.id})
+        self.assertGreaterEqual(result[0]['rank'], result[1]['rank'])
+        self.assertIn('&lt;<mark>마음</mark>&gt;', self.search('마음')['result'][0]['highlight'])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.talk.summary = "산책하며 이야기했다."
+        self.talk.save()
+        self.assertEqual([hit['id'] for hit in self.search('산책')['result']], [self.talk.id])
+
+        self.talk.delete()
+        self.assertEqual(self.search('산책')['result'], [])
+
+    def test_pagination_and_validation(self):
+        body = self.search('대화', page_size=1)
+        self.assertEqual((len(body['result']), body['next_page']), (1, 2))
+        body = self.search('대화', page_size=1, page=2)
+        self.assertEqual((len(body['result']), body['next_page']), (1, None))
+
+        for q in (' ', '!!!', '*', '"'):
+            response = self.client.get('/counsels/records/search/', {'member_id': self.member.id, 'q': q})
+            self.assertEqual(response.status_code, 400, q)
+
+
+class CounselCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        member, = create_members(1)
+        cls.counsels = [
+            Counsel.objects.create(member_id=member, summary="요약", tags="#불안", count=1) for _ in range(2)
+        ]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.addCleanup(counsel_counts.flush)
+
+    def increment(self, counsel, **data):
+        return self.client.post(f'/counsels/records/{counsel.pk}/count/', data, format='json')
+
+    def test_increments_in_single_update(self):
+        counsel = self.counsels[0]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.increment(counsel, by=3)
+        self.assertEqual(response.json()['result'], {'id': counsel.pk, 'count': 4})
+        # UPDATE ... SET count = count + 3 (행을 먼저 읽지 않음)
+        self.assertTrue(queries.captured_queries[0]['sql'].startswith('UPDATE'))
+
+        counsel.refresh_from_db()
+        self.assertEqual(counsel.count, 4)
+        self.assertGreater(counsel.updated_at, self.counsels[1].updated_at)
+
+        self.assertEqual(self.client.post('/counsels/records/0/count/').status_code, 404)
+        self.assertEqual(self.increment(counsel, by=0).status_code, 400)
+
+    @override_settings(COUNTER_BUFFER={'FLUSH_SIZE': 3, 'FLUSH_INTERVAL': 60})
+    def test_buffered_increments_flush_in_one_update(self):
+        first, second = self.counsels
+        # 기록 존재 확인(PK 조회)만 실행
+        with self.assertNumQueries(2):
+            self.assertEqual(self.increment(first, by=2, buffered=True).status_code, 202)
+            response = self.increment(second, buffered=True)
+        self.assertEqual(response.json()['result'], {'id': second.pk, 'pending': 1})
+
+        # 세 번째 증가에서 두 기록을 UPDATE 한 번으로 반영
+        with self.assertNumQueries(2):
+            self.increment(first, buffered=True)
+        self.assertEqual(
+            dict(Counsel.objects.values_list('id', 'count')), {first.pk: 4, second.pk: 2}
+        )
+
+    def test_buffered_increment_of_missing_record(self):
+        response = self.client.post('/counsels/records/0/count/', {'buffered': True}, format='json')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(counsel_counts.pending_amount(0), 0)
+
+    @override_settings(COUNTER_BUFFER={'FLUSH_SIZE': 100, 'FLUSH_INTERVAL': 60})
+    def test_buffered_increments_flush_on_timer(self):
+        counsel = self.counsels[0]
+        self.increment(counsel, buffered=True)
+        # 다음 요청이 없어도 FLUSH_INTERVAL초 뒤에 타이머 스레드에서 반영
+        timer = counsel_counts.timer
+        self.assertEqual(timer.interval, 60)
+        self.assertEqual(timer.function, counsel_counts.flush_in_background)
+        self.assertTrue(timer.is_alive())
+
+        self.assertEqual(counsel_counts.flush(), 1)
+        self.assertIsNone(counsel_counts.timer)
+        timer.join(1)
+        self.assertFalse(timer.is_alive())
+
+    @override_settings(COUNTER_BUFFER={'FLUSH_SIZE': 1, 'FLUSH_INTERVAL': 60})
+    def test_failed_flush_keeps_increments(self):
+        counsel = self.counsels[0]
+        with mock.patch('hahahoho.counters.increment', side_effect=DatabaseError), \
+                self.assertLogs('hahahoho.counters', 'ERROR'):
+            response = self.increment(counsel, by=2, buffered=True)
+        # 요청은 성공하고 증가분은 다음 반영 때까지 남아 있음 (재시도해도 두 번 더해지지 않음)
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(counsel_counts.pending_amount(counsel.pk), 2)
+        self.assertIsNotNone(counsel_counts.timer)
+
+        self.assertEqual(counsel_counts.flush(), 1)
+        counsel.refresh_from_db()
+        self.assertEqual(counsel.count, 3)
@@ -3,5 +3,7 @@ from . import views
 app_name='counsels'
 urlpatterns = [
     path('records/', views.handle_counsel_record),
-    path('records/<int:record_pk>/', views.record_detail)
+    path('records/search/', views.search_counsel_records),
+    path('records/<int:record_pk>/', views.record_detail),
+    path('records/<int:record_pk>/count/', views.increment_counsel_count)
 ]
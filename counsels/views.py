@@ -1,105 +1,62 @@
 from rest_framework.decorators import api_view
+from rest_framework.exceptions import ValidationError
 from rest_framework.views import Response
 from rest_framework import status
 
+from django.http import Http404
 from django.shortcuts import render
 from .models import Counsel
-from .serializers import CounselSerializer
-
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
-
-@swagger_auto_schema(
-    method='get',
-    operation_description='회원 상담 기록 전체 조회 API',
-    manual_parameters=[
-        openapi.Parameter(
-            'member_id',
-            openapi.IN_QUERY,
-            description="상담 기록을 조회할 회원의 ID",
-            type=openapi.TYPE_INTEGER,
-            required=True,
-        )
-    ],
-    responses={
-        200: openapi.Response(
-            description="회원 상담 기록 조회 성공",
-            examples={
-                "application/json": {
-                    "success": True,
-                    "result": {
-                        "totalRecords": [
-                            {
-                                "id": 1,
-                                "member_id": 5,
-                                "summary": "요약 예시",
-                                "tags": "#해시태그로 #구분해서 #저장",
-                                "count": 1,
-                                "created_at": "2024-10-27T12:34:56",
-                                "updated_at": "2024-10-27T12:34:56"
-                            }
-                        ]
-                    }
-                }
-            }
-        ),
-        204: openapi.Response(
-            description="상담 기록이 없는 경우",
-            examples={
-                "application/json": {
-                    "success": True,
-                    "message": "사용자의 상담 기록이 없습니다."
-                }
-            }
-        )
-    }
-)
-@swagger_auto_schema(
-    method='post',
-    operation_description='새로운 상담 기록 등록 API',
-    request_body=CounselSerializer,
-    responses={
-        201: openapi.Response(
-            description="상담 기록 등록 성공",
-            examples={
-                "application/json": {
-                    "success": True,
-                    "result": {
-                        "id": 1,
-                        "member_id": 5,
-                        "summary": "새로운 요약 정보",
-                        "tags": "#new #tag #s",
-                        "count": 1,
-                        "created_at": "2024-10-27T12:34:56",
-                        "updated_at": "2024-10-27T12:34:56"
-                    }
-                }
-            }
-        ),
-        400: "잘못된 요청 데이터"
-    }
-)
+from .search import highlight, query_tokens, search_counsels
+from .serializers import CounselIncrementSerializer, CounselListSerializer, CounselSerializer
+from hahahoho.counters import BufferedCounter, increment
+from hahahoho.conditional import conditional_get, list_version, record_version
+from hahahoho.fast_serializers import fast_serializer
+from hahahoho.pagination import get_page_size, paginate_keyset
+from hahahoho.params import get_positive_int
+
+
+# 채팅 턴마다 들어오는 상담 횟수 증가를 모아서 반영
+counsel_counts = BufferedCounter(Counsel, 'count', timestamp_field='updated_at')
+
+
+def counsel_list_version(request):
+    return list_version(Counsel.objects.filter(member_id=request.GET.get('member_id')), 'updated_at')
+
+
+def counsel_version(request, record_pk):
+    return record_version(Counsel.objects.filter(pk=record_pk), 'updated_at')
+
+
 @api_view(['GET', 'POST'])
+@conditional_get(counsel_list_version)
 def handle_counsel_record(request):
     EMPTY_RESULT_MESSAGE = "사용자의 상담 기록이 없습니다."
     if request.method == 'GET':
         member_id = request.query_params.get('member_id')
+        # 요약 전문(summary)은 읽지 않고 저장해 둔 앞부분만 조회 / 전문은 record_detail에서만
         counsels = Counsel.objects.filter(member_id=member_id)
-        serializer = CounselSerializer(counsels, many=True)
-        print(member_id)
 
-        if is_empty_counsel(serializer):
+        serializer = fast_serializer(CounselListSerializer)
+        created_at, pk = serializer.index('created_at'), serializer.index('id')
+        rows, next_cursor = paginate_keyset(
+            serializer.values(counsels), request, cursor_key=lambda row: (row[created_at], row[pk])
+        )
+        counsels = serializer.serialize(rows)
+
+        if is_empty_counsel(counsels):
             response_data = {
                 "success": True,
                 "message": EMPTY_RESULT_MESSAGE,
                 "result": [],
+                "next_cursor": None
             }
             return Response(response_data)
         response_data = {
             "success": True,
             "result": {
-                "totalRecords": serializer.data
-            }
+                "totalRecords": counsels
+            },
+            "next_cursor": next_cursor
         }
         return Response(response_data, status=status.HTTP_200_OK)
     
@@ -115,51 +72,11 @@ def handle_counsel_record(request):
             return Response(response_data, status=status.HTTP_201_CREATED)
 
 
-def is_empty_counsel(serializer):
-    return len(serializer.data) == 0
+def is_empty_counsel(counsels):
+    return len(counsels) == 0
 
-@swagger_auto_schema(
-    method='get',
-    operation_description='상담 기록 상세 조회 API',
-    manual_parameters=[
-        openapi.Parameter(
-            'record_pk',
-            openapi.IN_PATH,
-            description="조회할 상담 기록의 ID",
-            type=openapi.TYPE_INTEGER,
-            required=True,
-        )
-    ],
-    responses={
-        200: openapi.Response(
-            description="상담 기록 조회 성공",
-            examples={
-                "application/json": {
-                    "success": True,
-                    "result": {
-                        "id": 1,
-                        "member_id": 5, 
-                        "summary": "상세 상담 기록의 요약 정보",
-                        "tags": "#상세 #상담 #기록",
-                        "count": 1,
-                        "created_at": "2024-10-27T12:34:56",
-                        "updated_at": "2024-10-27T12:34:56"
-
-                    }
-                }
-            }
-        ),
-        404: openapi.Response(
-            description="상담 기록 조회 실패",
-            examples={
-                "application/json": {
-                    "error": "해당 상담 기록이 존재하지 않습니다."
-                }
-            }
-        )
-    }
-)
 @api_view(['GET'])
+@conditional_get(counsel_version)
 def record_detail(request, record_pk):
     counsel = Counsel.objects.get(pk=record_pk)
     serializer = CounselSerializer(counsel)
@@ -168,4 +85,63 @@ def record_detail(request, record_pk):
         "success": True,
         "result": serializer.data
     }
-    return Response(response_data, status=status.HTTP_200_OK)
\ No newline at end of file
+    return Response(response_data, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+def search_counsel_records(request):
+    EMPTY_QUERY_MESSAGE = "검색어(글자나 숫자)를 입력해 주세요."
+    member_id = request.query_params.get('member_id')
+    query = request.query_params.get('q', '').strip()
+    # 기호만 있는 검색어는 검색할 토큰이 없음
+    if not query_tokens(query):
+        raise ValidationError({"q": EMPTY_QUERY_MESSAGE})
+    page = get_positive_int(request.query_params, 'page', 1)
+
+    # 관련도순 ID만 먼저 조회하고 해당 페이지의 기록만 읽어 검색어 강조
+    hits, has_next = search_counsels(member_id, query, page, get_page_size(request))
+    ranks = dict(hits)
+    order = {pk: index for index, (pk, _) in enumerate(hits)}
+    counsels = fast_serializer(CounselSerializer).serialize_queryset(Counsel.objects.filter(pk__in=ranks))
+
+    results = []
+    for counsel in sorted(counsels, key=lambda counsel: order[counsel['id']]):
+        summary = counsel.pop('summary')
+        counsel['highlight'] = highlight(summary, query)
+        counsel['rank'] = round(ranks[counsel['id']], 4)
+        results.append(counsel)
+
+    response_data = {
+        "success": True,
+        "result": results,
+        "next_page": page + 1 if has_next else None
+    }
+    return Response(response_data, status=status.HTTP_200_OK)
+
+
+@api_view(['POST'])
+def increment_counsel_count(request, record_pk):
+    serializer = CounselIncrementSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    by = serializer.validated_data['by']
+
+    if serializer.validated_data['buffered']:
+        # 기록이 있는지만 확인(PK 조회)하고 UPDATE 없이 메모리에 더해 두었다가 일정 횟수 / 시간마다 한 번에 반영
+        if not Counsel.objects.filter(pk=record_pk).exists():
+            raise Http404
+        counsel_counts.add(record_pk, by)
+        response_data = {
+            "success": True,
+            "result": {"id": record_pk, "pending": counsel_counts.pending_amount(record_pk)}
+        }
+        return Response(response_data, status=status.HTTP_202_ACCEPTED)
+
+    # 행을 읽어 수정하지 않고 UPDATE ... SET count = count + n 한 번으로 반영
+    counsels = Counsel.objects.filter(pk=record_pk)
+    if not increment(counsels, 'count', by, timestamp_field='updated_at'):
+        raise Http404
+    response_data = {
+        "success": True,
+        "result": {"id": record_pk, "count": counsels.values_list('count', flat=True).get()}
+    }
+    return Response(response_data, status=status.HTTP_200_OK)
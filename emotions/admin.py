@@ -1,7 +1,11 @@
 from django.contrib import admin
 
-from .models import Emotion, Interest
+from .models import Emotion, Interest, MemberTagDay, MissionWeek, Tag, TagDay
 
 # Register your models here.
 admin.site.register(Emotion)
-admin.site.register(Interest)
\ No newline at end of file
+admin.site.register(Interest)
+admin.site.register(MissionWeek)
+admin.site.register(Tag)
+admin.site.register(MemberTagDay)
+admin.site.register(TagDay)
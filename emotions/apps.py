@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class EmotionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'emotions'
+
+    def ready(self):
+        # 주간 미션 / 해시태그 집계 시그널 등록
+        from . import missions, tags
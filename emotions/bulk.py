@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.db import transaction
+
+from .missions import record_missions
+from .models import Emotion, Interest
+from .serializers import BulkEmotionSerializers, User
+from .tags import index_interests
+
+
+def prefetch_members(items):
+    member_ids = set()
+    for item in items:
+        try:
+            member_ids.add(int(item.get('member_id')))
+        except (AttributeError, TypeError, ValueError):
+            continue
+    return User.objects.in_bulk(member_ids)
+
+
+def validate_emotions(items):
+    # 항목별 (검증된 데이터, 오류) / 회원은 한 번에 조회해 두고 목록 전체를 검증
+    serializer = BulkEmotionSerializers(data=items, many=True, context={'members': prefetch_members(items)})
+    if serializer.is_valid():
+        return [(data, None) for data in serializer.validated_data]
+
+    results = []
+    for item, errors in zip(items, serializer.errors):
+        if errors:
+            results.append((None, errors))
+        else:
+            results.append((serializer.child.run_validation(item), None))
+    return results
+
+
+def bulk_create_emotions(validated_items):
+    batch_size = settings.EMOTION_BULK_BATCH_SIZE
+    with transaction.atomic():
+        emotions = Emotion.objects.bulk_create(
+            [Emotion(**data) for data in validated_items],
+            batch_size=batch_size
+        )
+        # bulk_create는 post_save 시그널을 보내지 않으므로 관심사 / 집계를 직접 반영
+        interests = Interest.objects.bulk_create(
+            [Interest(member_id=emotion.member_id, interests=emotion.interest_keyword) for emotion in emotions],
+            batch_size=batch_size
+        )
+        index_interests(interests)
+        record_missions(emotions)
+    return emotions
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+
+from emotions.missions import mission_slot
+from emotions.models import Emotion, MissionWeek
+
+
+class Command(BaseCommand):
+    help = "감정 기록 전체로 주간 미션 집계(MissionWeek)를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--member', type=int, help="특정 회원만 다시 계산")
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        emotions = Emotion.objects.order_by('member_id', 'created_at')
+        if options['member']:
+            emotions = emotions.filter(member_id=options['member'])
+
+        weeks = {}
+        written = 0
+        previous_member_id = None
+        rows = emotions.values_list('member_id', 'created_at', 'is_complement')
+        for member_id, created_at, is_complement in rows.iterator(chunk_size=batch_size):
+            # 회원 순으로 읽으므로 회원이 바뀌는 시점에만 기록 (한 주가 나뉘어 덮어쓰이지 않도록)
+            if member_id != previous_member_id and len(weeks) >= batch_size:
+                written += self.write(weeks, batch_size)
+                weeks = {}
+            previous_member_id = member_id
+
+            week_start, _, bit = mission_slot(created_at)
+            week = weeks.setdefault((member_id, week_start), [0, 0])
+            week[0] |= bit
+            if is_complement:
+                week[1] |= bit
+        written += self.write(weeks, batch_size)
+
+        self.stdout.write(self.style.SUCCESS(f"MissionWeek {written}건을 갱신했습니다."))
+
+    def write(self, weeks, batch_size):
+        MissionWeek.objects.bulk_create(
+            [
+                MissionWeek(
+                    member_id_id=member_id,
+                    week_start=week_start,
+                    recorded_days=recorded_days,
+                    completed_days=completed_days
+                )
+                for (member_id, week_start), (recorded_days, completed_days) in weeks.items()
+            ],
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['member_id', 'week_start'],
+            update_fields=['recorded_days', 'completed_days', 'updated_at']
+        )
+        return len(weeks)
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from emotions.models import Interest, MemberTagDay, TagDay
+from emotions.tags import index_interests
+
+
+class Command(BaseCommand):
+    help = "관심사 전체로 해시태그 카운터(MemberTagDay, TagDay)를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        indexed = 0
+
+        with transaction.atomic():
+            MemberTagDay.objects.all().delete()
+            TagDay.objects.all().delete()
+
+            batch = []
+            for interest in Interest.objects.order_by('id').iterator(chunk_size=batch_size):
+                batch.append(interest)
+                if len(batch) >= batch_size:
+                    index_interests(batch)
+                    indexed += len(batch)
+                    batch = []
+            index_interests(batch)
+            indexed += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"관심사 {indexed}건의 해시태그를 집계했습니다."))
@@ -0,0 +1,33 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from emotions.snapshots import SNAPSHOT_TABLES, export_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "감정 기록 / 난임척도검사 점수를 컬럼별 바이너리 파일과 manifest.json으로 내보냅니다. "
+        "이전 스냅샷 이후에 추가된 행(id 기준)만 덧붙이며, 이미 내보낸 행의 수정 사항은 반영하지 않습니다. "
+        "커밋이 늦은 행을 건너뛰지 않도록 최근 --lag초 안에 생성된 행부터는 다음 실행에서 내보냅니다. "
+        "분석은 emotions.snapshots.load_snapshot()으로 메모리 맵을 열어 진행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="스냅샷 디렉터리")
+        parser.add_argument('--table', action='append', choices=list(SNAPSHOT_TABLES), help="내보낼 테이블 (기본값 전체)")
+        parser.add_argument('--chunk-size', type=int, default=10000)
+        parser.add_argument(
+            '--lag', type=int, default=settings.SNAPSHOT_EXPORT_LAG,
+            help="커밋 대기 여유 시간 (초) / 가장 긴 쓰기 트랜잭션보다 길어야 함"
+        )
+
+    def handle(self, *args, **options):
+        if options['lag'] < 0:
+            raise CommandError("lag는 0 이상이어야 합니다.")
+        exported = export_snapshot(
+            options['path'], options['table'], options['chunk_size'], timedelta(seconds=options['lag'])
+        )
+        for table, count in exported.items():
+            self.stdout.write(self.style.SUCCESS(f"{table}: {count}행을 추가했습니다."))
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.16 on 2026-10-18 07:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emotions', '0004_emotion_created_at_emotion_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emotion',
+            index=models.Index(fields=['member_id', '-created_at', '-id'], name='emotion_member_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interest',
+            index=models.Index(fields=['member_id', '-created_at', '-id'], name='interest_member_created_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.16 on 2026-10-18 07:53
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('emotions', '0005_emotion_emotion_member_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MissionWeek',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week_start', models.DateField()),
+                ('recorded_days', models.PositiveSmallIntegerField(default=0)),
+                ('completed_days', models.PositiveSmallIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('member_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('member_id', 'week_start')},
+            },
+        ),
+    ]
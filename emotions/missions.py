@@ -0,0 +1,199 @@
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import ExtractWeekDay, TruncDate
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from .models import Emotion, MissionWeek
+
+DAY_LIST = ['SUN', 'MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT']
+ALL_DAYS = (1 << len(DAY_LIST)) - 1
+# 결과를 요일(SUN..SAT)별로 묶으므로 한 주까지만 (같은 요일이 두 번 나오지 않도록)
+MAX_RANGE_DAYS = 7
+
+INVALID_WEEK_OFFSET_MESSAGE = "week_offset은 정수여야 합니다."
+INVALID_DATE_MESSAGE = "날짜는 YYYY-MM-DD 형식이어야 합니다."
+INVALID_RANGE_MESSAGE = f"조회 기간은 from <= to 이고 최대 {MAX_RANGE_DAYS}일이어야 합니다."
+
+
+def start_of_week(day):
+    # 미션 보드는 일요일부터 시작
+    return day - timedelta(days=(day.weekday() + 1) % 7)
+
+
+def parse_query_date(value, name):
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({name: INVALID_DATE_MESSAGE})
+    return parsed
+
+
+def get_custom_range(query_params):
+    # from / to 가 주어진 경우 (시작일, 종료일) / 종료일 포함
+    date_from = query_params.get('from')
+    date_to = query_params.get('to')
+    if not (date_from or date_to):
+        return None
+
+    start = parse_query_date(date_from or date_to, 'from')
+    end = parse_query_date(date_to or date_from, 'to')
+    if start > end or (end - start).days >= MAX_RANGE_DAYS:
+        raise ValidationError({"to": INVALID_RANGE_MESSAGE})
+    return start, end
+
+
+def get_week_start(query_params):
+    # 기본값은 이번 주 일요일
+    try:
+        week_offset = int(query_params.get('week_offset', 0))
+    except ValueError:
+        raise ValidationError({"week_offset": INVALID_WEEK_OFFSET_MESSAGE})
+    return start_of_week(timezone.localdate()) + timedelta(weeks=week_offset)
+
+
+def local_midnight(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def missions_by_day_queryset(member_ids, start, end):
+    # 요일 / 날짜 계산은 DB에서 (Asia/Seoul 기준), 두 회원의 기록을 한 번에 조회
+    tzinfo = timezone.get_current_timezone()
+    return Emotion.objects.filter(
+        member_id__in=member_ids,
+        created_at__gte=local_midnight(start),
+        created_at__lt=local_midnight(end + timedelta(days=1))
+    ).annotate(
+        local_date=TruncDate('created_at', tzinfo=tzinfo),
+        weekday=ExtractWeekDay('created_at', tzinfo=tzinfo)
+    ).values_list('member_id', 'is_complement', 'local_date', 'weekday')
+
+
+def mission_entry(local_date, day_of_week, is_complement):
+    # 두 조회 방식 모두 하루에 항목 하나 / 그날 완료한 기록이 하나라도 있으면 완료
+    return {
+        'is_complement': is_complement,
+        'created_at': f"{local_date.isoformat()}, {day_of_week}"
+    }
+
+
+def build_missions_by_day(member_ids, missions):
+    # 행 수가 적어 날짜별로 묶는 것은 파이썬에서 (날짜 계산식으로 GROUP BY하면 임시 정렬이 추가됨)
+    completed_by_day = {}
+    for member_id, is_complement, local_date, weekday in missions:
+        key = (member_id, local_date, DAY_LIST[weekday - 1])
+        completed_by_day[key] = completed_by_day.get(key, False) or is_complement
+
+    missions_by_member = {member_id: {day: [] for day in DAY_LIST} for member_id in member_ids}
+    for (member_id, local_date, day_of_week), is_complement in completed_by_day.items():
+        missions_by_member[member_id][day_of_week].append(mission_entry(local_date, day_of_week, is_complement))
+    return missions_by_member
+
+
+def get_missions_by_day(member_ids, start, end):
+    return build_missions_by_day(member_ids, missions_by_day_queryset(member_ids, start, end))
+
+
+async def aget_missions_by_day(member_ids, start, end):
+    missions = [row async for row in missions_by_day_queryset(member_ids, start, end)]
+    return build_missions_by_day(member_ids, missions)
+
+
+def mission_slot(created_at):
+    # (주 시작일, 날짜, 요일 비트)
+    day = timezone.localtime(created_at).date()
+    return start_of_week(day), day, 1 << ((day.weekday() + 1) % 7)
+
+
+def build_missions_from_rollup(member_ids, week_start, weeks):
+    # MissionWeek 집계만 읽어 보드 구성 (from / to 조회와 같은 형식)
+    weeks = {week.member_id_id: week for week in weeks}
+
+    missions_by_member = {}
+    for member_id in member_ids:
+        week = weeks.get(member_id)
+        missions_by_member[member_id] = {day: [] for day in DAY_LIST}
+        if week is None:
+            continue
+        for index, day_of_week in enumerate(DAY_LIST):
+            bit = 1 << index
+            if week.recorded_days & bit:
+                missions_by_member[member_id][day_of_week].append(mission_entry(
+                    week_start + timedelta(days=index), day_of_week, bool(week.completed_days & bit)
+                ))
+    return missions_by_member
+
+
+def get_missions_from_rollup(member_ids, week_start):
+    weeks = MissionWeek.objects.filter(member_id__in=member_ids, week_start=week_start)
+    return build_missions_from_rollup(member_ids, week_start, weeks)
+
+
+async def aget_missions_from_rollup(member_ids, week_start):
+    weeks = [week async for week in MissionWeek.objects.filter(member_id__in=member_ids, week_start=week_start)]
+    return build_missions_from_rollup(member_ids, week_start, weeks)
+
+
+def record_missions(emotions):
+    # 새 감정 기록들의 요일 비트를 (회원, 주) 단위로 모아 켬
+    weeks = {}
+    for emotion in emotions:
+        week_start, _, bit = mission_slot(emotion.created_at)
+        week = weeks.setdefault((emotion.member_id_id, week_start), [0, 0])
+        week[0] |= bit
+        if emotion.is_complement:
+            week[1] |= bit
+    if not weeks:
+        return
+
+    with transaction.atomic():
+        MissionWeek.objects.bulk_create(
+            [MissionWeek(member_id_id=member_id, week_start=week_start) for member_id, week_start in weeks],
+            ignore_conflicts=True
+        )
+        for (member_id, week_start), (recorded_days, completed_days) in weeks.items():
+            MissionWeek.objects.filter(member_id=member_id, week_start=week_start).update(
+                recorded_days=F('recorded_days').bitor(recorded_days),
+                completed_days=F('completed_days').bitor(completed_days),
+                updated_at=timezone.now()
+            )
+
+
+def refresh_mission_day(member_id, created_at):
+    # 완료 여부 변경 / 삭제 시 해당 날짜의 비트를 원본 기록으로 다시 계산
+    week_start, day, bit = mission_slot(created_at)
+    with transaction.atomic():
+        counts = Emotion.objects.filter(
+            member_id=member_id,
+            created_at__gte=local_midnight(day),
+            created_at__lt=local_midnight(day + timedelta(days=1))
+        ).aggregate(
+            recorded=Count('id'),
+            completed=Count('id', filter=Q(is_complement=True))
+        )
+        weeks = MissionWeek.objects.filter(member_id=member_id, week_start=week_start)
+        if counts['recorded'] and not weeks.exists():
+            MissionWeek.objects.get_or_create(member_id_id=member_id, week_start=week_start)
+        weeks.update(
+            recorded_days=F('recorded_days').bitand(ALL_DAYS & ~bit).bitor(bit if counts['recorded'] else 0),
+            completed_days=F('completed_days').bitand(ALL_DAYS & ~bit).bitor(bit if counts['completed'] else 0),
+            updated_at=timezone.now()
+        )
+
+
+@receiver(post_save, sender=Emotion)
+def update_mission_week(sender, instance, created, **kwargs):
+    if created:
+        record_missions([instance])
+
+
+@receiver(post_delete, sender=Emotion)
+def remove_mission(sender, instance, **kwargs):
+    refresh_mission_day(instance.member_id_id, instance.created_at)
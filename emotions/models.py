@@ -9,6 +9,11 @@ class Interest(models.Model):
     interests = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['member_id', '-created_at', '-id'], name='interest_member_created_idx'),
+        ]
+
 
 class Emotion(models.Model):
     member_id = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
@@ -32,6 +37,51 @@ class Emotion(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['member_id', '-created_at', '-id'], name='emotion_member_created_idx'),
+        ]
+
+
+class MissionWeek(models.Model):
+    # 주간 미션 보드 집계 (비트 0 = 일요일 ... 비트 6 = 토요일)
+    member_id = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    week_start = models.DateField()
+    recorded_days = models.PositiveSmallIntegerField(default=0)
+    completed_days = models.PositiveSmallIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('member_id', 'week_start')
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+
+
+class MemberTagDay(models.Model):
+    # 회원별 / 날짜별 해시태그 사용 횟수
+    member_id = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE)
+    day = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('member_id', 'tag', 'day')
+
+
+class TagDay(models.Model):
+    # 전체 회원의 날짜별 해시태그 사용 횟수
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE)
+    day = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('tag', 'day')
+        indexes = [
+            models.Index(fields=['day'], name='tagday_day_idx'),
+        ]
+
 
 @receiver(post_save, sender=Emotion)
 def create_interest(sender, instance, created, **kwargs):
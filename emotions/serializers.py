@@ -1,6 +1,9 @@
 from rest_framework import serializers
+from django.contrib.auth import get_user_model
 from .models import Emotion, Interest
 
+User = get_user_model()
+
 class EmotionSerializers(serializers.ModelSerializer):
     class Meta:
         model = Emotion
@@ -15,4 +18,26 @@ class InterestSerializers(serializers.ModelSerializer):
 class MissionSerializers(serializers.ModelSerializer):
     class Meta:
         model = Emotion
-        fields = ('is_complement', )
\ No newline at end of file
+        fields = ('is_complement', )
+
+
+class PrefetchedMemberField(serializers.PrimaryKeyRelatedField):
+    # context['members']에 미리 조회한 회원에서 찾아 항목마다 쿼리하지 않음
+    def to_internal_value(self, data):
+        members = self.context.get('members')
+        if members is None:
+            return super().to_internal_value(data)
+
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            member = members.get(int(data))
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        if member is None:
+            self.fail('does_not_exist', pk_value=data)
+        return member
+
+
+class BulkEmotionSerializers(EmotionSerializers):
+    member_id = PrefetchedMemberField(queryset=User.objects.all())
@@ -0,0 +1,148 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+from infertilitytests.models import Infertility
+from .models import Emotion
+
+MANIFEST_NAME = 'manifest.json'
+SNAPSHOT_FORMAT = 1
+
+# 테이블별 (모델, [(컬럼, dtype)]) / created_at은 UTC epoch 마이크로초
+SNAPSHOT_TABLES = {
+    'emotion': (Emotion, [
+        ('id', '<i8'), ('member_id', '<i8'), ('created_at', '<i8'), ('is_complement', '|u1'),
+        ('joy', '<i4'), ('sadness', '<i4'), ('anger', '<i4'), ('fear', '<i4'), ('surprise', '<i4'), ('disgust', '<i4'),
+        ('total', '<i4'), ('social', '<i4'), ('sexual', '<i4'), ('relational', '<i4'), ('refusing', '<i4'),
+        ('essential', '<i4'),
+    ]),
+    'infertility': (Infertility, [
+        ('id', '<i8'), ('member_id', '<i8'), ('created_at', '<i8'),
+        ('total', '<i4'), ('social', '<i4'), ('sexual', '<i4'), ('relational', '<i4'), ('refusing', '<i4'),
+        ('essential', '<i4'),
+    ]),
+}
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def to_epoch_micros(value):
+    delta = value - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def read_manifest(path):
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return {"format": SNAPSHOT_FORMAT, "tables": {}}
+    with open(manifest_path) as manifest_file:
+        return json.load(manifest_file)
+
+
+def write_manifest(path, manifest):
+    # 임시 파일에 쓴 뒤 교체해 중간에 실패해도 이전 manifest가 남도록
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    with open(manifest_path + '.tmp', 'w') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    os.replace(manifest_path + '.tmp', manifest_path)
+
+
+def column_path(path, table, column):
+    return os.path.join(path, table, f'{column}.bin')
+
+
+def export_table(path, table, table_manifest, chunk_size, lag):
+    # last_id 이후의 행만 서버 사이드 커서로 읽어 컬럼 파일 끝에 덧붙임
+    # id는 커밋 전에 발급되므로 더 작은 id가 나중에 커밋될 수 있음 / 최근 lag 동안 생성된 행을 만나면 거기서 멈추고
+    # 다음 실행에서 그 행부터 다시 읽음 (lag보다 오래 열려 있는 트랜잭션의 행은 놓칠 수 있음)
+    model, columns = SNAPSHOT_TABLES[table]
+    os.makedirs(os.path.join(path, table), exist_ok=True)
+    rows = table_manifest.get('rows', 0)
+    last_id = table_manifest.get('last_id', 0)
+
+    files = {}
+    for column, dtype in columns:
+        file_path = column_path(path, table, column)
+        column_file = open(file_path, 'ab')
+        # manifest에 기록되지 않은 (이전 실행이 실패하며 남은) 꼬리는 잘라냄
+        column_file.truncate(rows * np.dtype(dtype).itemsize)
+        files[column] = column_file
+
+    names = [column if column != 'member_id' else 'member_id_id' for column, _ in columns]
+    created_at = names.index('created_at')
+    cutoff = timezone.now() - lag
+    queryset = model.objects.filter(id__gt=last_id).order_by('id').values_list(*names)
+
+    exported = 0
+    try:
+        chunk = []
+        for row in queryset.iterator(chunk_size=chunk_size):
+            if row[created_at] >= cutoff:
+                break
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                last_id = write_chunk(files, columns, chunk)
+                exported += len(chunk)
+                chunk = []
+        if chunk:
+            last_id = write_chunk(files, columns, chunk)
+            exported += len(chunk)
+    finally:
+        for column_file in files.values():
+            column_file.close()
+
+    return {
+        "rows": rows + exported,
+        "last_id": last_id,
+        "exported_at": datetime.now(dt_timezone.utc).isoformat(),
+        "columns": {
+            column: {"dtype": dtype, "file": os.path.join(table, f'{column}.bin')}
+            for column, dtype in columns
+        }
+    }, exported
+
+
+def write_chunk(files, columns, chunk):
+    values = list(zip(*chunk))
+    for index, (column, dtype) in enumerate(columns):
+        column_values = values[index]
+        if column == 'created_at':
+            column_values = [to_epoch_micros(value) for value in column_values]
+        np.asarray(column_values, dtype=dtype).tofile(files[column])
+        files[column].flush()
+    return chunk[-1][0]
+
+
+def export_snapshot(path, tables=None, chunk_size=10000, lag=None):
+    # lag: 커밋 대기 여유 시간 (timedelta, 기본값 SNAPSHOT_EXPORT_LAG초)
+    if lag is None:
+        lag = timedelta(seconds=settings.SNAPSHOT_EXPORT_LAG)
+    os.makedirs(path, exist_ok=True)
+    manifest = read_manifest(path)
+    exported = {}
+    for table in tables or SNAPSHOT_TABLES:
+        table_manifest, count = export_table(path, table, manifest["tables"].get(table, {}), chunk_size, lag)
+        manifest["tables"][table] = table_manifest
+        write_manifest(path, manifest)
+        exported[table] = count
+    return exported
+
+
+def load_snapshot(path, table):
+    # 분석용 / 컬럼별 메모리 맵 배열 사전 (DB 접근 없음)
+    table_manifest = read_manifest(path)["tables"][table]
+    rows = table_manifest["rows"]
+    columns = {}
+    for column, info in table_manifest["columns"].items():
+        if rows == 0:
+            # 빈 파일은 mmap 할 수 없음
+            columns[column] = np.empty(0, dtype=info["dtype"])
+            continue
+        columns[column] = np.memmap(
+            os.path.join(path, info["file"]), dtype=info["dtype"], mode='r', shape=(rows,)
+        )
+    return columns
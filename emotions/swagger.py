@@ -0,0 +1,443 @@
+# Swagger(drf_yasg) 문서 주석 / 스키마를 만들 때만 import (hahahoho.openapi.load_annotations)
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+
+from . import views
+from .serializers import EmotionSerializers, InterestSerializers
+from .tags import DEFAULT_LIMIT, DEFAULT_TRENDING_DAYS, MAX_LIMIT
+from .trends import DEFAULT_SPAN, DEFAULT_TREND_DAYS, DEFAULT_WINDOW, MAX_TREND_DAYS, SCORE_FIELDS
+
+
+swagger_auto_schema(
+    method='post',
+    operation_description="감정기록 분석 결과 등록 API",
+    request_body=EmotionSerializers,
+    responses={
+        201: openapi.Response(
+            description="감정기록 분석 결과 등록 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "id": 1,
+                        "mission_content": "남편과 산책하기",
+                        "is_complement": False,
+                        "interest_keyword": "#꽃 #결혼 #아이",
+                        "self_message": "내일도 화이팅",
+                        "export_message": "너도 힘내",
+                        "joy": 70,
+                        "sadness": 10,
+                        "anger": 10,
+                        "fear": 1,
+                        "surprise": 30,
+                        "disgust": 10,
+                        "total": 100,
+                        "social": 10,
+                        "sexual": 10,
+                        "relational": 10,
+                        "refusing": 10,
+                        "essential": 10,
+                        "member_id": 1
+                    }
+                }
+            }
+        ),
+        400: openapi.Response(description="유효성 검사 실패")
+    }
+)(views.handle_emotion)
+
+
+swagger_auto_schema(
+    method='post',
+    operation_description="감정기록 분석 결과 일괄 등록 API (항목별 성공 여부 반환)",
+    request_body=EmotionSerializers(many=True),
+    responses={
+        201: openapi.Response(
+            description="모든 항목 등록 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": [
+                        {"index": 0, "success": True, "id": 1},
+                        {"index": 1, "success": True, "id": 2}
+                    ]
+                }
+            }
+        ),
+        207: openapi.Response(
+            description="일부 항목만 등록 성공",
+            examples={
+                "application/json": {
+                    "success": False,
+                    "result": [
+                        {"index": 0, "success": True, "id": 3},
+                        {"index": 1, "success": False, "errors": {"joy": ["이 필드는 필수 항목입니다."]}}
+                    ]
+                }
+            }
+        ),
+        400: openapi.Response(description="요청 형식 오류 또는 모든 항목 유효성 검사 실패")
+    }
+)(views.bulk_emotion)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description="감정기록 분석 결과 상세 조회 API",
+    responses={
+        200: openapi.Response(
+            description="감정 기록 조회 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "id": 1,
+                        "mission_content": "남편과 산책하기",
+                        "is_complement": False,
+                        "interest_keyword": "#꽃 #결혼 #아이",
+                        "self_message": "내일도 화이팅",
+                        "export_message": "너도 힘내",
+                        "joy": 70,
+                        "sadness": 10,
+                        "anger": 10,
+                        "fear": 1,
+                        "surprise": 30,
+                        "disgust": 10,
+                        "total": 100,
+                        "social": 10,
+                        "sexual": 10,
+                        "relational": 10,
+                        "refusing": 10,
+                        "essential": 10,
+                        "member_id": 1
+                    }
+                }
+            }
+        ),
+        404: openapi.Response(description="감정 기록이 존재하지 않습니다.")
+    }
+)(views.emotion_detail)
+
+
+swagger_auto_schema(
+    method='put',
+    operation_description="감정기록 분석 수정 API",
+    request_body=EmotionSerializers,
+    responses={
+        200: openapi.Response(
+            description="감정 기록 업데이트 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "id": 1,
+                        "mission_content": "남편과 산책하기",
+                        "is_complement": True,
+                        "interest_keyword": "#꽃 #결혼 #아이",
+                        "self_message": "내일도 화이팅",
+                        "export_message": "너도 힘내",
+                        "joy": 70,
+                        "sadness": 10,
+                        "anger": 10,
+                        "fear": 1,
+                        "surprise": 30,
+                        "disgust": 10,
+                        "total": 100,
+                        "social": 10,
+                        "sexual": 10,
+                        "relational": 10,
+                        "refusing": 10,
+                        "essential": 10,
+                        "member_id": 1
+                    }
+                }
+            }
+        ),
+        400: openapi.Response(description="유효성 검사 실패")
+    }
+)(views.emotion_detail)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description="특정 회원의 관심사 조회 API (최신순, 기본 20개씩 페이지 조회 / 전체 목록은 stream=true)",
+    manual_parameters=[
+        openapi.Parameter(
+            'member_id',
+            openapi.IN_QUERY,
+            description="관심사를 조회할 사용자의 ID",
+            type=openapi.TYPE_INTEGER,
+            required=True
+        ),
+        openapi.Parameter(
+            'cursor',
+            openapi.IN_QUERY,
+            description="이전 응답의 next_cursor 값 (없으면 첫 페이지)",
+            type=openapi.TYPE_STRING,
+            required=False
+        ),
+        openapi.Parameter(
+            'page_size',
+            openapi.IN_QUERY,
+            description="한 페이지에 담을 관심사 개수 (기본 20, 최대 100)",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        ),
+        openapi.Parameter(
+            'stream',
+            openapi.IN_QUERY,
+            description="true이면 전체 관심사를 NDJSON(application/x-ndjson)으로 스트리밍",
+            type=openapi.TYPE_BOOLEAN,
+            required=False
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="관심사 조회 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": [
+                        {
+                            "id": 3,
+                            "interests": "#이거 #어떻게 #나올라나",
+                            "created_at": "2024-10-27T19:27:41.890077+09:00",
+                            "member_id": 2
+                        },
+                        {
+                            "id": 2,
+                            "interests": "#배고파 #진짜 #많이",
+                            "created_at": "2024-10-27T19:27:05.426330+09:00",
+                            "member_id": 2
+                        }
+                    ],
+                    "next_cursor": "WyIyMDI0LTEwLTI3VDEwOjI3OjA1LjQyNjMzMCswMDowMCIsIDJd"
+                }
+            }
+        ),
+        204: openapi.Response(description="등록된 관심사가 없습니다.")
+    }
+)(views.handle_interest)
+
+
+swagger_auto_schema(
+    method='post',
+    operation_description="관심사 등록 API",
+    request_body=InterestSerializers,
+    responses={
+        201: openapi.Response(
+            description="관심사 생성 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "id": 3,
+                        "interests": "#이거 #어떻게 #나올라나",
+                        "created_at": "2024-10-27T19:27:41.890077+09:00",
+                        "member_id": 2
+                    }
+                }
+            }
+        ),
+        400: openapi.Response(description="유효성 검사 실패")
+    }
+)(views.handle_interest)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description="감정 / 스트레스 점수 추이 조회 API (일별 평균, 이동평균, 지수이동평균, 전일 대비 변화량)",
+    manual_parameters=[
+        openapi.Parameter(
+            'member_id',
+            openapi.IN_QUERY,
+            description="추이를 조회할 사용자의 ID",
+            type=openapi.TYPE_INTEGER,
+            required=True
+        ),
+        openapi.Parameter(
+            'days',
+            openapi.IN_QUERY,
+            description=f"최근 n일 (기본값 {DEFAULT_TREND_DAYS}, 최대 {MAX_TREND_DAYS})",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        ),
+        openapi.Parameter(
+            'window',
+            openapi.IN_QUERY,
+            description=f"이동평균 구간 (기록된 날 기준, 기본값 {DEFAULT_WINDOW})",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        ),
+        openapi.Parameter(
+            'span',
+            openapi.IN_QUERY,
+            description=f"지수이동평균 span (기본값 {DEFAULT_SPAN})",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="감정 추이 조회 성공 / series에는 " + ", ".join(SCORE_FIELDS) + " 점수가 모두 포함됨",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "dates": ["2024-11-17", "2024-11-18"],
+                        "series": {
+                            "joy": {
+                                "mean": [70.0, 60.0],
+                                "rolling_mean": [70.0, 65.0],
+                                "ewma": [70.0, 64.29],
+                                "delta": [None, -10.0]
+                            }
+                        }
+                    }
+                }
+            }
+        ),
+        404: openapi.Response(description="등록된 감정 기록이 없습니다.")
+    }
+)(views.emotion_trends)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description="회원이 가장 많이 사용한 해시태그 조회 API",
+    manual_parameters=[
+        openapi.Parameter(
+            'member_id',
+            openapi.IN_QUERY,
+            description="해시태그를 조회할 사용자의 ID",
+            type=openapi.TYPE_INTEGER,
+            required=True
+        ),
+        openapi.Parameter(
+            'limit',
+            openapi.IN_QUERY,
+            description=f"조회할 해시태그 개수 (기본값 {DEFAULT_LIMIT}, 최대 {MAX_LIMIT})",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        ),
+        openapi.Parameter(
+            'days',
+            openapi.IN_QUERY,
+            description="최근 n일 동안의 기록만 집계 (기본값 전체 기간)",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="해시태그 조회 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": [
+                        {"tag": "아이", "count": 12},
+                        {"tag": "꽃", "count": 5}
+                    ]
+                }
+            }
+        )
+    }
+)(views.member_tags)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description="전체 회원의 인기 해시태그 조회 API",
+    manual_parameters=[
+        openapi.Parameter(
+            'days',
+            openapi.IN_QUERY,
+            description=f"최근 n일 동안의 기록만 집계 (기본값 {DEFAULT_TRENDING_DAYS})",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        ),
+        openapi.Parameter(
+            'limit',
+            openapi.IN_QUERY,
+            description=f"조회할 해시태그 개수 (기본값 {DEFAULT_LIMIT}, 최대 {MAX_LIMIT})",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="인기 해시태그 조회 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": [
+                        {"tag": "결혼", "count": 320},
+                        {"tag": "아이", "count": 287}
+                    ]
+                }
+            }
+        )
+    }
+)(views.trending_tags)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description=(
+        "부부의 주간 미션 완료 여부 조회 API\n\n"
+        "요일마다 기록한 날은 항목 하나, 기록하지 않은 날은 빈 목록입니다. "
+        "하루에 기록이 여러 개여도 항목은 하나이며, 그중 하나라도 완료했으면 is_complement가 true입니다. "
+        "week_offset 조회와 from / to 조회의 응답 형식은 같습니다."
+    ),
+    manual_parameters=[
+        openapi.Parameter(
+            'member_id',
+            openapi.IN_QUERY,
+            description="미션을 조회할 사용자의 ID",
+            type=openapi.TYPE_INTEGER,
+            required=True
+        ),
+        openapi.Parameter(
+            'week_offset',
+            openapi.IN_QUERY,
+            description="이번 주 기준 주 단위 이동 (-1: 지난주, 기본값 0)",
+            type=openapi.TYPE_INTEGER,
+            required=False
+        ),
+        openapi.Parameter(
+            'from',
+            openapi.IN_QUERY,
+            description="조회 시작일 (YYYY-MM-DD, week_offset 대신 사용)",
+            type=openapi.TYPE_STRING,
+            required=False
+        ),
+        openapi.Parameter(
+            'to',
+            openapi.IN_QUERY,
+            description="조회 종료일 (YYYY-MM-DD, 종료일 포함, from부터 최대 7일)",
+            type=openapi.TYPE_STRING,
+            required=False
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="미션 조회 성공",
+            examples={
+                "application/json": {
+                    "user_is_complement": {
+                        "SUN": [],
+                        "MON": [{"is_complement": True, "created_at": "2024-11-18, MON"}],
+                        "TUE": [], "WED": [], "THU": [], "FRI": [], "SAT": []
+                    },
+                    "spouse_is_complement": {
+                        "SUN": [], "MON": [], "TUE": [], "WED": [], "THU": [], "FRI": [], "SAT": []
+                    },
+                    "from": "2024-11-17",
+                    "to": "2024-11-23"
+                }
+            }
+        ),
+        400: openapi.Response(description="조회 기간이 올바르지 않습니다."),
+        404: openapi.Response(description="부부 정보가 존재하지 않습니다.")
+    }
+)(views.get_missions)
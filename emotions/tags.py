@@ -0,0 +1,145 @@
+import operator
+import re
+from collections import Counter
+from datetime import timedelta
+from functools import reduce
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from hahahoho.counters import increment
+from .models import Interest, MemberTagDay, Tag, TagDay
+
+TAG_PATTERN = re.compile(r'#([^\s#]+)')
+TAG_MAX_LENGTH = 100
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 100
+DEFAULT_TRENDING_DAYS = 7
+MAX_DAYS = 365 * 10
+# UPDATE 한 번에 반영할 카운터 수 (조건이 너무 길어지지 않도록)
+COUNTER_BATCH_SIZE = 200
+
+
+def parse_tags(text):
+    # "#꽃 #결혼 #아이" -> {'꽃': 1, '결혼': 1, '아이': 1}
+    return Counter(name[:TAG_MAX_LENGTH] for name in TAG_PATTERN.findall(text or ''))
+
+
+def counter_batches(counts):
+    items = list(counts.items())
+    for start in range(0, len(items), COUNTER_BATCH_SIZE):
+        yield dict(items[start:start + COUNTER_BATCH_SIZE])
+
+
+def counter_rows(model, counts, key_fields):
+    # (해당 키의 카운터 행, 키별 증감량 Case/When)
+    conditions = [Q(**dict(zip(key_fields, key))) for key in counts]
+    amounts = Case(
+        *[When(condition, then=Value(count)) for condition, count in zip(conditions, counts.values())],
+        default=Value(0), output_field=IntegerField()
+    )
+    return model.objects.filter(reduce(operator.or_, conditions)), amounts
+
+
+def increment_counters(model, counts, key_fields):
+    # 행을 먼저 만들어 두고 UPDATE 한 번(Case/When)으로 더해 동시 저장에도 횟수가 유실되지 않도록
+    for batch in counter_batches(counts):
+        model.objects.bulk_create(
+            [model(**dict(zip(key_fields, key))) for key in batch],
+            ignore_conflicts=True
+        )
+        rows, amounts = counter_rows(model, batch, key_fields)
+        increment(rows, 'count', amounts)
+
+
+def decrement_counters(model, counts, key_fields):
+    # 0 아래로 내려가지 않도록 빼고 0이 된 행은 삭제
+    for batch in counter_batches(counts):
+        rows, amounts = counter_rows(model, batch, key_fields)
+        rows.update(count=Greatest(F('count') - amounts, Value(0)))
+        rows.filter(count=0).delete()
+
+
+def count_tags(interests):
+    # ({(회원 ID, 태그 이름, 날짜): 횟수}, {(태그 이름, 날짜): 횟수})
+    member_counts = Counter()
+    tag_counts = Counter()
+    for interest in interests:
+        day = timezone.localtime(interest.created_at).date()
+        for name, count in parse_tags(interest.interests).items():
+            member_counts[(interest.member_id_id, name, day)] += count
+            tag_counts[(name, day)] += count
+    return member_counts, tag_counts
+
+
+def update_counters(update, member_counts, tag_counts, tag_ids):
+    update(
+        MemberTagDay,
+        {
+            (member_id, tag_ids[name], day): count
+            for (member_id, name, day), count in member_counts.items() if name in tag_ids
+        },
+        ('member_id_id', 'tag_id', 'day')
+    )
+    update(
+        TagDay,
+        {(tag_ids[name], day): count for (name, day), count in tag_counts.items() if name in tag_ids},
+        ('tag_id', 'day')
+    )
+
+
+def index_interests(interests):
+    # 관심사 문자열을 해시태그 단위로 나눠 회원별 / 전체 일별 카운터에 반영
+    member_counts, tag_counts = count_tags(interests)
+    if not tag_counts:
+        return
+
+    names = {name for name, _ in tag_counts}
+    with transaction.atomic():
+        Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+        tag_ids = dict(Tag.objects.filter(name__in=names).values_list('name', 'id'))
+        update_counters(increment_counters, member_counts, tag_counts, tag_ids)
+
+
+def unindex_interests(interests):
+    # 삭제된 관심사의 해시태그를 카운터에서 뺌
+    member_counts, tag_counts = count_tags(interests)
+    if not tag_counts:
+        return
+
+    names = {name for name, _ in tag_counts}
+    with transaction.atomic():
+        tag_ids = dict(Tag.objects.filter(name__in=names).values_list('name', 'id'))
+        if tag_ids:
+            update_counters(decrement_counters, member_counts, tag_counts, tag_ids)
+
+
+def get_member_top_tags(member_id, limit, days=None):
+    tags = MemberTagDay.objects.filter(member_id=member_id)
+    if days:
+        tags = tags.filter(day__gt=timezone.localdate() - timedelta(days=days))
+    return list(
+        tags.values('tag__name').annotate(total=Sum('count')).order_by('-total', 'tag__name')[:limit]
+    )
+
+
+def get_trending_tags(limit, days):
+    tags = TagDay.objects.filter(day__gt=timezone.localdate() - timedelta(days=days))
+    return list(
+        tags.values('tag__name').annotate(total=Sum('count')).order_by('-total', 'tag__name')[:limit]
+    )
+
+
+@receiver(post_save, sender=Interest)
+def index_interest_tags(sender, instance, created, **kwargs):
+    if created:
+        index_interests([instance])
+
+
+@receiver(post_delete, sender=Interest)
+def unindex_interest_tags(sender, instance, **kwargs):
+    unindex_interests([instance])
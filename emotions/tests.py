@@ -1,3 +1,619 @@
-from django.test import TestCase
+import base64
+import json
+import tempfile
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from accounts.models import Couple
+from hahahoho.testutils import QueryPlanAssertionsMixin, create_members
+from .bulk import validate_emotions
+from .missions import DAY_LIST, get_custom_range
+from .models import Emotion, Interest, MemberTagDay, MissionWeek, TagDay
+from .serializers import EmotionSerializers, InterestSerializers
+from .snapshots import export_snapshot, load_snapshot
+from .trends import SCORE_FIELDS, compute_trends
+from .tags import MAX_DAYS
+
+MEMBER_COUNT = 200
+ROWS_PER_MEMBER = 50
+
+
+def build_emotion(member):
+    return Emotion(
+        member_id=member,
+        mission_content="남편과 산책하기",
+        is_complement=False,
+        interest_keyword="#꽃 #결혼 #아이",
+        self_message="내일도 화이팅",
+        export_message="너도 힘내",
+        joy=70, sadness=10, anger=10, fear=1, surprise=30, disgust=10,
+        total=100, social=10, sexual=10, relational=10, refusing=10, essential=10
+    )
+
+
+class EmotionQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.members = create_members(MEMBER_COUNT)
+        Couple.objects.bulk_create([
+            Couple(wife=cls.members[i], husband=cls.members[i + 1])
+            for i in range(0, MEMBER_COUNT, 2)
+        ])
+        Emotion.objects.bulk_create([
+            build_emotion(member) for member in cls.members for _ in range(ROWS_PER_MEMBER)
+        ])
+        Interest.objects.bulk_create([
+            Interest(member_id=member, interests="#꽃 #결혼 #아이")
+            for member in cls.members for _ in range(ROWS_PER_MEMBER)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.member = self.members[0]
+        self.analyze_tables('emotions_emotion', 'emotions_interest', 'emotions_missionweek')
+
+    def test_handle_emotion_uses_member_index(self):
+        response, queries = self.capture_queries(
+            self.client.get, '/emotions/results/', {'member_id': self.member.id}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assert_indexed_plans(queries, 'emotions_emotion')
+
+    def test_get_missions_uses_member_index(self):
+        response, queries = self.capture_queries(
+            self.client.get, '/emotions/missions/', {'member_id': self.member.id}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assert_indexed_plans(queries, 'emotions_missionweek')
+
+        today = timezone.localdate().isoformat()
+        response, queries = self.capture_queries(
+            self.client.get, '/emotions/missions/', {'member_id': self.member.id, 'from': today, 'to': today}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assert_indexed_plans(queries, 'emotions_emotion')
+
+    def test_handle_interest_uses_member_index(self):
+        response, queries = self.capture_queries(
+            self.client.get, '/emotions/interests/', {'member_id': self.member.id}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assert_indexed_plans(queries, 'emotions_interest')
+
+        next_cursor = response.json()['next_cursor']
+        response, queries = self.capture_queries(
+            self.client.get, '/emotions/interests/', {'member_id': self.member.id, 'cursor': next_cursor}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assert_indexed_plans(queries, 'emotions_interest')
+
+    async def test_get_missions_async_matches_sync(self):
+        today = timezone.localdate().isoformat()
+        for params in ({'member_id': self.member.id}, {'member_id': self.member.id, 'from': today, 'to': today}):
+            response = await self.async_client.get('/emotions/missions/async/', params)
+            self.assertEqual(response.status_code, 200)
+            sync_response = await sync_to_async(self.client.get)('/emotions/missions/', params)
+            self.assertEqual(response.json(), sync_response.json())
+
+        response = await self.async_client.get('/emotions/missions/async/', {'member_id': 0})
+        self.assertEqual(response.status_code, 404)
+
+
+class InterestHistoryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, cls.other = create_members(2)
+        interests = Interest.objects.bulk_create([
+            Interest(member_id=member, interests=f"#관심사{index}")
+            for member in (cls.member, cls.other) for index in range(25)
+        ])
+        # 같은 시각의 기록이 많아도 id로 이어서 조회
+        now = timezone.now()
+        for index, interest in enumerate(interests):
+            Interest.objects.filter(pk=interest.pk).update(created_at=now - timedelta(hours=index % 3))
+        cls.expected = InterestSerializers(
+            Interest.objects.filter(member_id=cls.member).order_by('-created_at', '-id'), many=True
+        ).data
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def get(self, **params):
+        return self.client.get('/emotions/interests/', {'member_id': self.member.pk, **params})
+
+    def pages(self, **params):
+        pages = []
+        while True:
+            body = self.get(**params).json()
+            pages.append(body['result'])
+            if body['next_cursor'] is None:
+                return pages
+            params['cursor'] = body['next_cursor']
+
+    def test_default_page_size(self):
+        # 기본 20개씩 (이전에는 전체 목록)
+        pages = self.pages()
+        self.assertEqual([len(page) for page in pages], [20, 5])
+        self.assertEqual([row for page in pages for row in page], self.expected)
+
+    def test_page_size(self):
+        pages = self.pages(page_size=7)
+        self.assertEqual([len(page) for page in pages], [7, 7, 7, 4])
+        self.assertEqual([row for page in pages for row in page], self.expected)
+
+        with override_settings(PAGINATION_MAX_PAGE_SIZE=10):
+            self.assertEqual(len(self.get(page_size=100).json()['result']), 10)
+
+    def test_invalid_parameters(self):
+        # 형식이 틀린 커서 / base64는 맞지만 내용이 (created_at, id)가 아닌 커서
+        bad_cursor = base64.urlsafe_b64encode(b'[1, 2]').decode()
+        for params in ({'page_size': 0}, {'page_size': 'all'}, {'cursor': 'abc'}, {'cursor': bad_cursor}):
+            response = self.get(**params)
+            self.assertEqual(response.status_code, 400, params)
+
+    def test_empty(self):
+        body = self.client.get('/emotions/interests/', {'member_id': 0}).json()
+        self.assertEqual((body['result'], body['next_cursor']), ([], None))
+
+    def test_stream(self):
+        response = self.get(stream=1)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], self.expected)
+
+        # 커서 이후부터 이어서 스트리밍
+        cursor = self.get(page_size=10).json()['next_cursor']
+        response = self.get(stream='true', cursor=cursor)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], self.expected[10:])
+
+
+class TagCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.members = create_members(2)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def post_interest(self, member, interests):
+        response = self.client.post(
+            '/emotions/interests/', {'member_id': member.pk, 'interests': interests}, format='json'
+        )
+        self.assertEqual(response.status_code, 201)
+        return Interest.objects.get(pk=response.json()['result']['id'])
+
+    def top_tags(self, path, **params):
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        return {tag['tag']: tag['count'] for tag in response.json()['result']}
+
+    def test_counts_member_and_trending_tags(self):
+        first, second = self.members
+        self.post_interest(first, "#꽃 #결혼 #꽃")
+        self.post_interest(first, "#꽃")
+        self.post_interest(second, "#아이 #꽃")
+
+        self.assertEqual(self.top_tags('/emotions/tags/', member_id=first.pk), {'꽃': 3, '결혼': 1})
+        self.assertEqual(self.top_tags('/emotions/tags/trending/'), {'꽃': 4, '결혼': 1, '아이': 1})
+
+    def test_counters_updated_in_one_query_per_table(self):
+        # 회원 조회, 저장, savepoint, 태그 생성 / 조회, 회원별 / 전체 카운터(행 생성 + UPDATE 한 번씩), release
+        # 태그 수와 관계없이 일정
+        with self.assertNumQueries(10):
+            response = self.client.post(
+                '/emotions/interests/',
+                {'member_id': self.members[0].pk, 'interests': "#꽃 #결혼 #아이 #하늘 #바다"}, format='json'
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(MemberTagDay.objects.filter(count=1).count(), 5)
+
+    def test_delete_decrements_counters(self):
+        first, second = self.members
+        kept = self.post_interest(first, "#꽃")
+        removed = self.post_interest(first, "#꽃 #결혼")
+        self.post_interest(second, "#결혼")
+
+        removed.delete()
+        self.assertEqual(self.top_tags('/emotions/tags/', member_id=first.pk), {'꽃': 1})
+        self.assertEqual(self.top_tags('/emotions/tags/trending/'), {'꽃': 1, '결혼': 1})
+
+        kept.delete()
+        self.assertFalse(MemberTagDay.objects.filter(member_id=first).exists())
+        self.assertEqual(list(TagDay.objects.values_list('tag__name', 'count')), [('결혼', 1)])
+
+    def test_days_limit(self):
+        self.post_interest(self.members[0], "#꽃")
+        for path in ('/emotions/tags/', '/emotions/tags/trending/'):
+            self.assertEqual(self.top_tags(path, member_id=self.members[0].pk, days=10 ** 12), {'꽃': 1})
+            self.assertEqual(self.client.get(path, {'days': 0}).status_code, 400)
+        self.assertEqual(self.top_tags('/emotions/tags/trending/', days=MAX_DAYS), {'꽃': 1})
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=dt_timezone.utc)
+
+
+def create_emotion_at(member, created_at, is_complement=False):
+    emotion = build_emotion(member)
+    emotion.is_complement = is_complement
+    with mock.patch('django.utils.timezone.now', return_value=created_at):
+        emotion.save()
+    return emotion
+
+
+class MissionWeekTests(TestCase):
+    # 2024-03-03(일)부터 한 주 / 시각은 UTC, 보드는 Asia/Seoul 기준
+    WEEK = date(2024, 3, 3)
+    NEXT_WEEK = date(2024, 3, 10)
+    MON, WED = 1 << 1, 1 << 3
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, cls.spouse = create_members(2)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def weeks(self):
+        return {
+            (week.member_id_id, week.week_start): (week.recorded_days, week.completed_days)
+            for week in MissionWeek.objects.all()
+        }
+
+    def put(self, emotion, is_complement):
+        response = self.client.put(
+            f'/emotions/results/{emotion.pk}/', {'is_complement': is_complement}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_create_sets_bits(self):
+        create_emotion_at(self.member, utc(2024, 3, 4, 3))
+        create_emotion_at(self.member, utc(2024, 3, 4, 5), is_complement=True)
+        # 토요일 16시(UTC)는 서울 기준 일요일 새벽 -> 다음 주 첫 비트
+        create_emotion_at(self.member, utc(2024, 3, 9, 16))
+        create_emotion_at(self.spouse, utc(2024, 3, 6, 3))
+
+        self.assertEqual(self.weeks(), {
+            (self.member.pk, self.WEEK): (self.MON, self.MON),
+            (self.member.pk, self.NEXT_WEEK): (1, 0),
+            (self.spouse.pk, self.WEEK): (self.WED, 0),
+        })
+
+    def test_put_sets_and_clears_completed_bit(self):
+        first = create_emotion_at(self.member, utc(2024, 3, 4, 3))
+        second = create_emotion_at(self.member, utc(2024, 3, 4, 5))
+
+        self.put(first, True)
+        self.assertEqual(self.weeks(), {(self.member.pk, self.WEEK): (self.MON, self.MON)})
+        self.put(second, True)
+        self.put(first, False)
+        # 같은 날 완료한 기록이 남아 있으면 유지
+        self.assertEqual(self.weeks(), {(self.member.pk, self.WEEK): (self.MON, self.MON)})
+        self.put(second, False)
+        self.assertEqual(self.weeks(), {(self.member.pk, self.WEEK): (self.MON, 0)})
+
+    def test_delete_clears_bits(self):
+        first = create_emotion_at(self.member, utc(2024, 3, 4, 3), is_complement=True)
+        second = create_emotion_at(self.member, utc(2024, 3, 4, 5))
+        create_emotion_at(self.member, utc(2024, 3, 6, 3))
+
+        first.delete()
+        self.assertEqual(self.weeks(), {(self.member.pk, self.WEEK): (self.MON | self.WED, 0)})
+        second.delete()
+        self.assertEqual(self.weeks(), {(self.member.pk, self.WEEK): (self.WED, 0)})
+
+    def test_backfill_matches_live_rollup(self):
+        emotions = [
+            create_emotion_at(member, utc(2024, 3, day, hour), is_complement=(day + hour) % 3 == 0)
+            for member in (self.member, self.spouse)
+            for day in range(1, 15)
+            for hour in (3, 16)
+        ]
+        for emotion in emotions[::5]:
+            self.put(emotion, not emotion.is_complement)
+        for emotion in emotions[::7]:
+            emotion.delete()
+        live = {key: days for key, days in self.weeks().items() if days[0]}
+
+        self.assertEqual(len(live), 6)
+
+        for options in ({}, {'batch_size': 1}):
+            MissionWeek.objects.all().delete()
+            call_command('backfill_mission_weeks', stdout=StringIO(), **options)
+            self.assertEqual(self.weeks(), live)
+
+        MissionWeek.objects.filter(member_id=self.spouse).update(recorded_days=0, completed_days=0)
+        call_command('backfill_mission_weeks', member=self.spouse.pk, stdout=StringIO())
+        self.assertEqual(self.weeks(), live)
+
+
+class MissionBoardTests(TestCase):
+    # 오늘은 2024-03-14(목) / 이번 주는 03-10(일)부터
+    TODAY = date(2024, 3, 14)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, cls.spouse = create_members(2)
+        Couple.objects.create(wife=cls.member, husband=cls.spouse)
+        create_emotion_at(cls.member, utc(2024, 3, 4, 3), is_complement=True)
+        create_emotion_at(cls.member, utc(2024, 3, 4, 5))
+        create_emotion_at(cls.spouse, utc(2024, 3, 6, 3))
+        create_emotion_at(cls.spouse, utc(2024, 3, 6, 5))
+        create_emotion_at(cls.member, utc(2024, 3, 12, 3))
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        patcher = mock.patch('django.utils.timezone.localdate', return_value=self.TODAY)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self, **params):
+        return self.client.get('/emotions/missions/', {'member_id': self.member.pk, **params})
+
+    def board(self, missions):
+        return {day: entries for day, entries in missions.items() if entries}
+
+    def test_week_offset(self):
+        body = self.get().json()
+        self.assertEqual((body['from'], body['to']), ('2024-03-10', '2024-03-16'))
+        self.assertEqual(self.board(body['user_is_complement']), {
+            'TUE': [{'is_complement': False, 'created_at': '2024-03-12, TUE'}]
+        })
+        self.assertEqual(self.board(body['spouse_is_complement']), {})
+
+        body = self.get(week_offset=-1).json()
+        self.assertEqual((body['from'], body['to']), ('2024-03-03', '2024-03-09'))
+        self.assertEqual(self.board(body['user_is_complement']), {
+            'MON': [{'is_complement': True, 'created_at': '2024-03-04, MON'}]
+        })
+        self.assertEqual(self.board(body['spouse_is_complement']), {
+            'WED': [{'is_complement': False, 'created_at': '2024-03-06, WED'}]
+        })
+
+        self.assertEqual(self.get(week_offset='last').status_code, 400)
+
+    def test_custom_range(self):
+        # 주 경계를 넘는 7일 (수 ~ 다음 주 화)
+        body = self.get(**{'from': '2024-03-06', 'to': '2024-03-12'}).json()
+        self.assertEqual((body['from'], body['to']), ('2024-03-06', '2024-03-12'))
+        self.assertEqual(self.board(body['user_is_complement']), {
+            'TUE': [{'is_complement': False, 'created_at': '2024-03-12, TUE'}]
+        })
+        self.assertEqual(self.board(body['spouse_is_complement']), {
+            'WED': [{'is_complement': False, 'created_at': '2024-03-06, WED'}]
+        })
+
+        # from만 주면 그 하루
+        body = self.get(**{'from': '2024-03-04'}).json()
+        self.assertEqual((body['from'], body['to']), ('2024-03-04', '2024-03-04'))
+        self.assertEqual(self.board(body['user_is_complement']), {
+            'MON': [{'is_complement': True, 'created_at': '2024-03-04, MON'}]
+        })
+
+    def test_week_and_range_agree(self):
+        # 하루에 기록이 여러 개여도 두 방식 모두 하루에 항목 하나
+        week = self.get(week_offset=-1).json()
+        self.assertEqual(self.get(**{'from': '2024-03-03', 'to': '2024-03-09'}).json(), week)
+        self.assertEqual(self.get(**{'from': '2024-03-04', 'to': '2024-03-06'}).json()['user_is_complement'], {
+            **{day: [] for day in DAY_LIST}, 'MON': [{'is_complement': True, 'created_at': '2024-03-04, MON'}]
+        })
+
+    def test_invalid_range(self):
+        for params in (
+            {'from': '2024-03-04', 'to': '2024-03-11'},
+            {'from': '2024-03-12', 'to': '2024-03-06'},
+            {'from': '2024-13-01'},
+            {'to': '03/12/2024'},
+        ):
+            self.assertEqual(self.get(**params).status_code, 400, params)
+
+    def test_get_custom_range(self):
+        self.assertIsNone(get_custom_range({}))
+        self.assertEqual(get_custom_range({'to': '2024-03-12'}), (date(2024, 3, 12), date(2024, 3, 12)))
+        self.assertEqual(
+            get_custom_range({'from': '2024-03-06', 'to': '2024-03-12'}), (date(2024, 3, 6), date(2024, 3, 12))
+        )
+        with self.assertRaises(ValidationError):
+            get_custom_range({'from': '2024-03-06', 'to': '2024-03-13'})
+
+    async def test_async_matches_sync(self):
+        for params in ({}, {'week_offset': -1}, {'from': '2024-03-06', 'to': '2024-03-12'}):
+            params = {'member_id': self.member.pk, **params}
+            response = await self.async_client.get('/emotions/missions/async/', params)
+            self.assertEqual(response.status_code, 200)
+            sync_response = await sync_to_async(self.client.get)('/emotions/missions/', params)
+            self.assertEqual(response.json(), sync_response.json())
+
+        response = await self.async_client.get(
+            '/emotions/missions/async/', {'member_id': self.member.pk, 'from': '2024-03-01', 'to': '2024-03-31'}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class BulkEmotionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.members = create_members(2)
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def item(self, member, **fields):
+        return {**EmotionSerializers(build_emotion(member)).data, 'member_id': member.pk, **fields}
+
+    def post(self, items):
+        return self.client.post('/emotions/results/bulk/', items, format='json')
+
+    def test_all_valid(self):
+        items = [self.item(member, is_complement=True) for member in self.members for _ in range(2)]
+        response = self.post(items)
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertTrue(body['success'])
+        self.assertEqual([result['index'] for result in body['result']], [0, 1, 2, 3])
+        self.assertEqual(
+            sorted(result['id'] for result in body['result']), list(Emotion.objects.values_list('id', flat=True))
+        )
+        # 시그널 대신 직접 반영한 관심사 / 해시태그 / 주간 미션 집계
+        self.assertEqual(Interest.objects.count(), 4)
+        self.assertEqual(dict(TagDay.objects.values_list('tag__name', 'count')), {'꽃': 4, '결혼': 4, '아이': 4})
+        self.assertEqual(MissionWeek.objects.count(), 2)
+
+    def test_mixed(self):
+        response = self.post([self.item(self.members[0]), self.item(self.members[1], joy='많이')])
+        self.assertEqual(response.status_code, 207)
+        first, second = response.json()['result']
+        self.assertEqual(first, {'index': 0, 'success': True, 'id': Emotion.objects.get().pk})
+        self.assertEqual((second['index'], second['success']), (1, False))
+        self.assertIn('joy', second['errors'])
+        self.assertFalse(response.json()['success'])
+
+    def test_all_invalid(self):
+        response = self.post([self.item(self.members[0], joy=None), {'member_id': self.members[1].pk}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([result['success'] for result in response.json()['result']], [False, False])
+        self.assertFalse(Emotion.objects.exists())
+        self.assertFalse(Interest.objects.exists())
+
+    def test_unknown_member(self):
+        response = self.post([self.item(self.members[0]), {**self.item(self.members[0]), 'member_id': 0}])
+        self.assertEqual(response.status_code, 207)
+        self.assertIn('member_id', response.json()['result'][1]['errors'])
+
+    @override_settings(EMOTION_BULK_MAX_ITEMS=2)
+    def test_payload_validation(self):
+        for payload in ([], {'member_id': self.members[0].pk}, [self.item(self.members[0])] * 3):
+            self.assertEqual(self.post(payload).status_code, 400)
+        self.assertFalse(Emotion.objects.exists())
+
+    def test_members_fetched_once(self):
+        # 항목 수와 관계없이 회원 조회 1번
+        items = [self.item(member) for member in self.members for _ in range(20)]
+        items.append({**self.item(self.members[0]), 'member_id': 0})
+        with self.assertNumQueries(1):
+            validated = validate_emotions(items)
+        self.assertEqual(sum(errors is None for _, errors in validated), 40)
+        self.assertEqual(validated[0][0]['member_id'], self.members[0])
+
+
+class SnapshotExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, = create_members(1)
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = directory.name
+
+    def create_emotions(self, count, age=timedelta(hours=1)):
+        emotions = Emotion.objects.bulk_create([build_emotion(self.member) for _ in range(count)])
+        Emotion.objects.filter(pk__in=[emotion.pk for emotion in emotions]).update(created_at=timezone.now() - age)
+        return [emotion.pk for emotion in emotions]
+
+    def export(self):
+        return export_snapshot(self.path, ['emotion'], chunk_size=2)['emotion']
+
+    def exported_ids(self):
+        return list(load_snapshot(self.path, 'emotion')['id'])
+
+    def test_incremental_export(self):
+        first = self.create_emotions(3)
+        self.assertEqual(self.export(), 3)
+        self.assertEqual(self.export(), 0)
+
+        second = self.create_emotions(2)
+        self.assertEqual(self.export(), 2)
+        self.assertEqual(self.exported_ids(), first + second)
+        columns = load_snapshot(self.path, 'emotion')
+        self.assertEqual(list(columns['joy']), [70] * 5)
+        self.assertEqual(set(columns['member_id']), {self.member.pk})
+
+    def test_recent_rows_wait_for_lag(self):
+        # 최근 행(아직 커밋되지 않은 더 작은 id가 있을 수 있음)에서 멈추고, 그 뒤의 오래된 행도 다음 실행으로 미룸
+        old = self.create_emotions(2)
+        recent = self.create_emotions(1, age=timedelta(0))
+        later = self.create_emotions(1)
+        self.assertEqual(self.export(), 2)
+        self.assertEqual(self.exported_ids(), old)
+
+        Emotion.objects.filter(pk__in=recent).update(created_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(self.export(), 2)
+        self.assertEqual(self.exported_ids(), old + recent + later)
+
+    def test_late_commit_below_exported_id_is_not_skipped(self):
+        # id가 더 작은 행이 나중에 커밋된 경우 (lag 안이면 그 뒤 행을 내보내지 않았으므로 다시 읽힘)
+        first, second = self.create_emotions(2, age=timedelta(0))
+        Emotion.objects.filter(pk=first).delete()
+        self.assertEqual(self.export(), 0)
+
+        emotion = build_emotion(self.member)
+        emotion.pk = first
+        emotion.save()
+        Emotion.objects.update(created_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(self.export(), 2)
+        self.assertEqual(self.exported_ids(), [first, second])
+
+
+class EmotionTrendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, = create_members(1)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_compute_trends(self):
+        def row(day, joy):
+            return (day, joy, *[10] * (len(SCORE_FIELDS) - 1))
+
+        first, second = date(2026, 1, 1), date(2026, 1, 2)
+        trends = compute_trends([row(first, 10), row(first, 30), row(second, 50)], window=2, span=3)
+
+        self.assertEqual(trends['dates'], ['2026-01-01', '2026-01-02'])
+        self.assertEqual(trends['series']['joy'], {
+            'mean': [20.0, 50.0],
+            'rolling_mean': [20.0, 35.0],
+            # alpha = 0.5 -> (50 + 0.5 * 20) / 1.5
+            'ewma': [20.0, 40.0],
+            'delta': [None, 30.0],
+        })
+        self.assertEqual(trends['series']['sadness']['delta'], [None, 0.0])
+
+    def joy_means(self):
+        response = self.client.get('/emotions/trends/', {'member_id': self.member.pk})
+        self.assertEqual(response.status_code, 200)
+        return response.json()['result']['series']['joy']['mean']
+
+    def test_cache_invalidation(self):
+        emotions = [build_emotion(self.member) for _ in range(3)]
+        for emotion, joy in zip(emotions, (10, 20, 60)):
+            emotion.joy = joy
+            emotion.save()
+        self.assertEqual(self.joy_means(), [30.0])
+        with self.assertNumQueries(1):
+            self.assertEqual(self.joy_means(), [30.0])
+
+        # 최신이 아닌 기록 삭제 (마지막 수정 시각은 그대로)
+        emotions[0].delete()
+        self.assertEqual(self.joy_means(), [40.0])
+
+        # 최신이 아닌 기록을 전날로 옮김
+        emotions[1].created_at -= timedelta(days=1)
+        emotions[1].save()
+        self.assertEqual(self.joy_means(), [20.0, 60.0])
+
+        self.assertEqual(self.client.get('/emotions/trends/', {'member_id': 0}).status_code, 404)
@@ -0,0 +1,100 @@
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .missions import local_midnight
+from .models import Emotion
+
+SCORE_FIELDS = [
+    'joy', 'sadness', 'anger', 'fear', 'surprise', 'disgust',
+    'total', 'social', 'sexual', 'relational', 'refusing', 'essential'
+]
+DEFAULT_TREND_DAYS = 90
+MAX_TREND_DAYS = 365
+DEFAULT_WINDOW = 7
+DEFAULT_SPAN = 7
+
+
+def to_json_list(values):
+    # NaN(이전 값 없음)은 null로
+    return [None if np.isnan(value) else round(float(value), 2) for value in values]
+
+
+def daily_means(days, scores):
+    # 같은 날 기록은 평균 / 정렬된 상태라 reduceat 한 번으로 묶음
+    unique_days, starts = np.unique(days, return_index=True)
+    counts = np.diff(np.append(starts, len(days)))
+    return unique_days, np.add.reduceat(scores, starts, axis=0) / counts[:, None]
+
+
+def rolling_mean(values, window):
+    cumulative = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(0, ends - window)
+    return (cumulative[ends] - cumulative[starts]) / (ends - starts)[:, None]
+
+
+def ewma(values, span):
+    # pandas ewm(span, adjust=True)와 같은 가중치를 행렬 곱 한 번으로 계산
+    alpha = 2 / (span + 1)
+    lags = np.subtract.outer(np.arange(len(values)), np.arange(len(values)))
+    weights = np.where(lags >= 0, (1 - alpha) ** np.clip(lags, 0, None), 0)
+    return weights @ values / weights.sum(axis=1)[:, None]
+
+
+def compute_trends(rows, window, span):
+    # rows: (날짜, 점수...) 튜플 목록 -> 열 단위 배열로 변환해 한 번에 계산
+    columns = list(zip(*rows))
+    days = np.array(columns[0], dtype='datetime64[D]')
+    scores = np.array(columns[1:], dtype=float).T
+
+    unique_days, means = daily_means(days, scores)
+    rolling = rolling_mean(means, window)
+    smoothed = ewma(means, span)
+    deltas = np.vstack([np.full((1, means.shape[1]), np.nan), np.diff(means, axis=0)])
+
+    return {
+        "dates": [str(day) for day in unique_days],
+        "series": {
+            field: {
+                "mean": to_json_list(means[:, index]),
+                "rolling_mean": to_json_list(rolling[:, index]),
+                "ewma": to_json_list(smoothed[:, index]),
+                "delta": to_json_list(deltas[:, index])
+            }
+            for index, field in enumerate(SCORE_FIELDS)
+        }
+    }
+
+
+def get_emotion_trends(member_id, days, window, span):
+    # 회원의 마지막 수정 시각과 기록 수가 바뀌지 않았으면 캐시된 결과 사용
+    # (수정은 updated_at, 최신이 아닌 기록의 삭제는 기록 수로 반영 / update()로 고칠 때는 updated_at도 함께 갱신)
+    version = Emotion.objects.filter(member_id=member_id).aggregate(latest=Max('updated_at'), count=Count('id'))
+    if version['latest'] is None:
+        return None
+
+    today = timezone.localdate()
+    cache_key = (
+        f'emotion-trends:{member_id}:{days}:{window}:{span}:{today}:'
+        f"{version['latest'].timestamp()}:{version['count']}"
+    )
+    trends = cache.get(cache_key)
+    if trends is not None:
+        return trends
+
+    rows = Emotion.objects.filter(
+        member_id=member_id,
+        created_at__gte=local_midnight(today - timedelta(days=days - 1))
+    ).order_by('created_at').values_list(
+        TruncDate('created_at', tzinfo=timezone.get_current_timezone()), *SCORE_FIELDS
+    )
+    rows = list(rows)
+    trends = compute_trends(rows, window, span) if rows else {"dates": [], "series": {}}
+    cache.set(cache_key, trends, settings.EMOTION_TRENDS_CACHE_TIMEOUT)
+    return trends
@@ -4,7 +4,12 @@ from . import views
 app_name='emotions'
 urlpatterns = [
     path('results/', views.handle_emotion), # 감정분석내용 등록
+    path('results/bulk/', views.bulk_emotion),
     path('results/<int:result_pk>/', views.emotion_detail),
     path('interests/', views.handle_interest),
-    path('missions/', views.get_missions)
+    path('trends/', views.emotion_trends),
+    path('tags/', views.member_tags),
+    path('tags/trending/', views.trending_tags),
+    path('missions/', views.get_missions),
+    path('missions/async/', views.get_missions_async) # ASGI용
 ]
@@ -3,61 +3,53 @@ from rest_framework.decorators import api_view
 from rest_framework import status
 from rest_framework.views import Response
 from datetime import timedelta
-from django.utils import timezone
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404
 
-from django.shortcuts import render, get_object_or_404, get_list_or_404
+from .bulk import bulk_create_emotions, validate_emotions
+from .missions import (
+    aget_missions_by_day, aget_missions_from_rollup, get_custom_range, get_missions_by_day,
+    get_missions_from_rollup, get_week_start, refresh_mission_day
+)
 from .models import Emotion, Interest
-from .serializers import EmotionSerializers, InterestSerializers, MissionSerializers
-from accounts.models import User, Couple
-
-from drf_yasg import openapi
-from drf_yasg.utils import swagger_auto_schema
-
-@swagger_auto_schema(
-    method='post',
-    operation_description="감정기록 분석 결과 등록 API",
-    request_body=EmotionSerializers,
-    responses={
-        201: openapi.Response(
-            description="감정기록 분석 결과 등록 성공",
-            examples={
-                "application/json": {
-                    "success": True,
-                    "result": {
-                        "id": 1,
-                        "mission_content": "남편과 산책하기",
-                        "is_complement": False,
-                        "interest_keyword": "#꽃 #결혼 #아이",
-                        "self_message": "내일도 화이팅",
-                        "export_message": "너도 힘내",
-                        "joy": 70,
-                        "sadness": 10,
-                        "anger": 10,
-                        "fear": 1,
-                        "surprise": 30,
-                        "disgust": 10,
-                        "total": 100,
-                        "social": 10,
-                        "sexual": 10,
-                        "relational": 10,
-                        "refusing": 10,
-                        "essential": 10,
-                        "member_id": 1
-                    }
-                }
-            }
-        ),
-        400: openapi.Response(description="유효성 검사 실패")
-    }
+from .tags import DEFAULT_LIMIT, DEFAULT_TRENDING_DAYS, MAX_DAYS, MAX_LIMIT, get_member_top_tags, get_trending_tags
+from .trends import (
+    DEFAULT_SPAN, DEFAULT_TREND_DAYS, DEFAULT_WINDOW, MAX_TREND_DAYS, get_emotion_trends
 )
+from .serializers import EmotionSerializers, InterestSerializers, MissionSerializers
+from accounts.couples import couple_resolver
+from hahahoho.async_api import async_api_view, json_response
+from hahahoho.conditional import conditional_get, list_version, record_version
+from hahahoho.fast_serializers import fast_serializer
+from hahahoho.pagination import keyset_queryset, paginate_keyset
+from hahahoho.params import get_positive_int
+from hahahoho.streaming import is_stream_request, ndjson_response
+
+
+def emotion_list_version(request):
+    return list_version(Emotion.objects.filter(member_id=request.GET.get('member_id')), 'updated_at')
+
+
+def emotion_version(request, result_pk):
+    return record_version(Emotion.objects.filter(pk=result_pk), 'updated_at')
+
+
+def interest_list_version(request):
+    return list_version(Interest.objects.filter(member_id=request.GET.get('member_id')), 'created_at')
+
+
 @api_view(['POST', 'GET'])
+@conditional_get(emotion_list_version)
 def handle_emotion(request):
     
     if request.method == 'POST':
         serializer = EmotionSerializers(data=request.data)
 
         if serializer.is_valid(raise_exception=True):
-            serializer.save()
+            # 감정 기록 / 관심사 / 주간 미션 집계를 한 트랜잭션으로 저장
+            with transaction.atomic():
+                serializer.save()
             response_data = {
                 "success": True,
                 "result": serializer.data
@@ -66,15 +58,15 @@ def handle_emotion(request):
     
     elif request.method == 'GET':
         member_id = request.query_params.get('member_id')
-        emotion = Emotion.objects.filter(member_id=member_id).order_by('-created_at').first()
+        emotion = fast_serializer(EmotionSerializers).serialize_first(
+            Emotion.objects.filter(member_id=member_id).order_by('-created_at')
+        )
 
         if emotion:
-            serializer = EmotionSerializers(emotion)
-
             response_data = {
                 "success": True,
                 "result": {
-                    "totalRecords": serializer.data
+                    "totalRecords": emotion
                 }
             }
         else:
@@ -88,80 +80,44 @@ def handle_emotion(request):
 
 
 
-@swagger_auto_schema(
-    method='get',
-    operation_description="감정기록 분석 결과 상세 조회 API",
-    responses={
-        200: openapi.Response(
-            description="감정 기록 조회 성공",
-            examples={
-                "application/json": {
-                    "success": True,
-                    "result": {
-                        "id": 1,
-                        "mission_content": "남편과 산책하기",
-                        "is_complement": False,
-                        "interest_keyword": "#꽃 #결혼 #아이",
-                        "self_message": "내일도 화이팅",
-                        "export_message": "너도 힘내",
-                        "joy": 70,
-                        "sadness": 10,
-                        "anger": 10,
-                        "fear": 1,
-                        "surprise": 30,
-                        "disgust": 10,
-                        "total": 100,
-                        "social": 10,
-                        "sexual": 10,
-                        "relational": 10,
-                        "refusing": 10,
-                        "essential": 10,
-                        "member_id": 1
-                    }
-                }
-            }
-        ),
-        404: openapi.Response(description="감정 기록이 존재하지 않습니다.")
-    }
-)
-@swagger_auto_schema(
-    method='put',
-    operation_description="감정기록 분석 수정 API",
-    request_body=EmotionSerializers,
-    responses={
-        200: openapi.Response(
-            description="감정 기록 업데이트 성공",
-            examples={
-                "application/json": {
-                    "success": True,
-                    "result": {
-                        "id": 1,
-                        "mission_content": "남편과 산책하기",
-                        "is_complement": True,
-                        "interest_keyword": "#꽃 #결혼 #아이",
-                        "self_message": "내일도 화이팅",
-                        "export_message": "너도 힘내",
-                        "joy": 70,
-                        "sadness": 10,
-                        "anger": 10,
-                        "fear": 1,
-                        "surprise": 30,
-                        "disgust": 10,
-                        "total": 100,
-                        "social": 10,
-                        "sexual": 10,
-                        "relational": 10,
-                        "refusing": 10,
-                        "essential": 10,
-                        "member_id": 1
-                    }
-                }
-            }
-        ),
-        400: openapi.Response(description="유효성 검사 실패")
+@api_view(['POST'])
+def bulk_emotion(request):
+    items = request.data
+    if not isinstance(items, list) or not items:
+        return Response({"error": "감정 기록 목록이 필요합니다."}, status=status.HTTP_400_BAD_REQUEST)
+    if len(items) > settings.EMOTION_BULK_MAX_ITEMS:
+        return Response(
+            {"error": f"한 번에 최대 {settings.EMOTION_BULK_MAX_ITEMS}건까지 등록할 수 있습니다."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    validated = validate_emotions(items)
+    emotions = iter(bulk_create_emotions([data for data, errors in validated if errors is None]))
+
+    results = []
+    for index, (data, errors) in enumerate(validated):
+        if errors is None:
+            results.append({"index": index, "success": True, "id": next(emotions).pk})
+        else:
+            results.append({"index": index, "success": False, "errors": errors})
+
+    created_count = sum(1 for result in results if result["success"])
+    if created_count == len(results):
+        response_status = status.HTTP_201_CREATED
+    elif created_count:
+        response_status = status.HTTP_207_MULTI_STATUS
+    else:
+        response_status = status.HTTP_400_BAD_REQUEST
+
+    response_data = {
+        "success": created_count == len(results),
+        "result": results
     }
-)
+    return Response(response_data, status=response_status)
+
+
 @api_view(['GET', 'PUT'])
+@conditional_get(emotion_version)
 def emotion_detail(request, result_pk):
     emotion = Emotion.objects.get(pk=result_pk)
 
@@ -174,9 +130,13 @@ def emotion_detail(request, result_pk):
         }
         return Response(response_data, status=status.HTTP_200_OK)
     elif request.method == 'PUT':
+        was_complement = emotion.is_complement
         serializer = EmotionSerializers(emotion, data=request.data, partial=True)
         if serializer.is_valid(raise_exception=True):
-            serializer.save()
+            with transaction.atomic():
+                serializer.save()
+                if emotion.is_complement != was_complement:
+                    refresh_mission_day(emotion.member_id_id, emotion.created_at)
             response_data = {
                 "success": True,
                 "result": serializer.data
@@ -184,85 +144,40 @@ def emotion_detail(request, result_pk):
             return Response(response_data, status=status.HTTP_200_OK)
 
 
-@swagger_auto_schema(
-    method='get',
-    operation_description="특정 회원의 모든 관심사 조회 API",
-    manual_parameters=[
-        openapi.Parameter(
-            'member_id',
-            openapi.IN_QUERY,
-            description="관심사를 조회할 사용자의 ID",
-            type=openapi.TYPE_INTEGER,
-            required=True
-        )
-    ],
-    responses={
-        200: openapi.Response(
-            description="관심사 조회 성공",
-            examples={
-                "application/json": {
-                    "success": True,
-                    "result": [
-                        {
-                            "id": 3,
-                            "interests": "#이거 #어떻게 #나올라나",
-                            "created_at": "2024-10-27T19:27:41.890077+09:00",
-                            "member_id": 2
-                        },
-                        {
-                            "id": 2,
-                            "interests": "#배고파 #진짜 #많이",
-                            "created_at": "2024-10-27T19:27:05.426330+09:00",
-                            "member_id": 2
-                        }
-                    ]
-                }
-            }
-        ),
-        204: openapi.Response(description="등록된 관심사가 없습니다.")
-    }
-)
-@swagger_auto_schema(
-    method='post',
-    operation_description="관심사 등록 API",
-    request_body=InterestSerializers,
-    responses={
-        201: openapi.Response(
-            description="관심사 생성 성공",
-            examples={
-                "application/json": {
-                    "success": True,
-                    "result": {
-                        "id": 3,
-                        "interests": "#이거 #어떻게 #나올라나",
-                        "created_at": "2024-10-27T19:27:41.890077+09:00",
-                        "member_id": 2
-                    }
-                }
-            }
-        ),
-        400: openapi.Response(description="유효성 검사 실패")
-    }
-)
 @api_view(['GET', 'POST'])
+@conditional_get(interest_list_version)
 def handle_interest(request):
     EMPTY_RESULT_MESSAGE = "등록된 관심사가 없습니다."
     if request.method == 'GET':
         member_id = request.query_params.get('member_id')
-        interests = Interest.objects.filter(member_id=member_id).order_by('-created_at')
-        serializer = InterestSerializers(interests, many=True)
+        interests = Interest.objects.filter(member_id=member_id)
 
-        if is_empty_interest(serializer):
+        if is_stream_request(request):
+            # 전체 이력을 청크 단위로 읽어 NDJSON으로 흘려보냄
+            interests = keyset_queryset(interests, request.query_params.get('cursor'))
+            return ndjson_response(interests, InterestSerializers)
+
+        # 조회 전용 빠른 직렬화 (.values_list() 행에서 바로 dict 생성)
+        serializer = fast_serializer(InterestSerializers)
+        created_at, pk = serializer.index('created_at'), serializer.index('id')
+        rows, next_cursor = paginate_keyset(
+            serializer.values(interests), request, cursor_key=lambda row: (row[created_at], row[pk])
+        )
+        interests = serializer.serialize(rows)
+
+        if is_empty_interest(interests):
             response_data = {
                 "success": True,
                 "message": EMPTY_RESULT_MESSAGE,
-                "result": []
+                "result": [],
+                "next_cursor": None
             }
             return Response(response_data)
         
         response_data = {
             "success": True,
-            "result": serializer.data
+            "result": interests,
+            "next_cursor": next_cursor
         }
         return Response(response_data, status=status.HTTP_200_OK)
     
@@ -278,72 +193,110 @@ def handle_interest(request):
             return Response(response_data, status=status.HTTP_201_CREATED)
 
 
-def is_empty_interest(serializer):
-    return len(serializer.data) == 0
+def is_empty_interest(interests):
+    return len(interests) == 0
+
+
+@api_view(['GET'])
+def emotion_trends(request):
+    member_id = request.query_params.get('member_id')
+    days = get_positive_int(request.query_params, 'days', DEFAULT_TREND_DAYS, MAX_TREND_DAYS)
+    window = get_positive_int(request.query_params, 'window', DEFAULT_WINDOW, days)
+    span = get_positive_int(request.query_params, 'span', DEFAULT_SPAN, days)
+
+    trends = get_emotion_trends(member_id, days, window, span)
+    if trends is None:
+        response_data = {
+            "success": False,
+            "message": "등록된 감정 기록이 없습니다."
+        }
+        return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+
+    response_data = {
+        "success": True,
+        "result": trends
+    }
+    return Response(response_data, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+def member_tags(request):
+    member_id = request.query_params.get('member_id')
+    limit = get_positive_int(request.query_params, 'limit', DEFAULT_LIMIT, MAX_LIMIT)
+    days = get_positive_int(request.query_params, 'days', None, MAX_DAYS)
+
+    tags = get_member_top_tags(member_id, limit, days)
+    response_data = {
+        "success": True,
+        "result": serialize_tag_counts(tags)
+    }
+    return Response(response_data, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+def trending_tags(request):
+    limit = get_positive_int(request.query_params, 'limit', DEFAULT_LIMIT, MAX_LIMIT)
+    days = get_positive_int(request.query_params, 'days', DEFAULT_TRENDING_DAYS, MAX_DAYS)
+
+    tags = get_trending_tags(limit, days)
+    response_data = {
+        "success": True,
+        "result": serialize_tag_counts(tags)
+    }
+    return Response(response_data, status=status.HTTP_200_OK)
+
+
+def serialize_tag_counts(tags):
+    return [{"tag": tag['tag__name'], "count": tag['total']} for tag in tags]
 
 
 @api_view(['GET', 'POST'])
 def get_missions(request):
-    # 나의 7일 동안의 'is_complement' 값
-    # 내 커플의 7일 동안의 'is_complement' 값
+    # 나의 / 배우자의 주간 'is_complement' 값
     member_id = request.query_params.get('member_id')
-    user = get_object_or_404(User, id=member_id)
+    couple, spouse = couple_resolver.resolve(member_id)
+    if couple is None:
+        raise Http404
+    user_id, spouse_id = int(member_id), spouse.pk
 
-    if user.gender == 'M':
-        # 사용자가 남자면 배우자는 여자
-        couple = get_object_or_404(Couple, husband=user)
-        spouse = couple.wife
+    custom_range = get_custom_range(request.query_params)
+    if custom_range:
+        start, end = custom_range
+        missions = get_missions_by_day([user_id, spouse_id], start, end)
     else:
-        couple = get_object_or_404(Couple, wife=user)
-        spouse = couple.husband
-
-    today = timezone.now()
-    day_list = ['SUN', 'MON', 'TUE', "WED", 'THU', 'FRI', 'SAT']
-    user_missions_list = {day: [] for day in day_list}
-    spouse_missions_list = {day: [] for day in day_list}
-
-    start_of_week = today - timedelta(days=today.weekday()+1)
-    end_of_week = start_of_week + timedelta(days=6)    
-
-    # 사용자의 7일간 감정 기록 중, 'is_complement'만 뽑기
-    user_missions = Emotion.objects.filter(
-        member_id=user, 
-        created_at__range = (start_of_week, end_of_week)
-    ).values('is_complement', 'created_at')
-
-    # 배우자의 7일간 감정 기록 중, 'is_complement'만 뽑기
-    spouse_missions = Emotion.objects.filter(
-        member_id=spouse, 
-        created_at__range = (start_of_week, end_of_week)
-    ).values('is_complement', 'created_at')
-
-    for mission in user_missions:
-        # print(mission)
-        created_at = mission['created_at']
-        format_date = created_at.strftime('%Y-%m-%d')
-        day_of_week = created_at.strftime('%a').upper()
-        if day_of_week in day_list:
-            user_missions_list[day_of_week].append({
-                'is_complement': mission['is_complement'],
-                'created_at': f"{format_date}, {day_of_week}" 
-            })
-    
-        # 배우자 미션 데이터 요일에 맞게 짝짓기
-    for mission in spouse_missions:
-        # print(mission)
-        created_at = mission['created_at']
-        format_date = created_at.strftime('%Y-%m-%d')
-        day_of_week = created_at.strftime('%a').upper() 
-        if day_of_week in day_list:
-            spouse_missions_list[day_of_week].append({
-                'is_complement': mission['is_complement'],
-                'created_at': f"{format_date}, {day_of_week}" 
-            })
-
-    # print(user_missions_list)
-    # print(spouse_missions_list)
-
-    return Response({
-        'user_is_complement': user_missions_list,
-        'spouse_is_complement': spouse_missions_list
-    }, status=status.HTTP_200_OK)
+        # 주 단위 조회는 MissionWeek 집계만 읽음
+        start = get_week_start(request.query_params)
+        end = start + timedelta(days=6)
+        missions = get_missions_from_rollup([user_id, spouse_id], start)
+
+    return Response(serialize_missions(missions, user_id, spouse_id, start, end), status=status.HTTP_200_OK)
+
+
+@async_api_view(['GET'])
+async def get_missions_async(request):
+    # get_missions의 ASGI용 async 버전 (조회만 지원)
+    member_id = request.GET.get('member_id')
+    couple, spouse = await couple_resolver.aresolve(member_id)
+    if couple is None:
+        raise Http404
+    user_id, spouse_id = int(member_id), spouse.pk
+
+    custom_range = get_custom_range(request.GET)
+    if custom_range:
+        start, end = custom_range
+        missions = await aget_missions_by_day([user_id, spouse_id], start, end)
+    else:
+        start = get_week_start(request.GET)
+        end = start + timedelta(days=6)
+        missions = await aget_missions_from_rollup([user_id, spouse_id], start)
+
+    return json_response(serialize_missions(missions, user_id, spouse_id, start, end))
+
+
+def serialize_missions(missions, user_id, spouse_id, start, end):
+    return {
+        'user_is_complement': missions[user_id],
+        'spouse_is_complement': missions[spouse_id],
+        'from': start.isoformat(),
+        'to': end.isoformat()
+    }
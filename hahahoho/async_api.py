@@ -0,0 +1,55 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404, HttpResponse
+from rest_framework import exceptions
+from rest_framework.settings import api_settings
+
+from .renderers import FastJSONRenderer
+
+
+def json_response(data, status=200):
+    # DRF Response와 같은 JSON 형식으로 렌더링
+    return HttpResponse(FastJSONRenderer().render(data), content_type='application/json', status=status)
+
+
+def error_response(exc):
+    response = json_response(
+        exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail},
+        status=exc.status_code
+    )
+    if isinstance(exc, (exceptions.AuthenticationFailed, exceptions.NotAuthenticated)):
+        response.headers['WWW-Authenticate'] = 'Token'
+    return response
+
+
+def authenticate(request):
+    # DRF 인증 클래스를 그대로 사용 (토큰 캐시 포함)
+    for authentication_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        result = authentication_class().authenticate(request)
+        if result is not None:
+            return result[0]
+    return AnonymousUser()
+
+
+def async_api_view(methods, authenticated=False):
+    # DRF는 async 뷰를 지원하지 않으므로 @api_view의 인증 / 예외 처리만 async 뷰에 맞게 구현
+    def decorator(view):
+        @wraps(view)
+        async def inner(request, *args, **kwargs):
+            if request.method not in methods:
+                return error_response(exceptions.MethodNotAllowed(request.method))
+            try:
+                request.user = await sync_to_async(authenticate)(request)
+                if authenticated and not request.user.is_authenticated:
+                    raise exceptions.NotAuthenticated()
+                return await view(request, *args, **kwargs)
+            except Http404:
+                return error_response(exceptions.NotFound())
+            except exceptions.APIException as exc:
+                return error_response(exc)
+
+        return inner
+
+    return decorator
@@ -0,0 +1,337 @@
+import json
+import re
+import subprocess
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+import numpy as np
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, connections
+from django.db.backends.base.creation import TEST_DATABASE_PREFIX
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+
+from accounts.models import Couple
+from counsels.models import Counsel
+from counsels.search import index_counsels
+from emotions.missions import record_missions
+from emotions.models import Emotion, Interest
+from emotions.tags import index_interests
+from infertilitytests.models import Infertility
+
+from .metrics import metrics_authorization
+from .testutils import create_members
+
+MEMBER_PREFIX = 'benchmark'
+BATCH_SIZE = 2000
+
+# (이름, 경로, 회원 ID 파라미터 이름)
+ENDPOINTS = [
+    ('handle_emotion', '/emotions/results/', 'member_id'),
+    ('get_missions', '/emotions/missions/', 'member_id'),
+    ('couple_data', '/accounts/couple/data/', None),
+    ('handle_interest', '/emotions/interests/', 'member_id'),
+    ('handle_counsel_record', '/counsels/records/', 'member_id'),
+    ('handle_infertility_tests', '/infertility/tests/', 'memberId'),
+]
+PERCENTILES = (50, 95, 99)
+
+
+def is_test_database():
+    # 테스트 DB(test_ 접두어 / SQLite 메모리 DB)인지 확인
+    if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+        return True
+    return str(connection.settings_dict['NAME']).startswith(TEST_DATABASE_PREFIX)
+
+
+@contextmanager
+def benchmark_database():
+    # 운영 DB를 건드리지 않도록 테스트 DB를 만들어 사용하고 끝나면 삭제
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connections.close_all()
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+@contextmanager
+def explicit_timestamps(*models):
+    # bulk_create에서 created_at / updated_at을 직접 지정할 수 있도록 auto_now(_add)를 잠시 끔
+    fields = [
+        (field, field.auto_now, field.auto_now_add)
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    for field, _, _ in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in fields:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def spread(now, days, depth):
+    # 기록 depth개를 최근 days일에 고르게 분포 (최신 기록이 먼저)
+    step = timedelta(days=days) / max(depth, 1)
+    return [now - step * index for index in range(depth)]
+
+
+def build_records(member, now, days, depth):
+    emotions, interests, counsels, inf_tests = [], [], [], []
+    for created_at in spread(now, days, depth['emotions']):
+        emotions.append(Emotion(
+            member_id=member,
+            mission_content="남편과 산책하기",
+            is_complement=created_at.day % 2 == 0,
+            interest_keyword="#꽃 #결혼 #아이",
+            self_message="내일도 화이팅",
+            export_message="너도 힘내",
+            joy=70, sadness=10, anger=10, fear=1, surprise=30, disgust=10,
+            total=100, social=10, sexual=10, relational=10, refusing=10, essential=10,
+            created_at=created_at, updated_at=created_at
+        ))
+    for created_at in spread(now, days, depth['interests']):
+        interests.append(Interest(member_id=member, interests="#꽃 #결혼 #아이", created_at=created_at))
+    for created_at in spread(now, days, depth['counsels']):
+        counsels.append(Counsel(
+            member_id=member, summary="상담 내용 요약 " * 20, tags="#불안 #대화", count=3,
+            created_at=created_at, updated_at=created_at
+        ))
+    for created_at in spread(now, days, depth['tests']):
+        inf_tests.append(Infertility(
+            member_id=member, total=100, social=10, sexual=10, relational=10, refusing=10, essential=10,
+            belifs="괜찮아", created_at=created_at
+        ))
+    return emotions, interests, counsels, inf_tests
+
+
+def seed_couples(couple_count, days=180, **depth):
+    # depth: 회원별 emotions / interests / counsels / tests 개수
+    # bulk_create는 시그널을 보내지 않으므로 미션 / 태그 집계 / 검색 색인은 직접 기록
+    depth = {name: depth.get(name, 0) for name in ('emotions', 'interests', 'counsels', 'tests')}
+    members = create_members(couple_count * 2, prefix=MEMBER_PREFIX)
+    Couple.objects.bulk_create([
+        Couple(wife=members[i], husband=members[i + 1]) for i in range(0, len(members), 2)
+    ])
+    tokens = Token.objects.bulk_create([Token(user=member, key=Token.generate_key()) for member in members])
+
+    now = timezone.now()
+    with explicit_timestamps(Emotion, Interest, Counsel, Infertility):
+        for member in members:
+            emotions, interests, counsels, inf_tests = build_records(member, now, days, depth)
+            emotions = Emotion.objects.bulk_create(emotions, batch_size=BATCH_SIZE)
+            interests = Interest.objects.bulk_create(interests, batch_size=BATCH_SIZE)
+            counsels = Counsel.objects.bulk_create(counsels, batch_size=BATCH_SIZE)
+            Infertility.objects.bulk_create(inf_tests, batch_size=BATCH_SIZE)
+            record_missions(emotions)
+            index_interests(interests)
+            index_counsels(counsels)
+    return [(token.user_id, token.key) for token in tokens]
+
+
+def remove_seeded_members(members):
+    # seed_couples가 만든 회원만 삭제 (members: seed_couples의 반환값)
+    get_user_model().objects.filter(pk__in=[member_id for member_id, _ in members]).delete()
+
+
+def endpoint_requests(path, member_param, members, count):
+    # 회원을 돌아가며 (경로, 쿼리 파라미터, 토큰) 목록 생성
+    requests = []
+    for index in range(count):
+        member_id, token = members[index % len(members)]
+        params = {member_param: member_id} if member_param else {}
+        requests.append((path, params, token))
+    return requests
+
+
+class ClientDriver:
+    # Django 테스트 클라이언트로 프로세스 안에서 호출 / 스레드마다 클라이언트를 따로 사용
+    mode = 'client'
+
+    def __init__(self):
+        self.local = threading.local()
+
+    def get(self, path, params, token):
+        client = getattr(self.local, 'client', None)
+        if client is None:
+            client = self.local.client = Client()
+        started = time.perf_counter()
+        response = client.get(path, params, HTTP_AUTHORIZATION=f'Token {token}')
+        latency = time.perf_counter() - started
+        recorder = getattr(response.wsgi_request, 'query_recorder', None)
+        return latency, response.status_code, recorder.count if recorder else None
+
+    def queries_before(self, route):
+        return None
+
+    def queries_after(self, route, before, count):
+        return None
+
+
+class ServerDriver:
+    # 로컬 서버에 HTTP로 호출 / 쿼리 수는 서버의 /metrics 변화량으로 계산 (METRICS_TOKEN이 같아야 함)
+    mode = 'server'
+
+    def __init__(self, base_url, metrics_token=None):
+        self.base_url = base_url.rstrip('/')
+        self.metrics_token = settings.METRICS_TOKEN if metrics_token is None else metrics_token
+
+    def get(self, path, params, token):
+        request = Request(
+            f'{self.base_url}{path}?{urlencode(params)}', headers={'Authorization': f'Token {token}'}
+        )
+        started = time.perf_counter()
+        try:
+            with urlopen(request) as response:
+                response.read()
+                status = response.status
+        except HTTPError as error:
+            status = error.code
+        return time.perf_counter() - started, status, None
+
+    def route_queries(self, route):
+        # (요청 수, 쿼리 수 합계) / 서버 워커가 여러 개면 응답한 워커의 값만 보임
+        try:
+            request = Request(
+                f'{self.base_url}/metrics', headers={'Authorization': metrics_authorization(self.metrics_token)}
+            )
+            with urlopen(request) as response:
+                text = response.read().decode()
+        except (HTTPError, OSError):
+            return None
+        labels = re.escape(f'{{route="{route}",method="GET"}}')
+        values = {}
+        for suffix in ('sum', 'count'):
+            match = re.search(rf'^db_queries_per_request_{suffix}{labels} (\S+)$', text, re.MULTILINE)
+            values[suffix] = float(match.group(1)) if match else 0
+        return values['count'], values['sum']
+
+    def queries_before(self, route):
+        return self.route_queries(route)
+
+    def queries_after(self, route, before, count):
+        after = self.route_queries(route)
+        if before is None or after is None or after[0] == before[0]:
+            return None
+        return (after[1] - before[1]) / (after[0] - before[0])
+
+
+def latency_summary(latencies):
+    milliseconds = np.array(latencies) * 1000
+    summary = {f'p{percentile}': round(float(np.percentile(milliseconds, percentile)), 2) for percentile in PERCENTILES}
+    summary['mean'] = round(float(milliseconds.mean()), 2)
+    summary['max'] = round(float(milliseconds.max()), 2)
+    return summary
+
+
+def peak_memory(driver, requests):
+    # 요청 하나를 처리하는 동안 늘어난 파이썬 메모리의 최댓값 (KB) / 지연 시간 측정과 따로 순차 실행
+    tracemalloc.start()
+    try:
+        peak = 0
+        for path, params, token in requests:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            driver.get(path, params, token)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def run_endpoint(driver, path, requests, concurrency, memory_samples):
+    route = path.lstrip('/')
+    # 첫 요청의 연결 / 캐시 준비 비용은 제외
+    driver.get(*requests[0])
+
+    before = driver.queries_before(route)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda request: driver.get(*request), requests))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for latency, _, _ in results]
+    queries = [count for _, _, count in results if count is not None]
+    if queries:
+        query_summary = {'mean': round(sum(queries) / len(queries), 2), 'max': max(queries)}
+    else:
+        mean = driver.queries_after(route, before, len(requests))
+        query_summary = {'mean': round(mean, 2) if mean is not None else None, 'max': None}
+
+    return {
+        'requests': len(requests),
+        'errors': sum(1 for _, status, _ in results if status >= 400),
+        'throughput_rps': round(len(requests) / elapsed, 1),
+        'latency_ms': latency_summary(latencies),
+        'queries_per_request': query_summary,
+        'peak_memory_kb': peak_memory(driver, requests[:memory_samples]) if driver.mode == 'client' else None,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(driver, members, request_count, concurrency, memory_samples, config, endpoints=None):
+    report = {
+        'commit': git_commit(),
+        'created_at': timezone.now().isoformat(),
+        'mode': driver.mode,
+        'database': connection.vendor,
+        'config': {**config, 'requests': request_count, 'concurrency': concurrency},
+        'endpoints': {},
+    }
+    for name, path, member_param in ENDPOINTS:
+        if endpoints and name not in endpoints:
+            continue
+        requests = endpoint_requests(path, member_param, members, request_count)
+        report['endpoints'][name] = run_endpoint(driver, path, requests, concurrency, memory_samples)
+    return report
+
+
+def load_report(path):
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def compare_reports(base, head):
+    # 엔드포인트별 (지표 이름, 이전 값, 현재 값, 변화율 %) / 값이 클수록 나쁜 지표만 비교
+    rows = []
+    for name, head_result in head['endpoints'].items():
+        base_result = base['endpoints'].get(name)
+        if base_result is None:
+            continue
+        metrics = [(f'latency_ms.{key}', base_result['latency_ms'][key], head_result['latency_ms'][key])
+                   for key in head_result['latency_ms']]
+        metrics.append((
+            'queries_per_request.mean',
+            base_result['queries_per_request']['mean'], head_result['queries_per_request']['mean']
+        ))
+        metrics.append(('peak_memory_kb', base_result['peak_memory_kb'], head_result['peak_memory_kb']))
+        for metric, old, new in metrics:
+            if old is None or new is None:
+                continue
+            change = (new - old) / old * 100 if old else (0.0 if new == old else float('inf'))
+            rows.append((name, metric, old, new, round(change, 1)))
+    return rows
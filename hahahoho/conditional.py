@@ -0,0 +1,57 @@
+import hashlib
+from functools import wraps
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def record_version(queryset, field):
+    # 상세 조회용 / 행 전체가 아니라 타임스탬프 컬럼 하나만 조회
+    timestamp = queryset.values_list(field, flat=True).first()
+    if timestamp is None:
+        return None
+    return timestamp, timestamp.isoformat()
+
+
+def list_version(queryset, field):
+    # 목록 조회용 / 최신 타임스탬프와 개수 (삭제도 반영되도록)
+    version = queryset.aggregate(latest=Max(field), count=Count('id'))
+    if version['latest'] is None:
+        return None
+    return version['latest'], f"{version['latest'].isoformat()}:{version['count']}"
+
+
+def conditional_get(version_func):
+    # version_func(request, *args, **kwargs) -> (마지막 수정 시각, ETag 원본 문자열) 또는 None
+    # GET / HEAD 요청에서 변경이 없으면 뷰(조회 / 직렬화)를 실행하지 않고 304 응답
+    # @api_view 아래에 적용 (DRF 인증 / 권한 / 스로틀 / 예외 처리를 통과한 요청만 버전 조회)
+    def decorator(view):
+        @wraps(view)
+        def inner(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            version = version_func(request, *args, **kwargs)
+            if version is None:
+                return view(request, *args, **kwargs)
+
+            last_modified, etag_source = version
+            etag = quote_etag(
+                hashlib.sha1(f'{request.get_full_path()}|{etag_source}'.encode()).hexdigest()
+            )
+            last_modified = int(last_modified.timestamp())
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+
+            response.headers.setdefault('ETag', etag)
+            response.headers.setdefault('Last-Modified', http_date(last_modified))
+            return response
+
+        return inner
+
+    return decorator
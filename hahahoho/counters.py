@@ -0,0 +1,90 @@
+import atexit
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def increment(queryset, field, amount, timestamp_field=None):
+    # 행을 읽지 않고 UPDATE 한 번으로 더함 (동시 요청에도 증가분이 유실되지 않음) / 반영된 행 수 반환
+    # update()는 auto_now를 적용하지 않으므로 수정 시각은 직접 갱신
+    values = {field: F(field) + amount}
+    if timestamp_field:
+        values[timestamp_field] = timezone.now()
+    return queryset.update(**values)
+
+
+class BufferedCounter:
+    # 증가분을 프로세스 메모리에 모아 두었다가 FLUSH_SIZE번 쌓이거나 첫 증가 후 FLUSH_INTERVAL초가 지나면
+    # UPDATE 한 번(Case/When)으로 반영 / 반영 전에는 DB 값에 보이지 않음
+    # 정상 종료 시에는 atexit에서 반영하지만, 강제 종료(SIGKILL, 워커 타임아웃)되면 최대 FLUSH_INTERVAL초 분량이 유실됨
+    def __init__(self, model, field, timestamp_field=None):
+        self.model = model
+        self.field = field
+        self.timestamp_field = timestamp_field
+        self.pending = Counter()
+        self.increments = 0
+        self.timer = None
+        self.lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def add(self, pk, amount=1):
+        with self.lock:
+            self.pending[pk] += amount
+            self.increments += 1
+            due = self.increments >= settings.COUNTER_BUFFER['FLUSH_SIZE']
+            if not due:
+                self.schedule()
+        if due:
+            self.flush()
+
+    def schedule(self):
+        # 요청이 없어도 FLUSH_INTERVAL초 뒤에 반영되도록 타이머 시작 (lock 안에서 호출)
+        if self.timer is None:
+            self.timer = threading.Timer(settings.COUNTER_BUFFER['FLUSH_INTERVAL'], self.flush_in_background)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush_in_background(self):
+        try:
+            self.flush()
+        finally:
+            # 타이머 스레드가 연 DB 연결을 닫음
+            connections.close_all()
+
+    def pending_amount(self, pk):
+        with self.lock:
+            return self.pending.get(pk, 0)
+
+    def flush(self):
+        # 반영한 행 수 반환 / 요청 처리 중에도 호출되므로 실패해도 예외를 올리지 않고 로그만 남김
+        with self.lock:
+            pending, self.pending = self.pending, Counter()
+            self.increments = 0
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        if not pending:
+            return 0
+
+        amount = Case(
+            *[When(pk=pk, then=Value(value)) for pk, value in pending.items()],
+            default=Value(0), output_field=IntegerField()
+        )
+        try:
+            return increment(
+                self.model.objects.filter(pk__in=list(pending)), self.field, amount, self.timestamp_field
+            )
+        except Exception:
+            # 반영하지 못한 증가분은 다시 쌓아 두고 FLUSH_INTERVAL초 뒤에 재시도
+            with self.lock:
+                self.pending.update(pending)
+                self.schedule()
+            logger.exception("%s.%s 증가분 반영 실패", self.model.__name__, self.field)
+            return 0
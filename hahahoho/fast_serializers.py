@@ -0,0 +1,115 @@
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+
+def datetime_converter(field):
+    # DRF DateTimeField.to_representation과 같은 결과 (현재 시간대로 변환 후 isoformat, UTC는 Z)
+    # 시간대는 값마다 조회하지 않고 직렬화 호출마다 한 번만 확인
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return field.to_representation
+
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+
+    def convert(value):
+        if field_timezone is not None and value.tzinfo is not None:
+            value = value.astimezone(field_timezone)
+        else:
+            value = field.enforce_timezone(value)
+        representation = value.isoformat()
+        if representation.endswith('+00:00'):
+            representation = representation[:-6] + 'Z'
+        return representation
+    return convert
+
+
+def get_converter(field):
+    # DB 값이 이미 응답 값과 같은 타입이면 변환하지 않음 (None)
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        return field.pk_field.to_representation if field.pk_field is not None else None
+    if isinstance(field, (serializers.IntegerField, serializers.CharField, serializers.ReadOnlyField)):
+        return None
+    if isinstance(field, serializers.BooleanField):
+        return bool
+    if isinstance(field, serializers.FloatField):
+        return float
+    if isinstance(field, serializers.DateTimeField):
+        return datetime_converter(field)
+    return field.to_representation
+
+
+class FastSerializer:
+    # 조회 전용 / ModelSerializer와 같은 필드 순서와 값으로 .values_list() 튜플에서 바로 dict 생성
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self._fields = None
+
+    @property
+    def fields(self):
+        # (응답 키, 모델 필드 이름, 시리얼라이저 필드) / 필드 객체는 처음 한 번만 만듦
+        if self._fields is None:
+            fields = []
+            for name, field in self.serializer_class().fields.items():
+                if field.write_only:
+                    continue
+                if isinstance(field, serializers.SerializerMethodField) or '.' in field.source \
+                        or field.source == '*':
+                    raise ImproperlyConfigured(
+                        f"{self.serializer_class.__name__}.{name}은 FastSerializer로 직렬화할 수 없습니다."
+                    )
+                fields.append((name, field.source, field))
+            self._fields = fields
+        return self._fields
+
+    @property
+    def names(self):
+        return [name for name, _, _ in self.fields]
+
+    @property
+    def sources(self):
+        return [source for _, source, _ in self.fields]
+
+    def values(self, queryset):
+        return queryset.values_list(*self.sources)
+
+    def index(self, source):
+        return self.sources.index(source)
+
+    def converters(self):
+        # (열 위치, 변환 함수) / 변환이 필요한 열만
+        converters = []
+        for index, (_, _, field) in enumerate(self.fields):
+            convert = get_converter(field)
+            if convert is not None:
+                converters.append((index, convert))
+        return converters
+
+    def iter_serialize(self, rows):
+        names = self.names
+        converters = self.converters()
+        for row in rows:
+            values = list(row)
+            for index, convert in converters:
+                if values[index] is not None:
+                    values[index] = convert(values[index])
+            yield dict(zip(names, values))
+
+    def serialize(self, rows):
+        return list(self.iter_serialize(rows))
+
+    def serialize_queryset(self, queryset):
+        return self.serialize(self.values(queryset))
+
+    def serialize_first(self, queryset):
+        row = self.values(queryset).first()
+        return None if row is None else self.serialize([row])[0]
+
+
+_fast_serializers = {}
+
+
+def fast_serializer(serializer_class):
+    if serializer_class not in _fast_serializers:
+        _fast_serializers[serializer_class] = FastSerializer(serializer_class)
+    return _fast_serializers[serializer_class]
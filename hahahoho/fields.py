@@ -0,0 +1,97 @@
+import base64
+import zlib
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 압축한 값은 "\x01<알고리즘>:" 헤더 + base85 문자열로 저장 (헤더가 없으면 압축하지 않은 원문)
+HEADER = '\x01'
+ZLIB = 'zl'
+ZSTD = 'zs'
+
+
+def compress_text(text, algorithm=ZLIB):
+    raw = text.encode()
+    if algorithm == ZSTD:
+        if zstandard is None:
+            raise ImproperlyConfigured("zstd 압축에는 zstandard 패키지가 필요합니다.")
+        compressed = zstandard.ZstdCompressor().compress(raw)
+    else:
+        compressed = zlib.compress(raw, 9)
+    return f'{HEADER}{algorithm}:{base64.b85encode(compressed).decode()}'
+
+
+def decompress_text(value):
+    if not isinstance(value, str) or not value.startswith(HEADER):
+        return value
+    algorithm, _, payload = value[len(HEADER):].partition(':')
+    compressed = base64.b85decode(payload)
+    if algorithm == ZSTD:
+        if zstandard is None:
+            raise ImproperlyConfigured("zstd로 압축된 값을 읽으려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdDecompressor().decompress(compressed).decode()
+    return zlib.decompress(compressed).decode()
+
+
+class CompressedTextField(models.TextField):
+    # 큰 텍스트를 압축해 저장하고 읽을 때 자동으로 풀어 줌 (DB 컬럼은 text 그대로)
+    # min_length 글자 미만이거나 압축해도 줄지 않으면 원문 저장 / 압축된 값은 DB에서 exact 외의 조회(contains 등) 불가
+    def __init__(self, *args, min_length=200, algorithm=ZLIB, **kwargs):
+        self.min_length = min_length
+        self.algorithm = algorithm
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.min_length != 200:
+            kwargs['min_length'] = self.min_length
+        if self.algorithm != ZLIB:
+            kwargs['algorithm'] = self.algorithm
+        return name, path, args, kwargs
+
+    def from_db_value(self, value, expression, connection):
+        return decompress_text(value)
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if value is None:
+            return value
+        # 원문이 헤더로 시작하면 압축된 값과 구분되도록 항상 압축
+        if value.startswith(HEADER):
+            return compress_text(value, self.algorithm)
+        if len(value) < self.min_length:
+            return value
+        compressed = compress_text(value, self.algorithm)
+        return compressed if len(compressed) < len(value.encode()) else value
+
+
+class PreviewField(models.CharField):
+    # source 필드 앞부분을 저장 (저장 / bulk_create 때 자동 갱신, update() / bulk_update()는 직접 지정)
+    # 압축 저장한 필드는 SQL에서 자를 수 없으므로 목록 조회용 미리보기를 따로 둠
+    def __init__(self, *args, source=None, **kwargs):
+        self.source = source
+        kwargs.setdefault('editable', False)
+        kwargs.setdefault('blank', True)
+        kwargs.setdefault('default', '')
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['source'] = self.source
+        for key, value in (('editable', False), ('blank', True), ('default', '')):
+            if kwargs.get(key) == value:
+                del kwargs[key]
+        return name, path, args, kwargs
+
+    def preview(self, text):
+        return (text or '')[:self.max_length]
+
+    def pre_save(self, model_instance, add):
+        value = self.preview(getattr(model_instance, self.source))
+        setattr(model_instance, self.attname, value)
+        return value
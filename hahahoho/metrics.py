@@ -0,0 +1,131 @@
+import hmac
+import threading
+from bisect import bisect_left
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(label_names, label_values, **extra):
+    pairs = [*zip(label_names, label_values), *extra.items()]
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{escape_label(value)}"' for name, value in pairs) + '}'
+
+
+class Counter:
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.values = {}
+
+    def inc(self, label_values, amount=1):
+        self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def render(self):
+        yield f'# HELP {self.name} {self.help_text}'
+        yield f'# TYPE {self.name} counter'
+        for label_values, value in sorted(self.values.items()):
+            yield f'{self.name}{format_labels(self.label_names, label_values)} {value}'
+
+
+class Histogram:
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        # 라벨 값 -> [버킷별 개수..., +Inf 개수, 합계]
+        self.values = {}
+
+    def observe(self, label_values, value):
+        counts = self.values.setdefault(label_values, [0] * (len(self.buckets) + 1) + [0])
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def render(self):
+        yield f'# HELP {self.name} {self.help_text}'
+        yield f'# TYPE {self.name} histogram'
+        for label_values, counts in sorted(self.values.items()):
+            cumulative = 0
+            for bound, count in zip([*self.buckets, '+Inf'], counts):
+                cumulative += count
+                labels = format_labels(self.label_names, label_values, le=bound)
+                yield f'{self.name}_bucket{labels} {cumulative}'
+            labels = format_labels(self.label_names, label_values)
+            yield f'{self.name}_sum{labels} {counts[-1]}'
+            yield f'{self.name}_count{labels} {cumulative}'
+
+
+class RequestMetrics:
+    # 프로세스 단위 집계 / 워커가 여러 개면 워커마다 따로 수집됨
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = Counter('http_requests_total', "처리한 요청 수", ('route', 'method', 'status'))
+        self.budget_exceeded = Counter(
+            'db_query_budget_exceeded_total', "쿼리 예산을 넘은 요청 수", ('route', 'method')
+        )
+        self.duration = Histogram(
+            'http_request_duration_seconds', "요청 처리 시간", ('route', 'method'), DURATION_BUCKETS
+        )
+        self.db_duration = Histogram(
+            'db_query_duration_seconds', "요청당 DB 쿼리 시간 합계", ('route', 'method'), DURATION_BUCKETS
+        )
+        self.render_duration = Histogram(
+            'http_render_duration_seconds', "응답 직렬화(렌더링) 시간", ('route', 'method'), DURATION_BUCKETS
+        )
+        self.queries = Histogram('db_queries_per_request', "요청당 쿼리 수", ('route', 'method'), QUERY_BUCKETS)
+
+    def observe(self, route, method, status, duration, queries, db_duration, render_duration, over_budget):
+        labels = (route, method)
+        with self.lock:
+            self.requests.inc((route, method, str(status)))
+            self.duration.observe(labels, duration)
+            self.db_duration.observe(labels, db_duration)
+            self.render_duration.observe(labels, render_duration)
+            self.queries.observe(labels, queries)
+            if over_budget:
+                self.budget_exceeded.inc(labels)
+
+    def render(self):
+        with self.lock:
+            lines = [
+                line
+                for metric in (
+                    self.requests, self.budget_exceeded, self.duration,
+                    self.db_duration, self.render_duration, self.queries
+                )
+                for line in metric.render()
+            ]
+        return '\n'.join(lines) + '\n'
+
+
+request_metrics = RequestMetrics()
+
+
+def metrics_authorization(token):
+    return f'Bearer {token}'
+
+
+def is_metrics_request(request):
+    token = settings.METRICS_TOKEN
+    if not token:
+        return False
+    authorization = request.headers.get('Authorization', '')
+    return hmac.compare_digest(authorization.encode(), metrics_authorization(token).encode())
+
+
+def metrics_view(request):
+    # Prometheus 텍스트 형식 / Authorization: Bearer <METRICS_TOKEN> 요청만 조회 가능
+    if not is_metrics_request(request):
+        raise Http404
+    return HttpResponse(request_metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,134 @@
+import logging
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from .metrics import request_metrics
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = 'unmatched'
+
+# 현재 요청의 QueryRecorder / async 뷰의 쿼리는 다른 스레드에서 실행되므로 contextvar로 전달
+current_recorder = ContextVar('query_recorder', default=None)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+class QueryRecorder:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+
+def record_query(execute, sql, params, many, context):
+    # 모든 연결에 connection.execute_wrapper와 같은 방식으로 등록되는 wrapper
+    recorder = current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        recorder.count += 1
+        recorder.duration += time.perf_counter() - started
+
+
+def install_query_recorder(connection):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@receiver(connection_created)
+def install_on_connect(sender, connection, **kwargs):
+    install_query_recorder(connection)
+
+
+def get_route(request):
+    # URL 패턴 기준으로 집계 (회원 ID 등 경로 값별로 라벨이 늘어나지 않도록)
+    resolver_match = getattr(request, 'resolver_match', None)
+    if resolver_match is None:
+        return UNMATCHED_ROUTE
+    return resolver_match.route
+
+
+def get_query_budget(route, method):
+    return settings.QUERY_BUDGETS.get((route, method), settings.QUERY_BUDGET_DEFAULT)
+
+
+class RequestMetricsMiddleware:
+    # 요청별 쿼리 수 / DB 시간 / 렌더링 시간 / 전체 시간을 기록하고 쿼리 예산을 검사
+    # (스트리밍 응답은 본문을 보내는 동안 실행되는 쿼리는 집계하지 않음)
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        # 미들웨어보다 먼저 열린 연결에도 wrapper 등록
+        for connection in connections.all(initialized_only=True):
+            install_query_recorder(connection)
+
+        recorder, token = self.start(request)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        return self.finish(request, response, recorder, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        recorder, token = self.start(request)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_recorder.reset(token)
+        return self.finish(request, response, recorder, time.perf_counter() - started)
+
+    def start(self, request):
+        recorder = QueryRecorder()
+        # 벤치마크 등에서 응답의 요청 객체로 쿼리 수를 확인할 수 있도록 보관
+        request.query_recorder = recorder
+        request.render_duration = 0.0
+        return recorder, current_recorder.set(recorder)
+
+    def finish(self, request, response, recorder, duration):
+        route = get_route(request)
+        budget = get_query_budget(route, request.method)
+        over_budget = budget is not None and recorder.count > budget
+        request_metrics.observe(
+            route, request.method, response.status_code, duration,
+            recorder.count, recorder.duration, request.render_duration, over_budget
+        )
+
+        if over_budget:
+            message = f"쿼리 예산 초과: {request.method} {route} ({recorder.count}개 실행, 예산 {budget}개)"
+            if settings.QUERY_BUDGET_RAISE:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF Response는 이 직후 render()로 직렬화되므로 렌더링이 끝날 때까지의 시간을 기록
+        started = time.perf_counter()
+
+        def record_render_duration(rendered_response):
+            request.render_duration = time.perf_counter() - started
+
+        response.add_post_render_callback(record_render_duration)
+        return response
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import threading
+from functools import lru_cache
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+from django.http import Http404, HttpResponse
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.utils.module_loading import autodiscover_modules
+
+# drf_yasg와 각 앱의 문서 주석(swagger.py)은 워커 시작 시간을 줄이기 위해 스키마를 만들 때만 import
+API_TITLE = 'wish'
+API_VERSION = '1.1.1'
+
+CONTENT_TYPES = {
+    'json': 'application/json',
+    'yaml': 'application/yaml; charset=utf-8',
+}
+OPERATIONS_KEY = 'x-operations'
+# 현재 배포할 스키마 버전(JSON 내용의 해시)을 적어 두는 파일
+CURRENT_FILE = 'schema-current'
+
+
+def schema_version(documents):
+    # 내용이 바뀌면 파일 이름도 바뀌도록 JSON 내용의 sha256 앞부분 사용
+    return hashlib.sha256(documents['json']).hexdigest()[:12]
+
+
+def schema_path(extension, version=None):
+    # 버전별 파일 (예: openapi/schema-3f2a9c0d1b7e.json) / version이 없으면 현재 버전
+    if version is None:
+        current = settings.OPENAPI_SCHEMA_DIR / CURRENT_FILE
+        if not current.exists():
+            return None
+        version = current.read_text().strip()
+    return settings.OPENAPI_SCHEMA_DIR / f'schema-{version}.{extension}'
+
+
+def write_schema(documents):
+    # 새 버전 파일을 모두 쓴 뒤 현재 버전을 바꿈 (이전 버전 파일은 그대로 둠) / 저장한 경로 목록 반환
+    version = schema_version(documents)
+    directory = settings.OPENAPI_SCHEMA_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for extension, content in documents.items():
+        path = schema_path(extension, version)
+        path.write_bytes(content)
+        paths.append(path)
+
+    temporary = directory / f'{CURRENT_FILE}.tmp'
+    temporary.write_text(version)
+    temporary.replace(directory / CURRENT_FILE)
+    return paths
+
+
+@lru_cache(maxsize=None)
+def load_annotations():
+    # 각 앱의 swagger.py가 뷰에 swagger_auto_schema 주석을 붙임 (프로세스당 한 번)
+    autodiscover_modules('swagger')
+
+
+def get_api_info():
+    from drf_yasg import openapi
+
+    return openapi.Info(
+        title=API_TITLE,
+        default_version=API_VERSION,
+        description='wish API 문서',
+        terms_of_service='https://www.google.com/policies/terms/',
+        contact=openapi.Contact(email='930_10@naver.com'),
+        license=openapi.License(name='mit')
+    )
+
+
+def get_generator():
+    from drf_yasg.generators import OpenAPISchemaGenerator
+
+    return OpenAPISchemaGenerator(get_api_info())
+
+
+def live_operations(generator=None):
+    # 현재 URLconf의 (메서드, 경로) 목록 / 뷰 내부는 살펴보지 않아 스키마 생성보다 훨씬 가벼움
+    generator = generator or get_generator()
+    return sorted(
+        f'{method} {path}'
+        for path, (_, methods) in generator.get_endpoints(None).items()
+        for method, _ in methods
+    )
+
+
+def build_schema():
+    # 전체 뷰를 살펴 스키마 생성 (배포 시 build_openapi_schema 명령으로 한 번만 실행)
+    from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+
+    load_annotations()
+    generator = get_generator()
+    schema = generator.get_schema(request=None, public=True)
+    schema[OPERATIONS_KEY] = live_operations(generator)
+    return {
+        'json': OpenAPICodecJson(validators=[]).encode(schema),
+        'yaml': OpenAPICodecYaml(validators=[]).encode(schema),
+    }
+
+
+class SchemaDocuments:
+    # 미리 생성한 스키마 파일을 프로세스당 한 번 읽어 메모리에서 응답
+    # (파일이 없으면 처음 요청 때 한 번 생성)
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.documents = None
+
+    def load(self):
+        documents = {}
+        for extension in CONTENT_TYPES:
+            path = schema_path(extension)
+            if path is None or not path.exists():
+                return None
+            documents[extension] = path.read_bytes()
+        return documents
+
+    def get(self, extension):
+        with self.lock:
+            if self.documents is None:
+                documents = self.load() or build_schema()
+                self.documents = {
+                    extension: (content, quote_etag(hashlib.sha256(content).hexdigest()))
+                    for extension, content in documents.items()
+                }
+        return self.documents[extension]
+
+    def clear(self):
+        with self.lock:
+            self.documents = None
+
+
+schema_documents = SchemaDocuments()
+
+
+def schema_document(request, format):
+    extension = format.lstrip('.')
+    if extension not in CONTENT_TYPES:
+        raise Http404
+    content, etag = schema_documents.get(extension)
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(content, content_type=CONTENT_TYPES[extension])
+    response.headers['ETag'] = etag
+    patch_cache_control(response, public=True, max_age=settings.OPENAPI_SCHEMA_CACHE_TIMEOUT)
+    return response
+
+
+def render_ui(request, renderer_name):
+    # drf_yasg UI 템플릿만 렌더링 / 스키마는 브라우저가 SPEC_URL(schema-json)에서 따로 받음
+    from drf_yasg import renderers
+
+    renderer = getattr(renderers, renderer_name)()
+    context = {'request': request}
+    renderer.set_context(context, SimpleNamespace(info=SimpleNamespace(title=API_TITLE, version=API_VERSION)))
+    return HttpResponse(render_to_string(renderer.template, context, request))
+
+
+def swagger_ui(request):
+    return render_ui(request, 'SwaggerUIRenderer')
+
+
+def redoc_ui(request):
+    return render_ui(request, 'ReDocRenderer')
+
+
+@register(Tags.urls, deploy=True)
+def check_schema_file(app_configs, **kwargs):
+    # 미리 생성한 스키마가 현재 URLconf와 같은지 확인
+    # drf_yasg를 import하고 URLconf 전체를 살피므로 check --deploy에서만 실행 (일반 manage.py 명령은 건너뜀)
+    path = schema_path('json')
+    if path is None or not path.exists():
+        return [Warning(
+            f"OpenAPI 스키마 파일이 {settings.OPENAPI_SCHEMA_DIR}에 없어 첫 요청 때 생성합니다.",
+            hint="배포 시 python manage.py build_openapi_schema 를 실행하세요.",
+            id='hahahoho.W001'
+        )]
+
+    built = json.loads(path.read_bytes()).get(OPERATIONS_KEY)
+    live = live_operations()
+    if built != live:
+        missing = sorted(set(live) - set(built or []))
+        removed = sorted(set(built or []) - set(live))
+        # Error로 두면 모든 manage.py 명령(다시 생성하는 build_openapi_schema 포함)이 멈추므로 경고만
+        return [Warning(
+            f"OpenAPI 스키마 파일({path})이 현재 URLconf와 다릅니다. 추가: {missing}, 삭제: {removed}",
+            hint="python manage.py build_openapi_schema 로 다시 생성하세요.",
+            id='hahahoho.W002'
+        )]
+    return []
@@ -0,0 +1,72 @@
+import base64
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+INVALID_CURSOR_MESSAGE = "올바르지 않은 커서입니다."
+INVALID_PAGE_SIZE_MESSAGE = "page_size는 1 이상의 정수여야 합니다."
+
+
+# 커서는 (created_at, id)를 base64로 감싼 불투명한 문자열
+def encode_cursor(created_at, pk):
+    raw = json.dumps([created_at.isoformat(), pk]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, pk = json.loads(base64.urlsafe_b64decode(padded))
+        created_at = parse_datetime(created_at)
+    except (ValueError, TypeError):
+        raise ValidationError({"cursor": INVALID_CURSOR_MESSAGE})
+
+    if created_at is None or not isinstance(pk, int):
+        raise ValidationError({"cursor": INVALID_CURSOR_MESSAGE})
+    return created_at, pk
+
+
+def get_page_size(request):
+    page_size = request.query_params.get('page_size')
+    if page_size is None:
+        return settings.PAGINATION_PAGE_SIZE
+
+    try:
+        page_size = int(page_size)
+    except ValueError:
+        raise ValidationError({"page_size": INVALID_PAGE_SIZE_MESSAGE})
+    if page_size < 1:
+        raise ValidationError({"page_size": INVALID_PAGE_SIZE_MESSAGE})
+    return min(page_size, settings.PAGINATION_MAX_PAGE_SIZE)
+
+
+def keyset_queryset(queryset, cursor):
+    # 최신순 (created_at, id) 정렬 / 커서 이후의 행만 조회
+    queryset = queryset.order_by('-created_at', '-id')
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        )
+    return queryset
+
+
+def instance_cursor_key(instance):
+    return instance.created_at, instance.pk
+
+
+def paginate_keyset(queryset, request, cursor_key=instance_cursor_key):
+    # cursor_key: 행 -> (created_at, id) / .values_list() 행을 페이지로 나눌 때 사용
+    page_size = get_page_size(request)
+    queryset = keyset_queryset(queryset, request.query_params.get('cursor'))
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    rows = list(queryset[:page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(*cursor_key(rows[-1]))
+    return rows, next_cursor
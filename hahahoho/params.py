@@ -0,0 +1,14 @@
+from rest_framework.exceptions import ValidationError
+
+
+def get_positive_int(query_params, name, default, maximum=None):
+    value = query_params.get(name)
+    if value is None:
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise ValidationError({name: f"{name}는 1 이상의 정수여야 합니다."})
+    return min(value, maximum) if maximum else value
@@ -0,0 +1,30 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+
+class FastJSONRenderer(JSONRenderer):
+    # orjson으로 렌더링 / orjson이 없거나 들여쓰기 요청 등 기본 설정과 다르면 DRF JSONRenderer 그대로 사용
+    # (날짜 / Decimal 등은 DRF 인코더로 변환해 같은 출력 유지, 1e-4 미만 / 1e16 이상 실수는 지수 표기만 다름)
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.ensure_ascii or not self.compact \
+                or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # 64비트를 넘는 정수 등
+            return super().render(data, accepted_media_type, renderer_context)
+        # DRF와 같이 \u2028 / \u2029는 이스케이프
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -62,10 +62,97 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
   'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'accounts.authentication.CachedTokenAuthentication',
     ],
+  'DEFAULT_RENDERER_CLASSES': [
+        'hahahoho.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
+# 워커 간 공유 캐시 (예: CACHE_URL=redis://127.0.0.1:6379/1) / 지정하지 않으면 프로세스별 메모리 캐시
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+SHARED_CACHE = CACHES['default']['BACKEND'] not in (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# 토큰 인증 캐시 (LOCAL_TTL: 프로세스 LRU 유지 시간, CACHE_TTL: Django 캐시 유지 시간 / 초)
+# 토큰 삭제 / 회원 비활성화는 다른 워커에 최대 max(LOCAL_TTL, CACHE_TTL)초 늦게 반영
+# 공유 캐시가 아니면 다른 워커에서 무효화할 수 없으므로 Django 캐시는 사용하지 않음 (CACHE_TTL 0)
+TOKEN_AUTH_CACHE = {
+    'MAX_SIZE': 1024,
+    'LOCAL_TTL': 30,
+    'CACHE_TTL': 60 * 5 if SHARED_CACHE else 0,
+}
+
+# 부부 / 배우자 조회 캐시 유지 시간 (초)
+# 공유 캐시가 아니면 부부 삭제 / 회원 정보 변경을 다른 워커에서 무효화할 수 없으므로 캐시하지 않음 (0)
+COUPLE_CACHE_TIMEOUT = 60 * 60 if SHARED_CACHE else 0
+
+# 요청당 쿼리 수 예산 ((URL 패턴, 메서드) 기준, 인증 / 트랜잭션 savepoint 포함)
+# 없는 조합은 QUERY_BUDGET_DEFAULT / 초과 시 경고 로그, 테스트에서는 예외 (QUERY_BUDGET_RAISE)
+QUERY_BUDGETS = {
+    ('accounts/couple/data/', 'GET'): 3,
+    ('accounts/couple/data/async/', 'GET'): 3,
+    ('emotions/missions/', 'GET'): 2,
+    ('emotions/missions/async/', 'GET'): 2,
+    ('emotions/results/', 'GET'): 3,
+    # 감정 기록 + 관심사 + 해시태그 카운터 + 주간 미션 집계
+    ('emotions/results/', 'POST'): 17,
+    ('emotions/interests/', 'GET'): 3,
+    # 관심사 + 해시태그 카운터
+    ('emotions/interests/', 'POST'): 10,
+    ('counsels/records/', 'GET'): 3,
+    ('counsels/records/search/', 'GET'): 2,
+    ('infertility/tests/', 'GET'): 3,
+}
+QUERY_BUDGET_DEFAULT = 20
+QUERY_BUDGET_RAISE = False
+
+# 미리 생성한 OpenAPI 스키마 위치 (build_openapi_schema) / 브라우저 캐시 시간 (초)
+OPENAPI_SCHEMA_DIR = BASE_DIR / 'openapi'
+OPENAPI_SCHEMA_CACHE_TIMEOUT = 60 * 60
+
+# Swagger / ReDoc UI는 미리 생성한 스키마 파일을 받아 표시
+SWAGGER_SETTINGS = {
+    'SPEC_URL': ('schema-json', {'format': '.json'}),
+}
+REDOC_SETTINGS = {
+    'SPEC_URL': ('schema-json', {'format': '.json'}),
 }
 
+# /metrics 조회 토큰 (Prometheus의 bearer_token) / 비어 있으면 /metrics를 열지 않음
+# 리버스 프록시 뒤에서는 REMOTE_ADDR가 프록시 주소이므로 IP로 제한하지 않음
+METRICS_TOKEN = env("METRICS_TOKEN", default='')
+
+# 목록 API 페이지네이션 / NDJSON 스트리밍 설정
+PAGINATION_PAGE_SIZE = 20
+PAGINATION_MAX_PAGE_SIZE = 100
+STREAM_CHUNK_SIZE = 500
+
+# 버퍼링 카운터 (hahahoho.counters.BufferedCounter) / FLUSH_SIZE번 증가 또는 FLUSH_INTERVAL초마다 DB에 반영
+COUNTER_BUFFER = {
+    'FLUSH_SIZE': 100,
+    'FLUSH_INTERVAL': 5,
+}
+
+# 상담 기록 검색 색인의 글자 n-gram 크기 (바꾸면 색인을 다시 만들어야 함)
+COUNSEL_SEARCH_NGRAM = 2
+
+# 감정 기록 일괄 등록 설정
+EMOTION_BULK_MAX_ITEMS = 5000
+EMOTION_BULK_BATCH_SIZE = 500
+
+# 점수 스냅샷(export_score_snapshot)에서 아직 내보내지 않는 최근 행의 기간 (초)
+# id는 커밋 전에 발급되므로 이보다 오래 열려 있는 트랜잭션의 행은 스냅샷에서 빠질 수 있음
+SNAPSHOT_EXPORT_LAG = 60 * 5
+
+# 감정 추이 분석 결과 캐시 시간 (초)
+EMOTION_TRENDS_CACHE_TIMEOUT = 60 * 60 * 24
+
 CORS_ALLOWED_ORIGINS = [
   # 'http://wishkr.site',
   'http://localhost:5173',
@@ -103,6 +190,7 @@ CORS_ALLOW_CREDENTIALS = True
 
 
 MIDDLEWARE = [
+    'hahahoho.middleware.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.security.SecurityMiddleware',
@@ -116,6 +204,9 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'hahahoho.urls'
 
+# 테스트에서는 쿼리 예산 초과 시 실패
+TEST_RUNNER = 'hahahoho.test_runner.QueryBudgetTestRunner'
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
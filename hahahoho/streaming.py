@@ -0,0 +1,72 @@
+import re
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+
+from .fast_serializers import fast_serializer
+from .renderers import FastJSONRenderer
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+TRUE_VALUES = ('1', 'true', 'True')
+ACCEPTS_GZIP = re.compile(r'\bgzip\b')
+
+
+def is_stream_request(request):
+    return request.query_params.get('stream') in TRUE_VALUES
+
+
+def accepts_gzip(request):
+    return bool(ACCEPTS_GZIP.search(request.META.get('HTTP_ACCEPT_ENCODING', '')))
+
+
+def serialized_rows(queryset, serializer_class, chunk_size=None):
+    # 일반 응답과 같은 형식의 dict를 청크 단위로 읽으며 하나씩 생성 (전체 목록을 메모리에 올리지 않음)
+    # PostgreSQL에서는 .iterator()가 서버 측 커서를 사용
+    chunk_size = chunk_size or settings.STREAM_CHUNK_SIZE
+    serializer = fast_serializer(serializer_class)
+    return serializer.iter_serialize(serializer.values(queryset).iterator(chunk_size=chunk_size))
+
+
+def ndjson_lines(queryset, serializer_class, chunk_size=None):
+    # 한 줄에 레코드 하나씩, 일반 응답과 같은 JSON 형식으로 직렬화
+    renderer = FastJSONRenderer()
+    for data in serialized_rows(queryset, serializer_class, chunk_size):
+        yield renderer.render(data) + b'\n'
+
+
+def batched_lines(lines, size=None):
+    # 줄을 size개씩 묶어 보냄 (쓰기 / gzip flush 횟수를 줄임)
+    size = size or settings.STREAM_CHUNK_SIZE
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield b''.join(batch)
+            batch = []
+    if batch:
+        yield b''.join(batch)
+
+
+def ndjson_response(queryset, serializer_class, chunk_size=None):
+    return StreamingHttpResponse(
+        ndjson_lines(queryset, serializer_class, chunk_size),
+        content_type=NDJSON_CONTENT_TYPE
+    )
+
+
+def ndjson_stream_response(request, lines, filename=None):
+    # Accept-Encoding에 gzip이 있으면 압축해서 보냄
+    content = batched_lines(lines)
+    compressed = accepts_gzip(request)
+    if compressed:
+        content = compress_sequence(content)
+
+    response = StreamingHttpResponse(content, content_type=NDJSON_CONTENT_TYPE)
+    if compressed:
+        response.headers['Content-Encoding'] = 'gzip'
+    patch_vary_headers(response, ('Accept-Encoding',))
+    if filename:
+        response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
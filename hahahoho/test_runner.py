@@ -0,0 +1,9 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+class QueryBudgetTestRunner(DiscoverRunner):
+    # 운영에서는 경고만 남기는 쿼리 예산 초과를 테스트에서는 실패로 처리
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        settings.QUERY_BUDGET_RAISE = True
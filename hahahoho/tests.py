@@ -0,0 +1,303 @@
+import json
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.checks.registry import registry
+from django.core.management import call_command
+from django.db.models import TextField
+from django.db.models.functions import Cast
+from django.test import TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from accounts.models import Couple
+from counsels.models import Counsel
+from counsels.serializers import CounselSerializer
+from emotions.models import Emotion, Interest
+from emotions.serializers import EmotionSerializers, InterestSerializers
+from emotions.tests import build_emotion
+from infertilitytests.models import Infertility
+from infertilitytests.serializers import InfertilitySerializer
+from .benchmark import is_test_database, remove_seeded_members, seed_couples
+from .fast_serializers import fast_serializer
+from .fields import HEADER
+from .metrics import metrics_authorization, request_metrics
+from .openapi import (
+    OPERATIONS_KEY, build_schema, check_schema_file, schema_documents, schema_path, schema_version, write_schema
+)
+from .middleware import QueryBudgetExceeded
+from .renderers import FastJSONRenderer
+from .testutils import create_members
+
+MISSIONS_ROUTE = ('emotions/missions/', 'GET')
+ASYNC_MISSIONS_ROUTE = ('emotions/missions/async/', 'GET')
+# 워커 시작 (WSGI 앱 + URLconf import) 시간 상한 (ms)
+WSGI_IMPORT_BUDGET_MS = 1500
+METRICS_TOKEN = 'metrics-token'
+
+
+def observed_queries(labels):
+    # (요청 수, 쿼리 수 합계)
+    counts = request_metrics.queries.values.get(labels)
+    if counts is None:
+        return 0, 0
+    return sum(counts[:-1]), counts[-1]
+
+
+@override_settings(METRICS_TOKEN=METRICS_TOKEN)
+class RequestMetricsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        wife, husband = create_members(2)
+        cls.couple = Couple.objects.create(wife=wife, husband=husband)
+
+    def setUp(self):
+        cache.clear()
+        self.params = {'member_id': self.couple.wife_id}
+
+    def test_records_queries_per_route(self):
+        requests, queries = observed_queries(MISSIONS_ROUTE)
+        self.client.get('/emotions/missions/', self.params)
+        # 부부 조회 + 미션 집계 조회
+        self.assertEqual(observed_queries(MISSIONS_ROUTE), (requests + 1, queries + 2))
+
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION=metrics_authorization(METRICS_TOKEN))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            'db_queries_per_request_bucket{route="emotions/missions/",method="GET",le="2"}',
+            response.content.decode()
+        )
+
+    async def test_records_queries_of_async_views(self):
+        requests, queries = observed_queries(ASYNC_MISSIONS_ROUTE)
+        await self.async_client.get('/emotions/missions/async/', self.params)
+        self.assertEqual(observed_queries(ASYNC_MISSIONS_ROUTE), (requests + 1, queries + 2))
+
+    @override_settings(QUERY_BUDGETS={MISSIONS_ROUTE: 1})
+    def test_query_budget(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get('/emotions/missions/', self.params)
+
+        cache.clear()
+        with override_settings(QUERY_BUDGET_RAISE=False), self.assertLogs('hahahoho.middleware', 'WARNING'):
+            response = self.client.get('/emotions/missions/', self.params)
+        self.assertEqual(response.status_code, 200)
+
+    def test_post_within_query_budget(self):
+        # 테스트 실행기에서는 예산 초과 시 QueryBudgetExceeded
+        member_id = self.couple.wife_id
+        posts = [
+            ('/emotions/results/', {**EmotionSerializers(build_emotion(self.couple.wife)).data, 'is_complement': True}),
+            ('/emotions/interests/', {'member_id': member_id, 'interests': "#꽃 #결혼 #아이"}),
+            ('/counsels/records/', {'member_id': member_id, 'summary': "요약", 'tags': "#불안", 'count': 1}),
+            ('/infertility/tests/', {
+                'member_id': member_id, 'total': 100, 'social': 10, 'sexual': 10, 'relational': 10,
+                'refusing': 10, 'essential': 10
+            }),
+        ]
+        for path, data in posts:
+            response = self.client.post(path, data, content_type='application/json')
+            self.assertEqual(response.status_code, 201, path)
+
+    def test_metrics_requires_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION=metrics_authorization('wrong'))
+        self.assertEqual(response.status_code, 404)
+
+        with override_settings(METRICS_TOKEN=''):
+            response = self.client.get('/metrics', HTTP_AUTHORIZATION=metrics_authorization(''))
+            self.assertEqual(response.status_code, 404)
+
+
+class BenchmarkSeedingTests(TestCase):
+    def test_removes_only_seeded_members(self):
+        real_member, = create_members(1, prefix='benchmark_fan')
+        self.assertTrue(is_test_database())
+
+        members = seed_couples(1, emotions=2, interests=2, counsels=2, tests=2)
+        remove_seeded_members(members)
+
+        User = get_user_model()
+        self.assertFalse(User.objects.filter(pk__in=[member_id for member_id, _ in members]).exists())
+        self.assertTrue(User.objects.filter(pk=real_member.pk).exists())
+        self.assertFalse(Emotion.objects.exists())
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, = create_members(1)
+        cls.emotion = build_emotion(cls.member)
+        cls.emotion.save()
+
+    def setUp(self):
+        cache.clear()
+        self.detail = f'/emotions/results/{self.emotion.pk}/'
+        self.list = '/emotions/results/'
+        self.params = {'member_id': self.member.pk}
+
+    def test_not_modified(self):
+        response = self.client.get(self.detail)
+        etag = response.headers['ETag']
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response.headers)
+
+        # 버전 조회 1번만 실행하고 뷰는 실행하지 않음
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        response = self.client.get(self.list, self.params)
+        response = self.client.get(self.list, self.params, HTTP_IF_NONE_MATCH=response.headers['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_mismatched_etag(self):
+        response = self.client.get(self.detail, HTTP_IF_NONE_MATCH='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['result']['id'], self.emotion.pk)
+
+        etag = response.headers['ETag']
+        self.client.put(self.detail, {'self_message': "수정"}, content_type='application/json')
+        response = self.client.get(self.detail, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_other_methods_pass_through(self):
+        etag = self.client.get(self.detail).headers['ETag']
+        response = self.client.put(
+            self.detail, {'self_message': "수정"}, content_type='application/json', HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response.headers)
+
+    def test_authentication_runs_before_version_check(self):
+        # 잘못된 토큰이면 304 / ETag로 기록 존재 여부를 알 수 없음
+        etag = self.client.get(self.detail).headers['ETag']
+        for path, params in ((self.detail, {}), (self.list, self.params)):
+            with self.assertNumQueries(1):
+                response = self.client.get(
+                    path, params, HTTP_IF_NONE_MATCH=etag, HTTP_AUTHORIZATION='Token invalid'
+                )
+            self.assertEqual(response.status_code, 401)
+            self.assertNotIn('ETag', response.headers)
+
+
+class FastSerializationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        member, = create_members(1)
+        Emotion.objects.bulk_create([build_emotion(member) for _ in range(3)])
+        Interest.objects.create(member_id=member, interests="#꽃 \u2028 \"결혼\"")
+        Counsel.objects.create(member_id=member, summary="요약", tags="#불안", count=3)
+        Infertility.objects.bulk_create([
+            Infertility(member_id=member, total=100, social=10, sexual=10, relational=10, refusing=10,
+                        essential=10, belifs=belifs)
+            for belifs in ("괜찮아", None)
+        ])
+
+    def assert_same_output(self, serializer_class, queryset):
+        expected = JSONRenderer().render(serializer_class(queryset, many=True).data)
+        rendered = FastJSONRenderer().render(fast_serializer(serializer_class).serialize_queryset(queryset))
+        self.assertEqual(rendered, expected)
+
+    def test_matches_model_serializers(self):
+        self.assert_same_output(EmotionSerializers, Emotion.objects.order_by('id'))
+        self.assert_same_output(InterestSerializers, Interest.objects.order_by('id'))
+        self.assert_same_output(CounselSerializer, Counsel.objects.order_by('id'))
+        self.assert_same_output(InfertilitySerializer, Infertility.objects.order_by('id'))
+
+    @override_settings(TIME_ZONE='UTC')
+    def test_matches_model_serializers_in_utc(self):
+        self.assert_same_output(EmotionSerializers, Emotion.objects.order_by('id'))
+
+
+class OpenAPISchemaTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(OPENAPI_SCHEMA_DIR=Path(directory.name))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        schema_documents.clear()
+        self.addCleanup(schema_documents.clear)
+
+        self.documents = build_schema()
+        write_schema(self.documents)
+
+    def test_serves_prebuilt_schema_with_etag(self):
+        response = self.client.get('/swagger.json')
+        self.assertEqual(response.content, self.documents['json'])
+
+        response = self.client.get('/swagger.json', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_check_detects_stale_schema(self):
+        self.assertEqual(check_schema_file(None), [])
+
+        schema = json.loads(self.documents['json'])
+        schema[OPERATIONS_KEY].append('get /removed/')
+        stale = {**self.documents, 'json': json.dumps(schema).encode()}
+        stale_paths = write_schema(stale)
+        self.assertEqual([error.id for error in check_schema_file(None)], ['hahahoho.W002'])
+
+        # 검사 경고가 있어도 다시 생성 / 이전 버전 파일은 다른 이름으로 남음
+        call_command('build_openapi_schema', stdout=StringIO())
+        self.assertEqual(check_schema_file(None), [])
+        self.assertEqual(schema_path('json').read_bytes(), self.documents['json'])
+        self.assertEqual(schema_path('json').name, f'schema-{schema_version(self.documents)}.json')
+        self.assertNotIn(schema_path('json'), stale_paths)
+        self.assertTrue(all(path.exists() for path in stale_paths))
+
+
+class ColdStartTests(TestCase):
+    def test_wsgi_import_time(self):
+        # 새 프로세스에서 python -X importtime으로 측정 / drf_yasg 문서 주석은 스키마를 만들 때만 import
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c',
+             'import hahahoho.wsgi, hahahoho.urls'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, check=True
+        )
+        imports = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            imports[name.strip()] = int(cumulative) / 1000
+
+        self.assertEqual([name for name in imports if name.startswith('drf_yasg.')], [])
+        self.assertNotIn('emotions.swagger', imports)
+        started = imports['hahahoho.wsgi'] + imports['hahahoho.urls']
+        self.assertLess(started, WSGI_IMPORT_BUDGET_MS, f"워커 시작 import {started:.0f}ms")
+
+    def test_schema_check_runs_only_on_deploy(self):
+        # 스키마 검사는 drf_yasg를 불러오므로 manage.py 명령마다 실행되지 않고 check --deploy에서만
+        self.assertNotIn(check_schema_file, registry.get_checks(include_deployment_checks=False))
+        self.assertIn(check_schema_file, registry.get_checks(include_deployment_checks=True))
+
+
+class CompressedTextFieldTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, = create_members(1)
+
+    def stored_summary(self, counsel):
+        return Counsel.objects.filter(pk=counsel.pk).values_list(Cast('summary', TextField()), flat=True).get()
+
+    def test_round_trip(self):
+        long_summary = "오늘 상담에서 불안한 마음을 이야기했다. " * 50
+        for summary in (long_summary, "짧은 요약", HEADER + "헤더로 시작하는 원문"):
+            counsel = Counsel.objects.create(member_id=self.member, summary=summary, tags="#불안", count=1)
+            self.assertEqual(Counsel.objects.get(pk=counsel.pk).summary, summary)
+            self.assertEqual(Counsel.objects.values_list('summary', flat=True).get(pk=counsel.pk), summary)
+
+        counsel = Counsel.objects.create(member_id=self.member, summary=long_summary, tags="#불안", count=1)
+        stored = self.stored_summary(counsel)
+        self.assertTrue(stored.startswith(HEADER))
+        self.assertLess(len(stored.encode()), len(long_summary.encode()) // 4)
+        self.assertEqual(counsel.summary_preview, long_summary[:100])
@@ -0,0 +1,63 @@
+import re
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def create_members(count, prefix='member'):
+    # 짝수 번째는 아내(W), 홀수 번째는 남편(M)
+    User = get_user_model()
+    return User.objects.bulk_create([
+        User(
+            username=f'{prefix}{i}',
+            email=f'{prefix}{i}@example.com',
+            gender='M' if i % 2 else 'W',
+            is_infertility=False
+        )
+        for i in range(count)
+    ])
+
+
+class QueryPlanAssertionsMixin:
+    # 엔드포인트가 실행한 쿼리의 실행 계획에 풀스캔이나 추가 정렬이 없는지 검사
+
+    def capture_queries(self, func, *args, **kwargs):
+        with CaptureQueriesContext(connection) as context:
+            response = func(*args, **kwargs)
+        return response, [query['sql'] for query in context.captured_queries]
+
+    def analyze_tables(self, *tables):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                for table in tables:
+                    cursor.execute(f'ANALYZE {connection.ops.quote_name(table)}')
+            else:
+                cursor.execute('ANALYZE')
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(f'EXPLAIN {sql}')
+                return [row[0] for row in cursor.fetchall()]
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+
+    def plan_problems(self, plan, table):
+        problems = []
+        for line in plan:
+            if connection.vendor == 'postgresql':
+                if f'Seq Scan on {table}' in line or re.search(r'\bSort\b', line):
+                    problems.append(line.strip())
+            elif re.match(rf'SCAN {table}\b', line.strip()) or 'USE TEMP B-TREE' in line:
+                problems.append(line.strip())
+        return problems
+
+    def assert_indexed_plans(self, queries, table):
+        table_queries = [sql for sql in queries if f'FROM "{table}"' in sql]
+        self.assertTrue(table_queries, f'{table}에 대한 쿼리가 실행되지 않았습니다.')
+
+        for sql in table_queries:
+            plan = self.explain(sql)
+            problems = self.plan_problems(plan, table)
+            self.assertFalse(problems, '\n'.join([sql, *plan]))
@@ -17,29 +17,17 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include, re_path
 
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-
-schema_view = get_schema_view(
-    openapi.Info(
-        title='wish',
-        default_version='1.1.1',
-        description='wish API 문서',
-        terms_of_service='https://www.google.com/policies/terms/',
-        contact=openapi.Contact(email='930_10@naver.com'),
-        license=openapi.License(name='mit')
-    ),
-    public=True,
-    permission_classes=[permissions.AllowAny]
-)
+from .metrics import metrics_view
+from .openapi import redoc_ui, schema_document, swagger_ui
 
 urlpatterns = [
-    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    path('swagger', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc-v1'),
+    # 배포 시 build_openapi_schema로 생성한 스키마를 메모리에서 응답
+    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_document, name='schema-json'),
+    path('swagger', swagger_ui, name='schema-swagger-ui'),
+    path('redoc', redoc_ui, name='schema-redoc-v1'),
 
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view),
     path('accounts/', include('accounts.urls')),
     path('counsels/', include('counsels.urls')),
     path('emotions/', include('emotions.urls')),
@@ -0,0 +1,54 @@
+from django.db.models import F, Q, Subquery, Window
+from django.db.models.functions import Lag
+
+from hahahoho.fast_serializers import fast_serializer
+from .models import Infertility
+from .serializers import InfertilitySerializer
+
+SCORE_FIELDS = ('total', 'social', 'sexual', 'relational', 'refusing', 'essential')
+MAX_HISTORY = 50
+
+
+def member_tests(test_pk):
+    # test_pk 검사를 받은 회원의 검사 전체 (회원 ID는 서브쿼리로)
+    return Infertility.objects.filter(
+        member_id=Subquery(Infertility.objects.filter(pk=test_pk).values('member_id'))
+    )
+
+
+def history_queryset(test_pk):
+    # test_pk 검사와 그 이전 검사들 (최신순) / 각 행에 바로 이전 검사의 점수(Lag)를 함께 조회
+    current = Infertility.objects.filter(pk=test_pk)
+    created_at = Subquery(current.values('created_at'))
+    order = [F('created_at').asc(), F('id').asc()]
+    return member_tests(test_pk).filter(
+        Q(created_at__lt=created_at) | Q(created_at=created_at, id__lte=test_pk)
+    ).annotate(**{
+        f'previous_{field}': Window(Lag(field), order_by=order) for field in SCORE_FIELDS
+    }).order_by('-created_at', '-id')
+
+
+def score_deltas(row, indexes):
+    # 이전 검사 대비 점수 변화 / 이전 검사가 없으면 None
+    deltas = {}
+    for field, (index, previous_index) in indexes.items():
+        previous = row[previous_index]
+        deltas[field] = None if previous is None else row[index] - previous
+    return deltas
+
+
+def get_test_history(test_pk, count):
+    # [(검사, 이전 검사 대비 변화)] / 첫 항목이 test_pk 검사, 이후 이전 검사 count개까지 (쿼리 1번)
+    serializer = fast_serializer(InfertilitySerializer)
+    width = len(serializer.sources)
+    indexes = {
+        field: (serializer.index(field), width + position) for position, field in enumerate(SCORE_FIELDS)
+    }
+    rows = list(
+        history_queryset(test_pk)
+        .values_list(*serializer.sources, *[f'previous_{field}' for field in SCORE_FIELDS])[:count + 1]
+    )
+    if not rows or rows[0][serializer.index('id')] != test_pk:
+        return []
+    tests = serializer.serialize([row[:width] for row in rows])
+    return [(test, score_deltas(row, indexes)) for test, row in zip(tests, rows)]
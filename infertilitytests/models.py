@@ -11,4 +11,9 @@ class Infertility(models.Model):
     refusing = models.IntegerField()
     essential = models.IntegerField()
     belifs = models.TextField(null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
\ No newline at end of file
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['member_id', '-created_at', '-id'], name='infertility_member_created_idx'),
+        ]
@@ -0,0 +1,156 @@
+# Swagger(drf_yasg) 문서 주석 / 스키마를 만들 때만 import (hahahoho.openapi.load_annotations)
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+
+from . import views
+from .serializers import InfertilitySerializer
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description='사용자의 모든 난임척도검사 결과 조회',
+    manual_parameters=[
+        openapi.Parameter(
+            'memberId',
+            openapi.IN_QUERY,
+            description='검사 결과를 조회할 사용자의 ID',
+            type=openapi.TYPE_INTEGER,
+            required=True
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="난임 검사 결과 조회 성공 / 가장 최신순으로 정렬됨",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "totalTests": [
+                            {
+                                "id": 2,
+                                "member_id": 5,
+                                "total": 70,
+                                "social": 20,
+                                "sexual": 15,
+                                "relational": 15,
+                                "refusing": 10,
+                                "essential": 10,
+                                "created_at": "2024-10-27T12:34:56"
+                            },
+                            {
+                                "id": 1,
+                                "member_id": 5,
+                                "total": 70,
+                                "social": 20,
+                                "sexual": 15,
+                                "relational": 15,
+                                "refusing": 10,
+                                "essential": 10,
+                                "created_at": "2024-10-27T12:34:56"
+                            }
+                        ]
+                    }
+                }
+            }
+        ),
+        204: openapi.Response(description="검사 결과 없음")
+    }
+)(views.handle_infertility_tests)
+
+
+swagger_auto_schema(
+    method='post',
+    operation_description="난임척도검사 결과 등록 API",
+    request_body=InfertilitySerializer,
+    responses={
+        201: openapi.Response(
+            description="난임척도검사 결과 등록 성공",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "id": 1,
+                        "member_id": 5,
+                        "total": 70,
+                        "social": 20,
+                        "sexual": 15,
+                        "relational": 15,
+                        "refusing": 10,
+                        "essential": 10,
+                        "created_at": "2024-10-27T12:34:56"
+                    }
+                }
+            }
+        ),
+        400: openapi.Response(description="유효성 검사 실패")
+    }
+)(views.handle_infertility_tests)
+
+
+swagger_auto_schema(
+    method='get',
+    operation_description="난임척도검사 기록 상세 조회 API",
+    manual_parameters=[
+        openapi.Parameter(
+            'test_pk',
+            openapi.IN_PATH,
+            description="상세 정보를 조회할 검사 기록의 ID",
+            type=openapi.TYPE_INTEGER,
+            required=True
+        ),
+        openapi.Parameter(
+            'history',
+            openapi.IN_QUERY,
+            description="함께 조회할 이전 검사 수 (최대 50, 각 검사에 직전 검사 대비 점수 변화 포함)",
+            type=openapi.TYPE_INTEGER
+        )
+    ],
+    responses={
+        200: openapi.Response(
+            description="난임척도검사 상세 조회 성공 (before_test: 같은 회원의 바로 이전 검사, delta: 이전 검사 대비 점수 변화)",
+            examples={
+                "application/json": {
+                    "success": True,
+                    "result": {
+                        "current_test": {
+                            "id": 2,
+                            "member_id": 5,
+                            "total": 70,
+                            "social": 20,
+                            "sexual": 15,
+                            "relational": 15,
+                            "refusing": 10,
+                            "essential": 10,
+                            "belifs": "괜찮아",
+                            "created_at": "2024-10-27T12:34:56"
+                        },
+                        "before_test": {
+                            "id": 1,
+                            "member_id": 5,
+                            "total": 80,
+                            "social": 25,
+                            "sexual": 15,
+                            "relational": 20,
+                            "refusing": 10,
+                            "essential": 10,
+                            "belifs": "괜찮아",
+                            "created_at": "2024-10-20T12:34:56"
+                        },
+                        "delta": {
+                            "total": -10, "social": -5, "sexual": 0,
+                            "relational": -5, "refusing": 0, "essential": 0
+                        }
+                    }
+                }
+            }
+        ),
+        404: openapi.Response(
+            description="해당 검사 기록이 존재하지 않음",
+            examples={
+                "application/json": {
+                    "error": "해당 검사 기록이 존재하지 않습니다."
+                }
+            }
+        )
+    }
+)(views.inferlitily_detail)
@@ -1,3 +1,76 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from hahahoho.testutils import QueryPlanAssertionsMixin, create_members
+from .models import Infertility
+
+MEMBER_COUNT = 200
+ROWS_PER_MEMBER = 50
+
+
+class InfertilityQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.members = create_members(MEMBER_COUNT)
+        Infertility.objects.bulk_create([
+            Infertility(
+                member_id=member, total=70, social=20, sexual=15,
+                relational=15, refusing=10, essential=10
+            )
+            for member in cls.members for _ in range(ROWS_PER_MEMBER)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.member = self.members[0]
+        self.analyze_tables('infertilitytests_infertility')
+
+    def test_handle_infertility_tests_uses_member_index(self):
+        response, queries = self.capture_queries(
+            self.client.get, '/infertility/tests/', {'memberId': self.member.id}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assert_indexed_plans(queries, 'infertilitytests_infertility')
+
+
+class InfertilityDetailTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member, other = create_members(2)
+        cls.tests = [
+            Infertility.objects.create(
+                member_id=cls.member, total=total, social=total // 2, sexual=10,
+                relational=10, refusing=10, essential=10, belifs="괜찮아"
+            )
+            for total in (50, 60, 80, 70)
+        ]
+        # 다른 회원의 최신 검사는 이전 검사로 잡히지 않아야 함
+        Infertility.objects.create(
+            member_id=other, total=10, social=10, sexual=10, relational=10, refusing=10, essential=10
+        )
+
+    def detail(self, test, **params):
+        return self.client.get(f'/infertility/tests/{test.pk}/', params).json()
+
+    def test_returns_actual_predecessor_in_one_query(self):
+        # 버전(ETag) 확인 1번 + 상세 조회 1번
+        with self.assertNumQueries(2):
+            result = self.detail(self.tests[2], member_id=self.member.pk)['result']
+        self.assertEqual(result['current_test']['id'], self.tests[2].pk)
+        self.assertEqual(result['before_test']['id'], self.tests[1].pk)
+        self.assertEqual(result['delta']['total'], 20)
+        self.assertNotIn('history', result)
+
+        result = self.detail(self.tests[0])['result']
+        self.assertEqual(result['before_test'], [])
+        self.assertIsNone(result['delta']['total'])
+
+    def test_history_with_deltas(self):
+        with self.assertNumQueries(2):
+            result = self.detail(self.tests[3], history=5)['result']
+        self.assertEqual([test['id'] for test in result['history']], [test.pk for test in self.tests[2::-1]])
+        self.assertEqual([test['delta']['total'] for test in result['history']], [20, 10, None])
+        self.assertEqual(result['delta']['social'], -5)
+
+    def test_missing_test(self):
+        self.assertEqual(self.detail(Infertility(pk=0)), {"message": "테스트 정보가 없습니다."})